@@ -0,0 +1,28 @@
+"""discussion listing index
+
+Revision ID: 0a6e4b9f3c71
+Revises: f5b3d8c2a947
+Create Date: 2026-10-15 13:52:09.447615
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0a6e4b9f3c71'
+down_revision = 'f5b3d8c2a947'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_discussions_forum_pinned_created',
+        'discussions',
+        ['forum_id', 'is_pinned', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_discussions_forum_pinned_created', table_name='discussions')
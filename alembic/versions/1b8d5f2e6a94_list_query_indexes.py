@@ -0,0 +1,40 @@
+"""list query indexes
+
+Revision ID: 1b8d5f2e6a94
+Revises: 0a6e4b9f3c71
+Create Date: 2026-10-15 14:20:31.582904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1b8d5f2e6a94'
+down_revision = '0a6e4b9f3c71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_bookings_user_date', 'bookings', ['user_id', 'booking_date'])
+    op.create_index('ix_bookings_session_date', 'bookings', ['session_id', 'booking_date'])
+    op.create_index(
+        'ix_comments_discussion_parent_created',
+        'comments',
+        ['discussion_id', 'parent_id', 'created_at'],
+    )
+    op.create_index('ix_likes_comment_target', 'likes', ['comment_id', 'target_type'])
+    op.create_index('ix_likes_discussion_target', 'likes', ['discussion_id', 'target_type'])
+    op.create_index('ix_forum_memberships_forum_status', 'forum_memberships', ['forum_id', 'status'])
+    op.create_index('ix_goals_user_status_created', 'goals', ['user_id', 'status', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_goals_user_status_created', table_name='goals')
+    op.drop_index('ix_forum_memberships_forum_status', table_name='forum_memberships')
+    op.drop_index('ix_likes_discussion_target', table_name='likes')
+    op.drop_index('ix_likes_comment_target', table_name='likes')
+    op.drop_index('ix_comments_discussion_parent_created', table_name='comments')
+    op.drop_index('ix_bookings_session_date', table_name='bookings')
+    op.drop_index('ix_bookings_user_date', table_name='bookings')
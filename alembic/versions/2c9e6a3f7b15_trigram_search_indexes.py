@@ -0,0 +1,43 @@
+"""trigram search indexes
+
+Revision ID: 2c9e6a3f7b15
+Revises: 1b8d5f2e6a94
+Create Date: 2026-10-15 14:41:52.306178
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '2c9e6a3f7b15'
+down_revision = '1b8d5f2e6a94'
+branch_labels = None
+depends_on = None
+
+# (index, table, column) for columns still searched with ILIKE '%term%'
+TRIGRAM_INDEXES = [
+    ('ix_sessions_title_trgm', 'sessions', 'title'),
+    ('ix_sessions_description_trgm', 'sessions', 'description'),
+    ('ix_users_username_trgm', 'users', 'username'),
+    ('ix_users_first_name_trgm', 'users', 'first_name'),
+    ('ix_users_last_name_trgm', 'users', 'last_name'),
+]
+
+
+def upgrade() -> None:
+    # Trigram GIN indexes only exist on PostgreSQL; other backends keep ILIKE scans
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {table} USING gin ({column} gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, _, _ in TRIGRAM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,44 @@
+"""user history indexes
+
+Revision ID: 3d7f1a9c5e28
+Revises: 2c9e6a3f7b15
+Create Date: 2026-10-15 15:06:44.918253
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3d7f1a9c5e28'
+down_revision = '2c9e6a3f7b15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('meal_logs') as batch_op:
+        batch_op.alter_column(
+            'consumed_at',
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=sa.func.now(),
+        )
+
+    op.create_index('ix_meal_logs_user_consumed', 'meal_logs', ['user_id', 'consumed_at'])
+    op.create_index('ix_notifications_user_created', 'notifications', ['user_id', 'created_at'])
+    op.create_index('ix_forum_memberships_forum_joined', 'forum_memberships', ['forum_id', 'join_date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_forum_memberships_forum_joined', table_name='forum_memberships')
+    op.drop_index('ix_notifications_user_created', table_name='notifications')
+    op.drop_index('ix_meal_logs_user_consumed', table_name='meal_logs')
+
+    with op.batch_alter_table('meal_logs') as batch_op:
+        batch_op.alter_column(
+            'consumed_at',
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=None,
+        )
@@ -0,0 +1,30 @@
+"""unread notifications index
+
+Revision ID: 4e2a8c6d1f39
+Revises: 3d7f1a9c5e28
+Create Date: 2026-10-15 15:31:17.640392
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4e2a8c6d1f39'
+down_revision = '3d7f1a9c5e28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_notifications_user_unread',
+        'notifications',
+        ['user_id'],
+        postgresql_where=sa.text('is_read = false'),
+        sqlite_where=sa.text('is_read = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_user_unread', table_name='notifications')
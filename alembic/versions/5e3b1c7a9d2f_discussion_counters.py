@@ -0,0 +1,39 @@
+"""discussion counters
+
+Revision ID: 5e3b1c7a9d2f
+Revises: 8c1a2d1d7aa1
+Create Date: 2026-10-15 09:12:41.208114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e3b1c7a9d2f'
+down_revision = '8c1a2d1d7aa1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('discussions') as batch_op:
+        batch_op.add_column(sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill the counters from existing rows
+    op.execute(
+        "UPDATE discussions SET comment_count = "
+        "(SELECT COUNT(*) FROM comments WHERE comments.discussion_id = discussions.id)"
+    )
+    op.execute(
+        "UPDATE discussions SET like_count = "
+        "(SELECT COUNT(*) FROM likes WHERE likes.discussion_id = discussions.id "
+        "AND likes.target_type = 'DISCUSSION')"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('discussions') as batch_op:
+        batch_op.drop_column('like_count')
+        batch_op.drop_column('comment_count')
@@ -0,0 +1,40 @@
+"""program trigram indexes
+
+Revision ID: 5f9b3d7e2a46
+Revises: 4e2a8c6d1f39
+Create Date: 2026-10-15 15:44:09.271835
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f9b3d7e2a46'
+down_revision = '4e2a8c6d1f39'
+branch_labels = None
+depends_on = None
+
+# (index, table, column) for program columns searched with ILIKE '%term%'
+TRIGRAM_INDEXES = [
+    ('ix_programs_name_trgm', 'programs', 'name'),
+    ('ix_programs_description_trgm', 'programs', 'description'),
+]
+
+
+def upgrade() -> None:
+    # Trigram GIN indexes only exist on PostgreSQL; other backends keep ILIKE scans
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.execute(f"CREATE INDEX {name} ON {table} USING gin ({column} gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, _, _ in TRIGRAM_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,40 @@
+"""unread notifications recent index
+
+Revision ID: 6a4c0e8b3d57
+Revises: 5f9b3d7e2a46
+Create Date: 2026-10-15 16:12:38.504716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6a4c0e8b3d57'
+down_revision = '5f9b3d7e2a46'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The (user_id, created_at) index covers everything the user_id-only one served
+    op.drop_index('ix_notifications_user_unread', table_name='notifications')
+    op.create_index(
+        'ix_notifications_user_unread_recent',
+        'notifications',
+        ['user_id', 'created_at'],
+        postgresql_include=['type'],
+        postgresql_where=sa.text('is_read = false'),
+        sqlite_where=sa.text('is_read = false'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_user_unread_recent', table_name='notifications')
+    op.create_index(
+        'ix_notifications_user_unread',
+        'notifications',
+        ['user_id'],
+        postgresql_where=sa.text('is_read = false'),
+        sqlite_where=sa.text('is_read = false'),
+    )
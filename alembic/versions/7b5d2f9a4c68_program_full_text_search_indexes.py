@@ -0,0 +1,42 @@
+"""program full text search indexes
+
+Revision ID: 7b5d2f9a4c68
+Revises: 6a4c0e8b3d57
+Create Date: 2026-10-15 16:34:52.119063
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7b5d2f9a4c68'
+down_revision = '6a4c0e8b3d57'
+branch_labels = None
+depends_on = None
+
+# (index, table, columns) - expressions must match app/repositories/search.py
+SEARCH_INDEXES = [
+    ('ix_programs_search', 'programs', ['name', 'description']),
+    ('ix_users_search', 'users', ['username', 'first_name', 'last_name']),
+]
+
+
+def upgrade() -> None:
+    # Full-text GIN indexes only exist on PostgreSQL; other backends keep ILIKE scans
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, table, columns in SEARCH_INDEXES:
+        document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        op.execute(
+            f"CREATE INDEX {name} ON {table} USING gin (to_tsvector('english', {document}))"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, _, _ in SEARCH_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
@@ -0,0 +1,24 @@
+"""review program rating index
+
+Revision ID: 8c6e3a0b5d79
+Revises: 7b5d2f9a4c68
+Create Date: 2026-10-15 16:58:21.337540
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8c6e3a0b5d79'
+down_revision = '7b5d2f9a4c68'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_reviews_program_rating', 'reviews', ['program_id', 'rating'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reviews_program_rating', table_name='reviews')
@@ -0,0 +1,36 @@
+"""program session review list indexes
+
+Revision ID: 9d7f4b1c6e80
+Revises: 8c6e3a0b5d79
+Create Date: 2026-10-15 17:21:09.482113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9d7f4b1c6e80'
+down_revision = '8c6e3a0b5d79'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_programs_active_created',
+        'programs',
+        ['created_at'],
+        postgresql_where=sa.text('is_active = true'),
+        sqlite_where=sa.text('is_active = 1'),
+    )
+    op.create_index('ix_sessions_program_start', 'sessions', ['program_id', 'start_time'])
+    op.create_index('ix_sessions_trainer_start', 'sessions', ['trainer_id', 'start_time'])
+    op.create_index('ix_reviews_program_created', 'reviews', ['program_id', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reviews_program_created', table_name='reviews')
+    op.drop_index('ix_sessions_trainer_start', table_name='sessions')
+    op.drop_index('ix_sessions_program_start', table_name='sessions')
+    op.drop_index('ix_programs_active_created', table_name='programs')
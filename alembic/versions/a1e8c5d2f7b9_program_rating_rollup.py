@@ -0,0 +1,35 @@
+"""program rating rollup
+
+Revision ID: a1e8c5d2f7b9
+Revises: 9d7f4b1c6e80
+Create Date: 2026-10-15 17:38:52.910264
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1e8c5d2f7b9'
+down_revision = '9d7f4b1c6e80'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('programs') as batch_op:
+        batch_op.add_column(sa.Column('rating_sum', sa.Float(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill the rollup from existing reviews
+    op.execute(
+        "UPDATE programs SET "
+        "rating_sum = (SELECT COALESCE(SUM(rating), 0) FROM reviews WHERE reviews.program_id = programs.id), "
+        "rating_count = (SELECT COUNT(*) FROM reviews WHERE reviews.program_id = programs.id)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('programs') as batch_op:
+        batch_op.drop_column('rating_count')
+        batch_op.drop_column('rating_sum')
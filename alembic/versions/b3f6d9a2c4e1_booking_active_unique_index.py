@@ -0,0 +1,43 @@
+"""booking active unique index
+
+Revision ID: b3f6d9a2c4e1
+Revises: a1e8c5d2f7b9
+Create Date: 2026-10-15 19:02:37.915406
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3f6d9a2c4e1'
+down_revision = 'a1e8c5d2f7b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Cancel all but the earliest live booking per user and session so the unique index can be built
+    op.execute(
+        """
+        UPDATE bookings SET status = 'CANCELLED'
+        WHERE status != 'CANCELLED'
+          AND id NOT IN (
+              SELECT MIN(id) FROM bookings
+              WHERE status != 'CANCELLED'
+              GROUP BY user_id, session_id
+          )
+        """
+    )
+    op.create_index(
+        'uq_booking_user_session_active',
+        'bookings',
+        ['user_id', 'session_id'],
+        unique=True,
+        postgresql_where=sa.text("status != 'CANCELLED'"),
+        sqlite_where=sa.text("status != 'CANCELLED'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_booking_user_session_active', table_name='bookings')
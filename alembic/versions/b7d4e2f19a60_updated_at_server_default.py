@@ -0,0 +1,44 @@
+"""updated_at server default
+
+Revision ID: b7d4e2f19a60
+Revises: 5e3b1c7a9d2f
+Create Date: 2026-10-15 10:03:17.542906
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d4e2f19a60'
+down_revision = '5e3b1c7a9d2f'
+branch_labels = None
+depends_on = None
+
+TABLES = [
+    'achievements', 'bookings', 'comments', 'discussions', 'forums',
+    'forum_memberships', 'goals', 'meal_logs', 'programs', 'progress',
+    'reviews', 'sessions', 'users',
+]
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'updated_at',
+                existing_type=sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+            )
+        # Rows that were never updated get their creation time
+        op.execute(f"UPDATE {table} SET updated_at = created_at WHERE updated_at IS NULL")
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                'updated_at',
+                existing_type=sa.DateTime(timezone=True),
+                server_default=None,
+            )
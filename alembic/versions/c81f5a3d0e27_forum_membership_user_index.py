@@ -0,0 +1,28 @@
+"""forum membership user index
+
+Revision ID: c81f5a3d0e27
+Revises: b7d4e2f19a60
+Create Date: 2026-10-15 11:26:52.310478
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c81f5a3d0e27'
+down_revision = 'b7d4e2f19a60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_forum_memberships_user_status_forum',
+        'forum_memberships',
+        ['user_id', 'status', 'forum_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_forum_memberships_user_status_forum', table_name='forum_memberships')
@@ -0,0 +1,43 @@
+"""full text search indexes
+
+Revision ID: d4a9c6e8b152
+Revises: c81f5a3d0e27
+Create Date: 2026-10-15 11:58:04.716233
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a9c6e8b152'
+down_revision = 'c81f5a3d0e27'
+branch_labels = None
+depends_on = None
+
+# (index, table, columns) - expressions must match app/repositories/search.py
+SEARCH_INDEXES = [
+    ('ix_forums_search', 'forums', ['name', 'description']),
+    ('ix_discussions_search', 'discussions', ['title', 'content']),
+    ('ix_goals_search', 'goals', ['title', 'description']),
+]
+
+
+def upgrade() -> None:
+    # Full-text GIN indexes only exist on PostgreSQL; other backends keep ILIKE scans
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, table, columns in SEARCH_INDEXES:
+        document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        op.execute(
+            f"CREATE INDEX {name} ON {table} USING gin (to_tsvector('english', {document}))"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, _, _ in SEARCH_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
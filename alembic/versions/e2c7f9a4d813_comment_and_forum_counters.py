@@ -0,0 +1,56 @@
+"""comment and forum counters
+
+Revision ID: e2c7f9a4d813
+Revises: d4a9c6e8b152
+Create Date: 2026-10-15 12:40:33.902517
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2c7f9a4d813'
+down_revision = 'd4a9c6e8b152'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('comments') as batch_op:
+        batch_op.add_column(sa.Column('like_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('reply_count', sa.Integer(), server_default='0', nullable=False))
+
+    with op.batch_alter_table('forums') as batch_op:
+        batch_op.add_column(sa.Column('member_count', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('discussion_count', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill the counters from existing rows
+    op.execute(
+        "UPDATE comments SET like_count = "
+        "(SELECT COUNT(*) FROM likes WHERE likes.comment_id = comments.id "
+        "AND likes.target_type = 'COMMENT')"
+    )
+    op.execute(
+        "UPDATE comments SET reply_count = "
+        "(SELECT COUNT(*) FROM comments AS replies WHERE replies.parent_id = comments.id)"
+    )
+    op.execute(
+        "UPDATE forums SET member_count = "
+        "(SELECT COUNT(*) FROM forum_memberships WHERE forum_memberships.forum_id = forums.id "
+        "AND forum_memberships.status = 'ACTIVE')"
+    )
+    op.execute(
+        "UPDATE forums SET discussion_count = "
+        "(SELECT COUNT(*) FROM discussions WHERE discussions.forum_id = forums.id)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('forums') as batch_op:
+        batch_op.drop_column('discussion_count')
+        batch_op.drop_column('member_count')
+
+    with op.batch_alter_table('comments') as batch_op:
+        batch_op.drop_column('reply_count')
+        batch_op.drop_column('like_count')
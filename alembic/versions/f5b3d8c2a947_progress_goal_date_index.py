@@ -0,0 +1,24 @@
+"""progress goal date index
+
+Revision ID: f5b3d8c2a947
+Revises: e2c7f9a4d813
+Create Date: 2026-10-15 13:17:45.128390
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5b3d8c2a947'
+down_revision = 'e2c7f9a4d813'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_progress_goal_date', 'progress', ['goal_id', 'date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_progress_goal_date', table_name='progress')
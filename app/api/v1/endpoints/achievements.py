@@ -1,7 +1,7 @@
 # app/api/v1/endpoints/achievements.py
 
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session as DbSession
 
 from app.core.database import get_db
@@ -36,21 +36,21 @@ def get_achievement(
     db: DbSession = Depends(get_db),
 ):
     """Get details of a specific achievement."""
-    achievement = AchievementService.get_achievement(db, achievement_id)
+    result = AchievementService.get_achievement_with_details(db, achievement_id)
     
     # Check if achievement belongs to user
-    if achievement.user_id != current_user.id:
+    if result["user_id"] != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have permission to view this achievement",
         )
     
-    result = AchievementService.get_achievement_with_details(db, achievement_id)
     return result
 
 @router.post("", response_model=AchievementResponse, status_code=status.HTTP_201_CREATED)
 def create_achievement(
     achievement_data: AchievementCreateRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_admin_user),  # Only admins can create system achievements
     db: DbSession = Depends(get_db),
 ):
@@ -61,7 +61,8 @@ def create_achievement(
         title=achievement_data.title,
         description=achievement_data.description,
         badge_url=achievement_data.badge_url,
-        is_system=True
+        is_system=True,
+        background_tasks=background_tasks
     )
     
     return achievement
\ No newline at end of file
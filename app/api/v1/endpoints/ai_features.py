@@ -1,5 +1,6 @@
 from typing import Dict, Any, List
 from fastapi import APIRouter, Depends, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
@@ -13,13 +14,13 @@ from app.services.ai_service import AIService
 router = APIRouter(prefix="/ai", tags=["AI Features"])
 
 @router.post("/chat", response_model=Dict[str, Any])
-def chat_with_ai(
+async def chat_with_ai(
    request: ChatMessageRequest,
    current_user: User = Depends(get_current_user),
    db: Session = Depends(get_db),
 ):
    """Chat with the AI assistant."""
-   response = ChatbotService.send_message(
+   response = await ChatbotService.send_message(
        db, 
        request.message, 
        current_user.id
@@ -65,4 +66,24 @@ def generate_workout_plan(
 ):
    """Generate a personalized workout plan based on user input."""
    workout_plan = AIService.get_workout_recommendation(request.user_input)
-   return workout_plan
\ No newline at end of file
+   return workout_plan
+
+@router.post("/diet-plan/stream")
+def stream_diet_plan(
+   request: DietPlanRequest,
+   current_user: User = Depends(get_current_user),
+):
+   """Stream a personalized diet plan as it is generated."""
+   # Opened before the response starts, so setup and upstream failures get a proper error status
+   chunks = AIService.stream_diet_plan(request.user_input)
+   return StreamingResponse(chunks, media_type="text/plain")
+
+@router.post("/workout-plan/stream")
+def stream_workout_plan(
+   request: WorkoutPlanRequest,
+   current_user: User = Depends(get_current_user),
+):
+   """Stream a personalized workout plan as it is generated."""
+   # Opened before the response starts, so setup and upstream failures get a proper error status
+   chunks = AIService.stream_workout_recommendation(request.user_input)
+   return StreamingResponse(chunks, media_type="text/plain")
\ No newline at end of file
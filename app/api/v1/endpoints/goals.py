@@ -1,6 +1,6 @@
 # app/api/v1/endpoints/goals.py
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session as DbSession
 from datetime import datetime
 
@@ -114,11 +114,12 @@ def get_goal(
 def update_goal(
     goal_id: int,
     goal_data: GoalUpdateRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: DbSession = Depends(get_db),
 ):
     """Update a goal."""
-    goal = GoalService.update_goal(db, goal_id, goal_data, current_user)
+    goal = GoalService.update_goal(db, goal_id, goal_data, current_user, background_tasks)
     return goal
 
 @router.delete("/{goal_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -7,7 +7,7 @@ from app.core.database import get_db
 from app.core.security import get_current_user
 from app.models.user import User
 from app.models.meal_log import MealType
-from app.dto.request.meal_dto import MealLogCreateRequest, MealLogUpdateRequest
+from app.dto.request.meal_dto import MealLogCreateRequest, MealLogUpdateRequest, MealAnalysisBatchRequest
 from app.dto.response.meal_dto import MealLogResponse, MealLogListResponse, NutritionAnalysisResponse
 from app.services.meal_service import MealService
 from app.services.ai_service import AIService
@@ -80,17 +80,8 @@ def delete_meal(
     MealService.delete_meal_log(db, meal_id, current_user)
     return None
 
-@router.post("/analyze", response_model=NutritionAnalysisResponse)
-def analyze_meal(
-    meal_data: Dict[str, str],
-    current_user: User = Depends(get_current_user),
-):
-    """Analyze a meal without saving it."""
-    nutrition = AIService.analyze_meal_nutrition(
-        meal_name=meal_data.get("name", ""),
-        meal_description=meal_data.get("description", "")
-    )
-    
+def _nutrition_response(meal_name: str, nutrition: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an AI nutrition analysis into the analysis response."""
     # Ensure analysis_details is a dictionary
     analysis_details = nutrition.get("analysis_details", {})
     if not isinstance(analysis_details, dict):
@@ -98,7 +89,7 @@ def analyze_meal(
     
     # Format the response
     return {
-        "meal_name": meal_data.get("name", ""),
+        "meal_name": meal_name,
         "calories": nutrition.get("calories", 0),
         "protein": nutrition.get("protein", 0.0),
         "carbs": nutrition.get("carbs", 0.0),
@@ -106,6 +97,35 @@ def analyze_meal(
         "analysis_details": analysis_details
     }
 
+@router.post("/analyze", response_model=NutritionAnalysisResponse)
+def analyze_meal(
+    meal_data: Dict[str, str],
+    current_user: User = Depends(get_current_user),
+):
+    """Analyze a meal without saving it."""
+    nutrition = AIService.analyze_meal_nutrition(
+        meal_name=meal_data.get("name", ""),
+        meal_description=meal_data.get("description", "")
+    )
+    
+    return _nutrition_response(meal_data.get("name", ""), nutrition)
+
+@router.post("/analyze/batch", response_model=List[NutritionAnalysisResponse])
+async def analyze_meals(
+    meals: MealAnalysisBatchRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """Analyze several meals at once without saving them."""
+    # The LLM calls run concurrently, so the batch takes about as long as its slowest meal
+    nutritions = await AIService.analyze_meals(
+        [(meal.name, meal.description) for meal in meals]
+    )
+    
+    return [
+        _nutrition_response(meal.name, nutrition)
+        for meal, nutrition in zip(meals, nutritions)
+    ]
+
 @router.get("/daily/{date}", response_model=Dict[str, Any])
 def get_daily_nutrition(
     date: date,
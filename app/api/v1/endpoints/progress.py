@@ -1,6 +1,6 @@
 # app/api/v1/endpoints/progress.py
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session as DbSession
 from datetime import datetime
 
@@ -18,6 +18,7 @@ router = APIRouter(tags=["Progress"])
 def create_progress(
     goal_id: int,
     progress_data: ProgressCreateRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: DbSession = Depends(get_db),
 ):
@@ -33,7 +34,7 @@ def create_progress(
     
     # Check for streak achievements
     from app.services.achievement_service import AchievementService
-    AchievementService.check_progress_streak_achievements(db, current_user.id, goal_id)
+    AchievementService.check_progress_streak_achievements(db, current_user.id, goal_id, background_tasks)
     
     return progress
 
@@ -1,4 +1,5 @@
 import os
+from typing import Optional
 from pydantic import BaseSettings
 from datetime import timedelta
 from dotenv import load_dotenv
@@ -15,6 +16,22 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str = "sqlite:///./connectfit.db"
     
+    # Compiled SQL statements kept by the engine (SQLAlchemy default is 500)
+    DB_QUERY_CACHE_SIZE: int = 1200
+    
+    # Connection pool (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 300
+    
+    # Development aid: log every lazy relationship load so N+1 query patterns show up
+    DB_LOG_LAZY_LOADS: bool = False
+    
+    # Worker threads available to sync endpoints (each holds one while waiting on the DB or LLM).
+    # Unset, it matches DB_POOL_SIZE + DB_MAX_OVERFLOW so every thread can check out a connection;
+    # more threads than connections just queue on the pool and time out after 30 seconds
+    THREADPOOL_SIZE: Optional[int] = None
+    
     # JWT Settings
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-for-jwt-token-generation")
     ALGORITHM: str = "HS256"
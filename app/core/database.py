@@ -1,17 +1,50 @@
-from sqlalchemy import create_engine
+import logging
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
 
 # Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL, connect_args={"check_same_thread": False}
-)
+if settings.DATABASE_URL.startswith("sqlite"):
+    # File databases get the same pool size as server ones, which the worker thread limit is sized to;
+    # in-memory databases use a single-connection pool that takes no sizing
+    in_memory = make_url(settings.DATABASE_URL).database in (None, "", ":memory:")
+    pool_args = {} if in_memory else {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+    engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        **pool_args,
+    )
+else:
+    # Keep warm connections across requests; pre-ping and recycle drop ones closed by the server or a pooler
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    )
 
 # Create sessionmaker
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+if settings.DB_LOG_LAZY_LOADS:
+    lazy_load_logger = logging.getLogger("app.lazy_loads")
+
+    @event.listens_for(SessionLocal, "do_orm_execute")
+    def _log_lazy_load(orm_execute_state):
+        """Warn when a relationship is lazy loaded, naming the relationship."""
+        if orm_execute_state.lazy_loaded_from is not None:
+            relationship = orm_execute_state.loader_strategy_path.natural_path[-1]
+            lazy_load_logger.warning("Lazy load of %s", relationship)
+
 # Dependency to get db session
 def get_db():
     db = SessionLocal()
@@ -26,6 +26,10 @@ def get_password_hash(password: str) -> str:
     """Generate a hashed password."""
     return pwd_context.hash(password)
 
+def warm_password_hashing() -> None:
+    """Hash once so the bcrypt backend is loaded before the first login rather than during it."""
+    pwd_context.hash("warmup")
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
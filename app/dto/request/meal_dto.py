@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, conlist
 from typing import Optional
 from datetime import datetime
 from app.models.meal_log import MealType
@@ -17,4 +17,11 @@ class MealLogUpdateRequest(BaseModel):
     calories: Optional[int] = None
     protein: Optional[float] = None
     carbs: Optional[float] = None
-    fat: Optional[float] = None
\ No newline at end of file
+    fat: Optional[float] = None
+
+class MealAnalysisRequest(BaseModel):
+    name: str = Field("", max_length=100)
+    description: Optional[str] = None
+
+# Each meal is a paid LLM call, so a batch is capped
+MealAnalysisBatchRequest = conlist(MealAnalysisRequest, min_items=1, max_items=20)
\ No newline at end of file
@@ -13,6 +13,7 @@ class CommentResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
     like_count: Optional[int] = 0
+    reply_count: Optional[int] = 0
     is_liked_by_user: Optional[bool] = False
 
     class Config:
@@ -43,6 +43,7 @@
 #     return {"message": f"Welcome to {settings.APP_NAME} API. Visit /docs for documentation."}
 
 import logging
+import anyio
 from dotenv import load_dotenv
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
@@ -54,6 +55,7 @@ from app.models.base import Base
 from app.core.database import engine, get_db
 from app.core.init_db import init_db
 from app.core.scheduled_tasks import setup_scheduled_tasks
+from app.core.security import warm_password_hashing
 
 # In app/main.py or somewhere central
 from datetime import datetime, timezone
@@ -108,8 +110,19 @@ def startup_event():
     # Set up scheduled tasks
     scheduler = setup_scheduled_tasks()
     
+    # Load the password hashing backend up front
+    warm_password_hashing()
+    
     logger.info("Application startup complete")
 
+@app.on_event("startup")
+async def configure_threadpool():
+    # Sync endpoints run in AnyIO's worker pool; raise its limit so blocking
+    # DB and LLM calls don't queue behind the default 40 threads
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.THREADPOOL_SIZE or settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    )
+
 @app.on_event("shutdown")
 def shutdown_event():
     global scheduler
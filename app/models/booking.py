@@ -1,5 +1,5 @@
 # File path: app/models/booking.py
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -12,6 +12,20 @@ class BookingStatus(str, enum.Enum):
 
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Serve the per-user and per-session booking lists in booking_date order
+        Index("ix_bookings_user_date", "user_id", "booking_date"),
+        Index("ix_bookings_session_date", "session_id", "booking_date"),
+        # A user holds at most one live booking per session; cancelled ones don't count
+        Index(
+            "uq_booking_user_session_active",
+            "user_id",
+            "session_id",
+            unique=True,
+            postgresql_where=text("status != 'CANCELLED'"),
+            sqlite_where=text("status != 'CANCELLED'"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -21,7 +35,7 @@ class Booking(Base):
     # Remove payment_id foreign key temporarily
     attended = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     user = relationship("User", back_populates="bookings")
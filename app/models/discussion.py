@@ -1,11 +1,15 @@
 # File path: app/models/discussion.py
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.models.base import Base
 
 class Discussion(Base):
     __tablename__ = "discussions"
+    __table_args__ = (
+        # Serves the default forum listing: pinned first, newest first
+        Index("ix_discussions_forum_pinned_created", "forum_id", "is_pinned", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     forum_id = Column(Integer, ForeignKey("forums.id"), nullable=False)
@@ -14,8 +18,10 @@ class Discussion(Base):
     content = Column(Text, nullable=False)
     is_pinned = Column(Boolean, default=False, nullable=False)
     is_locked = Column(Boolean, default=False, nullable=False)
+    comment_count = Column(Integer, nullable=False, default=0, server_default="0")
+    like_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     forum = relationship("Forum", back_populates="discussions")
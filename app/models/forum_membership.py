@@ -1,5 +1,5 @@
 # File path: app/models/forum_membership.py
-from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -15,6 +15,14 @@ class MembershipRole(str, enum.Enum):
 
 class ForumMembership(Base):
     __tablename__ = "forum_memberships"
+    __table_args__ = (
+        # Covers the membership -> forum join for a user's active forums
+        Index("ix_forum_memberships_user_status_forum", "user_id", "status", "forum_id"),
+        # Serves a forum's member and moderator lookups filtered by status
+        Index("ix_forum_memberships_forum_status", "forum_id", "status"),
+        # Serves a forum's member list in join order
+        Index("ix_forum_memberships_forum_joined", "forum_id", "join_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     forum_id = Column(Integer, ForeignKey("forums.id"), nullable=False)
@@ -23,7 +31,7 @@ class ForumMembership(Base):
     status = Column(Enum(MembershipStatus), default=MembershipStatus.ACTIVE, nullable=False)
     role = Column(Enum(MembershipRole), default=MembershipRole.MEMBER, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     forum = relationship("Forum", back_populates="memberships")
@@ -1,5 +1,5 @@
 # app/models/goal.py
-from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey, Text, Float, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, Enum, ForeignKey, Text, Float, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -21,6 +21,10 @@ class GoalType(str, enum.Enum):
 
 class Goal(Base):
     __tablename__ = "goals"
+    __table_args__ = (
+        # Serves a user's goal list filtered by status, newest first
+        Index("ix_goals_user_status_created", "user_id", "status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -33,9 +37,12 @@ class Goal(Base):
     status = Column(Enum(GoalStatus), default=GoalStatus.IN_PROGRESS, nullable=False)
     is_public = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     user = relationship("User", back_populates="goals")
-    progress_entries = relationship("Progress", back_populates="goal", cascade="all, delete-orphan")
+    # Loaded in date order so the (goal_id, date) index serves the sort
+    progress_entries = relationship(
+        "Progress", back_populates="goal", cascade="all, delete-orphan", order_by="Progress.date"
+    )
     achievements = relationship("Achievement", back_populates="goal")
\ No newline at end of file
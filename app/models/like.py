@@ -1,5 +1,5 @@
 # File path: app/models/like.py
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -11,6 +11,11 @@ class LikeTargetType(str, enum.Enum):
 
 class Like(Base):
     __tablename__ = "likes"
+    __table_args__ = (
+        # Serve like lookups for a single comment or discussion
+        Index("ix_likes_comment_target", "comment_id", "target_type"),
+        Index("ix_likes_discussion_target", "discussion_id", "target_type"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
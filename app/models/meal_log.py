@@ -1,5 +1,5 @@
 # app/models/meal_log.py
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Float, Enum
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Float, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -13,19 +13,23 @@ class MealType(str, enum.Enum):
 
 class MealLog(Base):
     __tablename__ = "meal_logs"
+    __table_args__ = (
+        # Serves a user's meal history and daily ranges in consumed_at order
+        Index("ix_meal_logs_user_consumed", "user_id", "consumed_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     meal_type = Column(Enum(MealType), nullable=False)
     name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
-    consumed_at = Column(DateTime(timezone=True), nullable=False)
+    consumed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     calories = Column(Integer, nullable=True)
     protein = Column(Float, nullable=True)
     carbs = Column(Float, nullable=True)
     fat = Column(Float, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     user = relationship("User", back_populates="meal_logs")
\ No newline at end of file
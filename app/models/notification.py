@@ -1,6 +1,6 @@
 # File path: app/models/notification.py
 
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Enum, Boolean
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Text, Enum, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -16,6 +16,20 @@ class NotificationType(str, enum.Enum):
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Serves a user's notification list, newest first
+        Index("ix_notifications_user_created", "user_id", "created_at"),
+        # Partial index holding only unread rows, for unread lists, counts and mark-all-as-read;
+        # INCLUDE lets Postgres answer unread listings by type from the index alone
+        Index(
+            "ix_notifications_user_unread_recent",
+            "user_id",
+            "created_at",
+            postgresql_include=["type"],
+            postgresql_where=text("is_read = false"),
+            sqlite_where=text("is_read = false"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -1,5 +1,6 @@
 # File path: app/models/program.py
-from sqlalchemy import Column, String, Integer, DateTime, Enum, Boolean, ForeignKey, Text
+from typing import Optional
+from sqlalchemy import Column, String, Integer, DateTime, Enum, Boolean, ForeignKey, Text, Float, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -8,6 +9,15 @@ from app.models.enums import DifficultyLevel
 
 class Program(Base):
     __tablename__ = "programs"
+    __table_args__ = (
+        # Partial index over active programs only, for the newest-first featured list
+        Index(
+            "ix_programs_active_created",
+            "created_at",
+            postgresql_where=text("is_active = true"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False, index=True)
@@ -18,10 +28,23 @@ class Program(Base):
     created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
     is_active = Column(Boolean, default=True, nullable=False)
     image_url = Column(String(255), nullable=True)
+    # Review rollup maintained by ReviewRepository, so ratings read from the row itself
+    rating_sum = Column(Float, nullable=False, default=0, server_default="0")
+    rating_count = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     creator = relationship("User", back_populates="programs")
     sessions = relationship("Session", back_populates="program", cascade="all, delete-orphan")
-    reviews = relationship("Review", back_populates="program")
\ No newline at end of file
+    reviews = relationship("Review", back_populates="program")
+
+    @property
+    def average_rating(self) -> Optional[float]:
+        """Mean review rating, or None before the first review."""
+        return self.rating_sum / self.rating_count if self.rating_count else None
+
+    @property
+    def total_reviews(self) -> int:
+        """Number of reviews left for the program."""
+        return self.rating_count or 0
\ No newline at end of file
@@ -1,11 +1,15 @@
 # app/models/progress.py
-from sqlalchemy import Column, Integer, DateTime, ForeignKey, Text, Float
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Text, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.models.base import Base
 
 class Progress(Base):
     __tablename__ = "progress"
+    __table_args__ = (
+        # Serves "latest progress for a goal" lookups
+        Index("ix_progress_goal_date", "goal_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     goal_id = Column(Integer, ForeignKey("goals.id"), nullable=False)
@@ -13,7 +17,7 @@ class Progress(Base):
     value = Column(Float, nullable=False)
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     goal = relationship("Goal", back_populates="progress_entries")
\ No newline at end of file
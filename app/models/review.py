@@ -1,11 +1,17 @@
 # File path: app/models/review.py
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Float, Text
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, Float, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.models.base import Base
 
 class Review(Base):
     __tablename__ = "reviews"
+    __table_args__ = (
+        # Lets per-program rating aggregates read only the index
+        Index("ix_reviews_program_rating", "program_id", "rating"),
+        # Serves a program's review list, newest first
+        Index("ix_reviews_program_created", "program_id", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -13,7 +19,7 @@ class Review(Base):
     rating = Column(Float, nullable=False)  # Rating from 1.0 to 5.0
     comment = Column(Text, nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     user = relationship("User", back_populates="reviews")
@@ -1,11 +1,16 @@
 # File path: app/models/session.py
-from sqlalchemy import Column, String, Integer, DateTime, Boolean, ForeignKey, Text, Float
+from sqlalchemy import Column, String, Integer, DateTime, Boolean, ForeignKey, Text, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.models.base import Base
 
 class Session(Base):
     __tablename__ = "sessions"
+    __table_args__ = (
+        # Serve program and trainer schedules in start order without a sort
+        Index("ix_sessions_program_start", "program_id", "start_time"),
+        Index("ix_sessions_trainer_start", "trainer_id", "start_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     program_id = Column(Integer, ForeignKey("programs.id"), nullable=False)
@@ -22,7 +27,7 @@ class Session(Base):
     meeting_link = Column(String(255), nullable=True)
     is_cancelled = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     program = relationship("Program", back_populates="sessions")
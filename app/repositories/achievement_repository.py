@@ -1,9 +1,20 @@
 # app/repositories/achievement_repository.py
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc
+from typing import List, Optional, Dict, Any, Set, Tuple
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import desc, asc, select
 from datetime import datetime
 from app.models.achievement import Achievement
+from app.repositories.pagination import fetch_page
+from app.repositories.bulk import insert_many
+
+# Column names that update() may assign, computed once at import
+_ACHIEVEMENT_COLUMNS = frozenset(Achievement.__table__.columns.keys()) - {"id", "created_at"}
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_ACHIEVEMENT_SORT_COLUMNS = {
+    "title": Achievement.title,
+    "achieved_date": Achievement.achieved_date,
+}
 
 class AchievementRepository:
     @staticmethod
@@ -12,19 +23,30 @@ class AchievementRepository:
         db_achievement = Achievement(**kwargs)
         db.add(db_achievement)
         db.commit()
-        db.refresh(db_achievement)
         return db_achievement
 
+    @staticmethod
+    def create_many(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert many achievements in one statement and commit once, returning their IDs in row order."""
+        ids = insert_many(db, Achievement, rows)
+        db.commit()
+        return ids
+
     @staticmethod
     def get_by_id(db: Session, achievement_id: int) -> Optional[Achievement]:
         """Get an achievement by ID."""
-        return db.query(Achievement).filter(Achievement.id == achievement_id).first()
+        return db.get(Achievement, achievement_id)
+
+    @staticmethod
+    def get_by_id_with_goal(db: Session, achievement_id: int) -> Optional[Achievement]:
+        """Get an achievement by ID with its goal loaded in the same query."""
+        return db.get(Achievement, achievement_id, options=[joinedload(Achievement.goal)])
 
     @staticmethod
     def update(db: Session, achievement: Achievement, **kwargs) -> Achievement:
         """Update an achievement's attributes."""
         for key, value in kwargs.items():
-            if hasattr(achievement, key) and value is not None:
+            if value is not None and key in _ACHIEVEMENT_COLUMNS:
                 setattr(achievement, key, value)
         
         db.commit()
@@ -34,13 +56,19 @@ class AchievementRepository:
     @staticmethod
     def delete(db: Session, achievement_id: int) -> bool:
         """Delete an achievement by ID."""
-        achievement = db.query(Achievement).filter(Achievement.id == achievement_id).first()
+        achievement = db.get(Achievement, achievement_id)
         if achievement:
             db.delete(achievement)
             db.commit()
             return True
         return False
 
+    @staticmethod
+    def _sorted(query, sort_by: str, sort_desc: bool):
+        """Apply the requested ordering to an achievement query."""
+        sort_column = _ACHIEVEMENT_SORT_COLUMNS.get(sort_by, Achievement.achieved_date)
+        return query.order_by(desc(sort_column) if sort_desc else asc(sort_column))
+
     @staticmethod
     def get_by_user_id(
         db: Session, 
@@ -52,16 +80,23 @@ class AchievementRepository:
     ) -> List[Achievement]:
         """Get achievements by user ID with sorting."""
         query = db.query(Achievement).filter(Achievement.user_id == user_id)
-        
-        # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Achievement, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Achievement, sort_by)))
-            
-        # Apply pagination
+        query = AchievementRepository._sorted(query, sort_by, sort_desc)
         return query.offset(skip).limit(limit).all()
 
+    @staticmethod
+    def get_page_by_user_id(
+        db: Session, 
+        user_id: int, 
+        skip: int = 0, 
+        limit: int = 100,
+        sort_by: str = "achieved_date",
+        sort_desc: bool = True
+    ) -> Tuple[List[Achievement], int]:
+        """Get a page of a user's achievements together with the total count."""
+        query = db.query(Achievement).filter(Achievement.user_id == user_id)
+        query = AchievementRepository._sorted(query, sort_by, sort_desc)
+        return fetch_page(query, skip, limit)
+
     @staticmethod
     def count_by_user_id(db: Session, user_id: int) -> int:
         """Count achievements by user ID."""
@@ -72,6 +107,11 @@ class AchievementRepository:
         """Get achievements related to a specific goal."""
         return db.query(Achievement).filter(Achievement.goal_id == goal_id).all()
 
+    @staticmethod
+    def get_titles_by_user_id(db: Session, user_id: int) -> Set[str]:
+        """Get the titles of every achievement a user already holds."""
+        return set(db.scalars(select(Achievement.title).where(Achievement.user_id == user_id)))
+
     @staticmethod
     def check_achievement_exists(
         db: Session, 
@@ -1,40 +1,90 @@
 # File path: app/repositories/booking_repository.py
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session as DbSession
-from sqlalchemy import desc, asc
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session as DbSession, joinedload
+from sqlalchemy import desc, asc, insert, update, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 from app.models.booking import Booking, BookingStatus
+from app.repositories.pagination import fetch_page, fetch_after
+
+# Column names that update() may assign, computed once at import
+_BOOKING_COLUMNS = frozenset(Booking.__table__.columns.keys()) - {"id", "created_at"}
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_BOOKING_SORT_COLUMNS = {
+    "booking_date": Booking.booking_date,
+    "created_at": Booking.created_at,
+    "status": Booking.status,
+}
+
+# Single-row INSERT built once; RETURNING the entity puts the new row in the identity map
+_INSERT_BOOKING = insert(Booking).returning(Booking)
+
+# Dialect INSERTs that support ON CONFLICT against the partial unique booking index
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
 
 class BookingRepository:
     @staticmethod
     def create(db: DbSession, **kwargs) -> Booking:
         """Create a new booking in the database."""
-        db_booking = Booking(**kwargs)
-        db.add(db_booking)
+        db_booking = db.scalars(_INSERT_BOOKING, [kwargs]).one()
         db.commit()
-        db.refresh(db_booking)
+        return db_booking
+
+    @staticmethod
+    def create_unless_booked(db: DbSession, **kwargs) -> Optional[Booking]:
+        """Create a booking unless the user already has a live one for the session, returning None if so.
+
+        Nothing is committed when the booking already exists, so the caller decides whether to roll back.
+        """
+        dialect_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if dialect_insert is None:
+            # No ON CONFLICT on this backend, so let the unique index reject the duplicate instead
+            try:
+                with db.begin_nested():
+                    db_booking = db.scalars(_INSERT_BOOKING, [kwargs]).one()
+            except IntegrityError:
+                return None
+            db.commit()
+            return db_booking
+
+        stmt = dialect_insert(Booking).on_conflict_do_nothing(
+            index_elements=[Booking.user_id, Booking.session_id],
+            index_where=text("status != 'CANCELLED'"),
+        ).returning(Booking)
+        db_booking = db.scalars(stmt, [kwargs]).one_or_none()
+        if db_booking:
+            db.commit()
         return db_booking
 
     @staticmethod
     def get_by_id(db: DbSession, booking_id: int) -> Optional[Booking]:
         """Get a booking by ID."""
-        return db.query(Booking).filter(Booking.id == booking_id).first()
+        return db.get(Booking, booking_id)
+
+    @staticmethod
+    def get_by_id_with_session(db: DbSession, booking_id: int) -> Optional[Booking]:
+        """Get a booking by ID with its session loaded in the same query."""
+        return db.get(Booking, booking_id, options=[joinedload(Booking.session)])
 
     @staticmethod
     def update(db: DbSession, booking: Booking, **kwargs) -> Booking:
         """Update a booking's attributes."""
         for key, value in kwargs.items():
-            if hasattr(booking, key) and value is not None:
+            if value is not None and key in _BOOKING_COLUMNS:
                 setattr(booking, key, value)
         
         db.commit()
-        db.refresh(booking)
         return booking
 
     @staticmethod
     def delete(db: DbSession, booking_id: int) -> bool:
         """Delete a booking by ID."""
-        booking = db.query(Booking).filter(Booking.id == booking_id).first()
+        booking = db.get(Booking, booking_id)
         if booking:
             db.delete(booking)
             db.commit()
@@ -43,26 +93,38 @@ class BookingRepository:
 
     @staticmethod
     def cancel(db: DbSession, booking_id: int) -> Optional[Booking]:
-        """Cancel a booking by ID."""
-        booking = db.query(Booking).filter(Booking.id == booking_id).first()
-        if booking:
-            booking.status = BookingStatus.CANCELLED
+        """Cancel a live booking by ID without committing, returning None if it was already cancelled."""
+        return db.scalars(
+            update(Booking)
+            .where(Booking.id == booking_id, Booking.status != BookingStatus.CANCELLED)
+            .values(status=BookingStatus.CANCELLED)
+            .returning(Booking)
+        ).one_or_none()
+
+    @staticmethod
+    def cancel_many(db: DbSession, booking_ids: List[int], chunk_size: int = 500) -> int:
+        """Cancel many bookings with one UPDATE per chunk, returning how many changed."""
+        cancelled = 0
+        for start in range(0, len(booking_ids), chunk_size):
+            chunk = booking_ids[start:start + chunk_size]
+            result = db.execute(
+                update(Booking)
+                .where(Booking.id.in_(chunk), Booking.status != BookingStatus.CANCELLED)
+                .values(status=BookingStatus.CANCELLED),
+                execution_options={"synchronize_session": False},
+            )
+            cancelled += result.rowcount
+            # Commit per chunk to keep transactions short
             db.commit()
-            db.refresh(booking)
-            return booking
-        return None
+        return cancelled
 
     @staticmethod
-    def get_by_user_id(
-        db: DbSession, 
-        user_id: int, 
-        skip: int = 0, 
-        limit: int = 100,
-        filters: Optional[Dict[str, Any]] = None,
-        sort_by: str = "booking_date",
-        sort_desc: bool = True
-    ) -> List[Booking]:
-        """Get bookings by user ID with filtering and sorting."""
+    def _user_bookings_query(
+        db: DbSession,
+        user_id: int,
+        filters: Optional[Dict[str, Any]] = None
+    ):
+        """Build the filtered query behind the user booking list and count."""
         query = db.query(Booking).filter(Booking.user_id == user_id)
         
         # Apply filters
@@ -82,42 +144,87 @@ class BookingRepository:
             if "attended" in filters:
                 query = query.filter(Booking.attended == filters["attended"])
         
-        # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Booking, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Booking, sort_by)))
-            
-        # Apply pagination
-        return query.offset(skip).limit(limit).all()
+        return query
 
     @staticmethod
-    def count_by_user_id(
-        db: DbSession, 
-        user_id: int,
+    def _session_bookings_query(
+        db: DbSession,
+        session_id: int,
         filters: Optional[Dict[str, Any]] = None
-    ) -> int:
-        """Count bookings by user ID with applied filters."""
-        query = db.query(Booking).filter(Booking.user_id == user_id)
+    ):
+        """Build the filtered query behind the session booking list and count."""
+        query = db.query(Booking).filter(Booking.session_id == session_id)
         
         # Apply filters
         if filters:
             if "status" in filters and filters["status"]:
                 query = query.filter(Booking.status == filters["status"])
                 
-            if "session_id" in filters and filters["session_id"]:
-                query = query.filter(Booking.session_id == filters["session_id"])
-                
-            if "start_date" in filters and filters["start_date"]:
-                query = query.filter(Booking.booking_date >= filters["start_date"])
-                
-            if "end_date" in filters and filters["end_date"]:
-                query = query.filter(Booking.booking_date <= filters["end_date"])
+            if "user_id" in filters and filters["user_id"]:
+                query = query.filter(Booking.user_id == filters["user_id"])
                 
             if "attended" in filters:
                 query = query.filter(Booking.attended == filters["attended"])
-                
-        return query.count()
+        
+        return query
+
+    @staticmethod
+    def _sorted(query, sort_by: str, sort_desc: bool):
+        """Apply the requested ordering to a booking query."""
+        if sort_desc:
+            return query.order_by(desc(_BOOKING_SORT_COLUMNS.get(sort_by, Booking.booking_date)))
+        return query.order_by(asc(_BOOKING_SORT_COLUMNS.get(sort_by, Booking.booking_date)))
+
+    @staticmethod
+    def get_by_user_id(
+        db: DbSession, 
+        user_id: int, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "booking_date",
+        sort_desc: bool = True
+    ) -> List[Booking]:
+        """Get bookings by user ID with filtering and sorting."""
+        query = BookingRepository._user_bookings_query(db, user_id, filters)
+        query = BookingRepository._sorted(query, sort_by, sort_desc)
+        return query.offset(skip).limit(limit).all()
+
+    @staticmethod
+    def count_by_user_id(
+        db: DbSession, 
+        user_id: int,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        """Count bookings by user ID with applied filters."""
+        return BookingRepository._user_bookings_query(db, user_id, filters).count()
+
+    @staticmethod
+    def get_page_by_user_id(
+        db: DbSession, 
+        user_id: int, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "booking_date",
+        sort_desc: bool = True
+    ) -> Tuple[List[Booking], int]:
+        """Get a page of a user's bookings together with the total count."""
+        query = BookingRepository._user_bookings_query(db, user_id, filters)
+        query = BookingRepository._sorted(query, sort_by, sort_desc)
+        return fetch_page(query, skip, limit)
+
+    @staticmethod
+    def list_after(
+        db: DbSession,
+        user_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Booking], Optional[Tuple[datetime, int]]]:
+        """Get a user's bookings created before a (created_at, id) cursor, with the next cursor."""
+        query = BookingRepository._user_bookings_query(db, user_id, filters)
+        return fetch_after(query, Booking.created_at, Booking.id, cursor, limit)
 
     @staticmethod
     def get_by_session_id(
@@ -128,19 +235,7 @@ class BookingRepository:
         filters: Optional[Dict[str, Any]] = None
     ) -> List[Booking]:
         """Get bookings by session ID with filtering."""
-        query = db.query(Booking).filter(Booking.session_id == session_id)
-        
-        # Apply filters
-        if filters:
-            if "status" in filters and filters["status"]:
-                query = query.filter(Booking.status == filters["status"])
-                
-            if "user_id" in filters and filters["user_id"]:
-                query = query.filter(Booking.user_id == filters["user_id"])
-                
-            if "attended" in filters:
-                query = query.filter(Booking.attended == filters["attended"])
-                
+        query = BookingRepository._session_bookings_query(db, session_id, filters)
         return query.order_by(asc(Booking.booking_date)).offset(skip).limit(limit).all()
 
     @staticmethod
@@ -150,17 +245,16 @@ class BookingRepository:
         filters: Optional[Dict[str, Any]] = None
     ) -> int:
         """Count bookings by session ID with applied filters."""
-        query = db.query(Booking).filter(Booking.session_id == session_id)
-        
-        # Apply filters
-        if filters:
-            if "status" in filters and filters["status"]:
-                query = query.filter(Booking.status == filters["status"])
-                
-            if "user_id" in filters and filters["user_id"]:
-                query = query.filter(Booking.user_id == filters["user_id"])
-                
-            if "attended" in filters:
-                query = query.filter(Booking.attended == filters["attended"])
-                
-        return query.count()
\ No newline at end of file
+        return BookingRepository._session_bookings_query(db, session_id, filters).count()
+
+    @staticmethod
+    def get_page_by_session_id(
+        db: DbSession, 
+        session_id: int, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Booking], int]:
+        """Get a page of a session's bookings together with the total count."""
+        query = BookingRepository._session_bookings_query(db, session_id, filters)
+        return fetch_page(query.order_by(asc(Booking.booking_date)), skip, limit)
\ No newline at end of file
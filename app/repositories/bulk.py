@@ -0,0 +1,12 @@
+# File path: app/repositories/bulk.py
+from typing import Any, Dict, List, Type
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+def insert_many(db: Session, model: Type[Any], rows: List[Dict[str, Any]]) -> List[int]:
+    """Insert rows in one statement without committing, returning their IDs in row order."""
+    if not rows:
+        return []
+    return db.scalars(
+        insert(model).returning(model.id, sort_by_parameter_order=True), rows
+    ).all()
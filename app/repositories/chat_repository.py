@@ -10,7 +10,6 @@ class ChatRepository:
         db_message = ChatMessage(**kwargs)
         db.add(db_message)
         db.commit()
-        db.refresh(db_message)
         return db_message
 
     @staticmethod
@@ -1,9 +1,23 @@
 # File path: app/repositories/comment_repository.py
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, func
+from collections import Counter, defaultdict
+from typing import List, Optional, Dict, Any, Set, Tuple
+from datetime import datetime
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import desc, asc, func, exists, select
 from app.models.comment import Comment
+from app.models.discussion import Discussion
 from app.models.like import Like, LikeTargetType
+from app.repositories.pagination import fetch_page, fetch_after
+from app.repositories.bulk import insert_many
+
+# Column names that update() may assign, computed once at import
+_COMMENT_COLUMNS = frozenset(Comment.__table__.columns.keys()) - {"id", "created_at"}
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_COMMENT_SORT_COLUMNS = {
+    "created_at": Comment.created_at,
+}
 
 class CommentRepository:
     @staticmethod
@@ -11,36 +25,101 @@ class CommentRepository:
         """Create a new comment in the database."""
         db_comment = Comment(**kwargs)
         db.add(db_comment)
+        # Keep the discussion and parent counters in the same transaction
+        db.query(Discussion)\
+            .filter(Discussion.id == db_comment.discussion_id)\
+            .update({
+                Discussion.comment_count: Discussion.comment_count + 1,
+                Discussion.updated_at: Discussion.updated_at,
+            })
+        if db_comment.parent_id:
+            db.query(Comment)\
+                .filter(Comment.id == db_comment.parent_id)\
+                .update({
+                    Comment.reply_count: Comment.reply_count + 1,
+                    Comment.updated_at: Comment.updated_at,  # a counter bump is not an edit
+                })
         db.commit()
-        db.refresh(db_comment)
         return db_comment
 
+    @staticmethod
+    def create_many(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert many comments in one statement and commit once, returning their IDs in row order."""
+        if not rows:
+            return []
+        ids = insert_many(db, Comment, rows)
+
+        # Keep the discussion and parent counters in the same transaction
+        for discussion_id, count in Counter(row["discussion_id"] for row in rows).items():
+            db.query(Discussion)\
+                .filter(Discussion.id == discussion_id)\
+                .update({
+                    Discussion.comment_count: Discussion.comment_count + count,
+                    Discussion.updated_at: Discussion.updated_at,
+                })
+        for parent_id, count in Counter(row.get("parent_id") for row in rows if row.get("parent_id")).items():
+            db.query(Comment)\
+                .filter(Comment.id == parent_id)\
+                .update({
+                    Comment.reply_count: Comment.reply_count + count,
+                    Comment.updated_at: Comment.updated_at,
+                })
+        db.commit()
+        return ids
+
     @staticmethod
     def get_by_id(db: Session, comment_id: int) -> Optional[Comment]:
         """Get a comment by ID."""
-        return db.query(Comment).filter(Comment.id == comment_id).first()
+        return db.get(Comment, comment_id)
 
     @staticmethod
     def update(db: Session, comment: Comment, **kwargs) -> Comment:
         """Update a comment's attributes."""
         for key, value in kwargs.items():
-            if hasattr(comment, key) and value is not None:
+            if value is not None and key in _COMMENT_COLUMNS:
                 setattr(comment, key, value)
         
         db.commit()
-        db.refresh(comment)
         return comment
 
     @staticmethod
     def delete(db: Session, comment_id: int) -> bool:
         """Delete a comment by ID."""
-        comment = db.query(Comment).filter(Comment.id == comment_id).first()
+        comment = db.get(Comment, comment_id)
         if comment:
+            db.query(Discussion)\
+                .filter(Discussion.id == comment.discussion_id)\
+                .update({
+                    Discussion.comment_count: Discussion.comment_count - 1,
+                    Discussion.updated_at: Discussion.updated_at,
+                })
+            if comment.parent_id:
+                db.query(Comment)\
+                    .filter(Comment.id == comment.parent_id)\
+                    .update({
+                        Comment.reply_count: Comment.reply_count - 1,
+                        Comment.updated_at: Comment.updated_at,
+                    })
             db.delete(comment)
             db.commit()
             return True
         return False
 
+    @staticmethod
+    def _discussion_comments_query(db: Session, discussion_id: int, parent_id: Optional[int] = None):
+        """Build the filtered query behind the discussion comment list and count."""
+        query = db.query(Comment).filter(Comment.discussion_id == discussion_id)
+        
+        # Filter by parent_id (None for top-level comments)
+        return query.filter(Comment.parent_id == parent_id)
+
+    @staticmethod
+    def _sorted(query, sort_by: str, sort_desc: bool):
+        """Apply the requested ordering to a comment query."""
+        if sort_desc:
+            return query.order_by(desc(_COMMENT_SORT_COLUMNS.get(sort_by, Comment.created_at)))
+        return query.order_by(asc(_COMMENT_SORT_COLUMNS.get(sort_by, Comment.created_at)))
+
     @staticmethod
     def get_by_discussion_id(
         db: Session, 
@@ -52,18 +131,8 @@ class CommentRepository:
         sort_desc: bool = True
     ) -> List[Comment]:
         """Get comments for a discussion, optionally filtered by parent_id."""
-        query = db.query(Comment).filter(Comment.discussion_id == discussion_id)
-        
-        # Filter by parent_id (None for top-level comments)
-        query = query.filter(Comment.parent_id == parent_id)
-            
-        # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Comment, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Comment, sort_by)))
-            
-        # Apply pagination
+        query = CommentRepository._discussion_comments_query(db, discussion_id, parent_id)
+        query = CommentRepository._sorted(query, sort_by, sort_desc)
         return query.offset(skip).limit(limit).all()
 
     @staticmethod
@@ -73,12 +142,22 @@ class CommentRepository:
         parent_id: Optional[int] = None
     ) -> int:
         """Count comments for a discussion, optionally filtered by parent_id."""
-        query = db.query(Comment).filter(Comment.discussion_id == discussion_id)
-        
-        # Filter by parent_id (None for top-level comments)
-        query = query.filter(Comment.parent_id == parent_id)
-            
-        return query.count()
+        return CommentRepository._discussion_comments_query(db, discussion_id, parent_id).count()
+
+    @staticmethod
+    def get_page_by_discussion_id(
+        db: Session, 
+        discussion_id: int, 
+        parent_id: Optional[int] = None,
+        skip: int = 0, 
+        limit: int = 100,
+        sort_by: str = "created_at",
+        sort_desc: bool = True
+    ) -> Tuple[List[Comment], int]:
+        """Get a page of a discussion's comments together with the total count."""
+        query = CommentRepository._discussion_comments_query(db, discussion_id, parent_id)
+        query = CommentRepository._sorted(query, sort_by, sort_desc)
+        return fetch_page(query, skip, limit)
 
     @staticmethod
     def count_all_by_discussion_id(db: Session, discussion_id: int) -> int:
@@ -100,6 +179,31 @@ class CommentRepository:
             .limit(limit)\
             .all()
 
+    @staticmethod
+    def get_subtrees(db: Session, root_ids: List[int]) -> Dict[Optional[int], List[Comment]]:
+        """Load the given comments, their reply trees and authors up front, grouped by parent_id."""
+        if not root_ids:
+            return {}
+        
+        # Walk down from the page's comments only, instead of loading the whole discussion
+        tree = select(Comment.id).where(Comment.id.in_(root_ids)).cte("tree", recursive=True)
+        tree = tree.union_all(select(Comment.id).join(tree, Comment.parent_id == tree.c.id))
+        comments = db.query(Comment)\
+            .options(selectinload(Comment.user))\
+            .filter(Comment.id.in_(select(tree.c.id)))\
+            .order_by(asc(Comment.created_at))\
+            .all()
+        
+        by_parent: Dict[Optional[int], List[Comment]] = defaultdict(list)
+        for comment in comments:
+            by_parent[comment.parent_id].append(comment)
+        
+        # Populate each replies collection so walking the tree emits no further SELECTs
+        for comment in comments:
+            set_committed_value(comment, "replies", by_parent.get(comment.id, []))
+        
+        return by_parent
+
     @staticmethod
     def count_replies(db: Session, comment_id: int) -> int:
         """Count replies to a comment."""
@@ -116,13 +220,27 @@ class CommentRepository:
     @staticmethod
     def is_liked_by_user(db: Session, comment_id: int, user_id: int) -> bool:
         """Check if a comment is liked by a specific user."""
-        like = db.query(Like).filter(
-            Like.comment_id == comment_id,
-            Like.user_id == user_id,
-            Like.target_type == LikeTargetType.COMMENT
-        ).first()
-        
-        return like is not None
+        return db.query(
+            exists().where(
+                Like.comment_id == comment_id,
+                Like.user_id == user_id,
+                Like.target_type == LikeTargetType.COMMENT
+            )
+        ).scalar()
+
+    @staticmethod
+    def get_liked_by_user(db: Session, comment_ids: List[int], user_id: int) -> Set[int]:
+        """Get the IDs among comment_ids that a user has liked."""
+        if not comment_ids:
+            return set()
+        rows = db.query(Like.comment_id)\
+            .filter(
+                Like.comment_id.in_(comment_ids),
+                Like.user_id == user_id,
+                Like.target_type == LikeTargetType.COMMENT
+            )\
+            .all()
+        return {comment_id for (comment_id,) in rows}
 
     @staticmethod
     def get_by_user_id(
@@ -137,4 +255,15 @@ class CommentRepository:
             .order_by(desc(Comment.created_at))\
             .offset(skip)\
             .limit(limit)\
-            .all()
\ No newline at end of file
+            .all()
+
+    @staticmethod
+    def list_after(
+        db: Session,
+        user_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100
+    ) -> Tuple[List[Comment], Optional[Tuple[datetime, int]]]:
+        """Get a user's comments created before a (created_at, id) cursor, with the next cursor."""
+        query = db.query(Comment).filter(Comment.user_id == user_id)
+        return fetch_after(query, Comment.created_at, Comment.id, cursor, limit)
\ No newline at end of file
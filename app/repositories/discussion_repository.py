@@ -1,9 +1,24 @@
 # File path: app/repositories/discussion_repository.py
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc
+from sqlalchemy import desc, asc, update, exists
+from collections import Counter
 from app.models.discussion import Discussion
+from app.models.forum import Forum
 from app.models.like import Like, LikeTargetType
+from app.repositories.pagination import fetch_page, fetch_after
+from app.repositories.search import text_search
+from app.repositories.bulk import insert_many
+
+# Column names that update() may assign, computed once at import
+_DISCUSSION_COLUMNS = frozenset(Discussion.__table__.columns.keys()) - {"id", "created_at"}
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_DISCUSSION_SORT_COLUMNS = {
+    "title": Discussion.title,
+    "created_at": Discussion.created_at,
+}
 
 class DiscussionRepository:
     @staticmethod
@@ -11,72 +26,114 @@ class DiscussionRepository:
         """Create a new discussion in the database."""
         db_discussion = Discussion(**kwargs)
         db.add(db_discussion)
+        # Keep the forum counter in the same transaction
+        db.query(Forum)\
+            .filter(Forum.id == db_discussion.forum_id)\
+            .update({
+                Forum.discussion_count: Forum.discussion_count + 1,
+                Forum.updated_at: Forum.updated_at,  # a counter bump is not an edit
+            })
         db.commit()
-        db.refresh(db_discussion)
         return db_discussion
 
+    @staticmethod
+    def create_many(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert many discussions in one statement and commit once, returning their IDs in row order."""
+        if not rows:
+            return []
+        ids = insert_many(db, Discussion, rows)
+
+        # Keep the forum counters in the same transaction
+        for forum_id, count in Counter(row["forum_id"] for row in rows).items():
+            db.query(Forum)\
+                .filter(Forum.id == forum_id)\
+                .update({
+                    Forum.discussion_count: Forum.discussion_count + count,
+                    Forum.updated_at: Forum.updated_at,
+                })
+        db.commit()
+        return ids
+
     @staticmethod
     def get_by_id(db: Session, discussion_id: int) -> Optional[Discussion]:
         """Get a discussion by ID."""
-        return db.query(Discussion).filter(Discussion.id == discussion_id).first()
+        return db.get(Discussion, discussion_id)
 
     @staticmethod
     def update(db: Session, discussion: Discussion, **kwargs) -> Discussion:
         """Update a discussion's attributes."""
         for key, value in kwargs.items():
-            if hasattr(discussion, key) and value is not None:
+            if value is not None and key in _DISCUSSION_COLUMNS:
                 setattr(discussion, key, value)
         
         db.commit()
-        db.refresh(discussion)
         return discussion
 
     @staticmethod
     def delete(db: Session, discussion_id: int) -> bool:
         """Delete a discussion by ID."""
-        discussion = db.query(Discussion).filter(Discussion.id == discussion_id).first()
+        discussion = db.get(Discussion, discussion_id)
         if discussion:
+            db.query(Forum)\
+                .filter(Forum.id == discussion.forum_id)\
+                .update({
+                    Forum.discussion_count: Forum.discussion_count - 1,
+                    Forum.updated_at: Forum.updated_at,
+                })
             db.delete(discussion)
             db.commit()
             return True
         return False
 
     @staticmethod
-    def get_by_forum_id(
-        db: Session, 
-        forum_id: int, 
-        skip: int = 0, 
-        limit: int = 100,
+    def _forum_discussions_query(
+        db: Session,
+        forum_id: int,
         search: Optional[str] = None,
-        is_pinned: Optional[bool] = None,
-        sort_by: str = "created_at",
-        sort_desc: bool = True
-    ) -> List[Discussion]:
-        """Get all discussions for a forum."""
+        is_pinned: Optional[bool] = None
+    ):
+        """Build the filtered query behind the forum discussion list and count."""
         query = db.query(Discussion).filter(Discussion.forum_id == forum_id)
         
         # Apply search
         if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                Discussion.title.ilike(search_term) | Discussion.content.ilike(search_term)
-            )
+            query = query.filter(text_search(db, search, Discussion.title, Discussion.content))
             
         # Filter by pinned status
         if is_pinned is not None:
             query = query.filter(Discussion.is_pinned == is_pinned)
-            
+        
+        return query
+
+    @staticmethod
+    def _sorted(query, is_pinned: Optional[bool], sort_by: str, sort_desc: bool):
+        """Apply the requested ordering to a forum discussion query."""
+        order_cols = []
+        
         # If sorting by created_at and we want pinned discussions at top
         if sort_by == "created_at" and is_pinned is None:
-            query = query.order_by(desc(Discussion.is_pinned))
+            order_cols.append(desc(Discussion.is_pinned))
         
         # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Discussion, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Discussion, sort_by)))
-            
-        # Apply pagination
+        sort_col = _DISCUSSION_SORT_COLUMNS.get(sort_by, Discussion.created_at)
+        order_cols.append(desc(sort_col) if sort_desc else asc(sort_col))
+        
+        return query.order_by(*order_cols)
+
+    @staticmethod
+    def get_by_forum_id(
+        db: Session, 
+        forum_id: int, 
+        skip: int = 0, 
+        limit: int = 100,
+        search: Optional[str] = None,
+        is_pinned: Optional[bool] = None,
+        sort_by: str = "created_at",
+        sort_desc: bool = True
+    ) -> List[Discussion]:
+        """Get all discussions for a forum."""
+        query = DiscussionRepository._forum_discussions_query(db, forum_id, search, is_pinned)
+        query = DiscussionRepository._sorted(query, is_pinned, sort_by, sort_desc)
         return query.offset(skip).limit(limit).all()
 
     @staticmethod
@@ -87,20 +144,23 @@ class DiscussionRepository:
         is_pinned: Optional[bool] = None
     ) -> int:
         """Count discussions for a forum."""
-        query = db.query(Discussion).filter(Discussion.forum_id == forum_id)
-        
-        # Apply search
-        if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                Discussion.title.ilike(search_term) | Discussion.content.ilike(search_term)
-            )
-            
-        # Filter by pinned status
-        if is_pinned is not None:
-            query = query.filter(Discussion.is_pinned == is_pinned)
-            
-        return query.count()
+        return DiscussionRepository._forum_discussions_query(db, forum_id, search, is_pinned).count()
+
+    @staticmethod
+    def get_page_by_forum_id(
+        db: Session, 
+        forum_id: int, 
+        skip: int = 0, 
+        limit: int = 100,
+        search: Optional[str] = None,
+        is_pinned: Optional[bool] = None,
+        sort_by: str = "created_at",
+        sort_desc: bool = True
+    ) -> Tuple[List[Discussion], int]:
+        """Get a page of a forum's discussions together with the total count."""
+        query = DiscussionRepository._forum_discussions_query(db, forum_id, search, is_pinned)
+        query = DiscussionRepository._sorted(query, is_pinned, sort_by, sort_desc)
+        return fetch_page(query, skip, limit)
 
     @staticmethod
     def get_by_user_id(
@@ -117,27 +177,38 @@ class DiscussionRepository:
             .limit(limit)\
             .all()
 
+    @staticmethod
+    def list_after(
+        db: Session,
+        user_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100
+    ) -> Tuple[List[Discussion], Optional[Tuple[datetime, int]]]:
+        """Get a user's discussions created before a (created_at, id) cursor, with the next cursor."""
+        query = db.query(Discussion).filter(Discussion.user_id == user_id)
+        return fetch_after(query, Discussion.created_at, Discussion.id, cursor, limit)
+
     @staticmethod
     def pin_discussion(db: Session, discussion_id: int, pin: bool = True) -> Optional[Discussion]:
         """Pin or unpin a discussion."""
-        discussion = db.query(Discussion).filter(Discussion.id == discussion_id).first()
-        if discussion:
-            discussion.is_pinned = pin
-            db.commit()
-            db.refresh(discussion)
-            return discussion
-        return None
+        return DiscussionRepository._set_flags(db, discussion_id, is_pinned=pin)
 
     @staticmethod
     def lock_discussion(db: Session, discussion_id: int, lock: bool = True) -> Optional[Discussion]:
         """Lock or unlock a discussion."""
-        discussion = db.query(Discussion).filter(Discussion.id == discussion_id).first()
-        if discussion:
-            discussion.is_locked = lock
-            db.commit()
-            db.refresh(discussion)
-            return discussion
-        return None
+        return DiscussionRepository._set_flags(db, discussion_id, is_locked=lock)
+
+    @staticmethod
+    def _set_flags(db: Session, discussion_id: int, **values) -> Optional[Discussion]:
+        """Set flag columns with a single UPDATE ... RETURNING, returning the updated discussion."""
+        discussion = db.scalars(
+            update(Discussion)
+            .where(Discussion.id == discussion_id)
+            .values(**values)
+            .returning(Discussion)
+        ).one_or_none()
+        db.commit()
+        return discussion
     
     @staticmethod
     def get_like_count(db: Session, discussion_id: int) -> int:
@@ -150,10 +221,10 @@ class DiscussionRepository:
     @staticmethod
     def is_liked_by_user(db: Session, discussion_id: int, user_id: int) -> bool:
         """Check if a discussion is liked by a specific user."""
-        like = db.query(Like).filter(
-            Like.discussion_id == discussion_id,
-            Like.user_id == user_id,
-            Like.target_type == LikeTargetType.DISCUSSION
-        ).first()
-        
-        return like is not None
\ No newline at end of file
+        return db.query(
+            exists().where(
+                Like.discussion_id == discussion_id,
+                Like.user_id == user_id,
+                Like.target_type == LikeTargetType.DISCUSSION
+            )
+        ).scalar()
\ No newline at end of file
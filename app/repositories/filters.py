@@ -0,0 +1,32 @@
+# File path: app/repositories/filters.py
+from typing import Any, Callable, Dict, Optional, Tuple
+from sqlalchemy import or_
+from sqlalchemy.orm import Query
+
+_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "eq": lambda column, value: column == value,
+    "ge": lambda column, value: column >= value,
+    "le": lambda column, value: column <= value,
+    "positive": lambda column, value: column > 0,
+    "ilike_any": lambda columns, value: or_(*(column.ilike(f"%{value}%") for column in columns)),
+}
+
+def apply_filters(
+    query: Query,
+    filters: Optional[Dict[str, Any]],
+    spec: Dict[str, Tuple[Any, str]]
+) -> Query:
+    """Apply each filter named in spec, skipping keys that are absent or empty."""
+    if not filters:
+        return query
+
+    for key, (column, operator) in spec.items():
+        if key not in filters:
+            continue
+        value = filters[key]
+        # "flag" filters apply whenever the key is given, so False still narrows the query
+        if operator == "flag":
+            query = query.filter(column == value)
+        elif value:
+            query = query.filter(_OPERATORS[operator](column, value))
+    return query
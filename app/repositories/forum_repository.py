@@ -1,10 +1,22 @@
 # File path: app/repositories/forum_repository.py
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import desc, asc, func
 from app.models.forum import Forum
 from app.models.forum_membership import ForumMembership
 from app.models.discussion import Discussion
+from app.repositories.membership_repository import _forget_permissions
+from app.repositories.pagination import fetch_page
+from app.repositories.search import text_search
+
+# Column names that update() may assign, computed once at import
+_FORUM_COLUMNS = frozenset(Forum.__table__.columns.keys()) - {"id", "created_at"}
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_FORUM_SORT_COLUMNS = {
+    "name": Forum.name,
+    "created_at": Forum.created_at,
+}
 
 class ForumRepository:
     @staticmethod
@@ -13,35 +25,53 @@ class ForumRepository:
         db_forum = Forum(**kwargs)
         db.add(db_forum)
         db.commit()
-        db.refresh(db_forum)
         return db_forum
 
     @staticmethod
     def get_by_id(db: Session, forum_id: int) -> Optional[Forum]:
         """Get a forum by ID."""
-        return db.query(Forum).filter(Forum.id == forum_id).first()
+        return db.get(Forum, forum_id)
 
     @staticmethod
     def update(db: Session, forum: Forum, **kwargs) -> Forum:
         """Update a forum's attributes."""
         for key, value in kwargs.items():
-            if hasattr(forum, key) and value is not None:
+            if value is not None and key in _FORUM_COLUMNS:
                 setattr(forum, key, value)
         
         db.commit()
-        db.refresh(forum)
         return forum
 
     @staticmethod
     def delete(db: Session, forum_id: int) -> bool:
         """Delete a forum by ID."""
-        forum = db.query(Forum).filter(Forum.id == forum_id).first()
+        forum = db.get(Forum, forum_id)
         if forum:
             db.delete(forum)
             db.commit()
+            # The forum's memberships went with it, so memoized checks for it are stale
+            _forget_permissions(db)
             return True
         return False
 
+    @staticmethod
+    def _search_query(db: Session, search: Optional[str] = None):
+        """Build the searched query behind the forum list and count."""
+        query = db.query(Forum)
+        
+        # Apply search
+        if search:
+            query = query.filter(text_search(db, search, Forum.name, Forum.description))
+        
+        return query
+
+    @staticmethod
+    def _sorted(query, sort_by: str, sort_desc: bool):
+        """Apply the requested ordering to a forum query."""
+        if sort_desc:
+            return query.order_by(desc(_FORUM_SORT_COLUMNS.get(sort_by, Forum.created_at)))
+        return query.order_by(asc(_FORUM_SORT_COLUMNS.get(sort_by, Forum.created_at)))
+
     @staticmethod
     def get_all(
         db: Session, 
@@ -52,37 +82,26 @@ class ForumRepository:
         sort_desc: bool = True
     ) -> List[Forum]:
         """Get all forums with search and sorting."""
-        query = db.query(Forum)
-        
-        # Apply search
-        if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                Forum.name.ilike(search_term) | Forum.description.ilike(search_term)
-            )
-        
-        # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Forum, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Forum, sort_by)))
-            
-        # Apply pagination
+        query = ForumRepository._sorted(ForumRepository._search_query(db, search), sort_by, sort_desc)
         return query.offset(skip).limit(limit).all()
 
     @staticmethod
     def count(db: Session, search: Optional[str] = None) -> int:
         """Count forums with applied search."""
-        query = db.query(Forum)
-        
-        # Apply search
-        if search:
-            search_term = f"%{search}%"
-            query = query.filter(
-                Forum.name.ilike(search_term) | Forum.description.ilike(search_term)
-            )
-        
-        return query.count()
+        return ForumRepository._search_query(db, search).count()
+
+    @staticmethod
+    def get_page(
+        db: Session, 
+        skip: int = 0, 
+        limit: int = 100,
+        search: Optional[str] = None,
+        sort_by: str = "created_at",
+        sort_desc: bool = True
+    ) -> Tuple[List[Forum], int]:
+        """Get a page of forums together with the total count."""
+        query = ForumRepository._sorted(ForumRepository._search_query(db, search), sort_by, sort_desc)
+        return fetch_page(query, skip, limit)
 
     @staticmethod
     def get_member_count(db: Session, forum_id: int) -> int:
@@ -109,14 +128,12 @@ class ForumRepository:
     @staticmethod
     def get_forums_for_user(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[Forum]:
         """Get all forums that a user is a member of."""
-        # Get forum IDs from user's memberships
-        forum_ids_subquery = db.query(ForumMembership.forum_id).filter(
-            ForumMembership.user_id == user_id,
-            ForumMembership.status == "ACTIVE"
-        ).subquery()
-        
         return db.query(Forum)\
-            .filter(Forum.id.in_(forum_ids_subquery))\
+            .join(ForumMembership, ForumMembership.forum_id == Forum.id)\
+            .filter(
+                ForumMembership.user_id == user_id,
+                ForumMembership.status == "ACTIVE"
+            )\
             .offset(skip)\
             .limit(limit)\
             .all()
\ No newline at end of file
@@ -1,41 +1,71 @@
 # app/repositories/goal_repository.py
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, func
+from typing import List, Optional, Dict, Any, Tuple, Iterator
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import desc, asc, func, insert, case
 from datetime import datetime, timedelta
-from app.models.goal import Goal, GoalStatus
+from app.models.goal import Goal, GoalStatus, GoalType
 from app.models.progress import Progress
+from app.repositories.pagination import fetch_page, fetch_after
+from app.repositories.search import text_search
+
+# Column names that update() may assign, computed once at import
+_GOAL_COLUMNS = frozenset(Goal.__table__.columns.keys()) - {"id", "created_at"}
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_GOAL_SORT_COLUMNS = {
+    "title": Goal.title,
+    "start_date": Goal.start_date,
+    "deadline": Goal.deadline,
+    "created_at": Goal.created_at,
+}
+
+# Single-row INSERT built once; RETURNING the entity puts the new row in the identity map
+_INSERT_GOAL = insert(Goal).returning(Goal)
 
 class GoalRepository:
     @staticmethod
     def create(db: Session, **kwargs) -> Goal:
         """Create a new goal in the database."""
-        db_goal = Goal(**kwargs)
-        db.add(db_goal)
+        db_goal = db.scalars(_INSERT_GOAL, [kwargs]).one()
         db.commit()
-        db.refresh(db_goal)
         return db_goal
 
     @staticmethod
     def get_by_id(db: Session, goal_id: int) -> Optional[Goal]:
         """Get a goal by ID."""
-        return db.query(Goal).filter(Goal.id == goal_id).first()
+        return db.get(Goal, goal_id)
+
+    @staticmethod
+    def get_by_id_with_progress(db: Session, goal_id: int) -> Optional[Goal]:
+        """Get a goal by ID with its progress entries joined into the same query."""
+        return db.query(Goal)\
+            .options(joinedload(Goal.progress_entries))\
+            .filter(Goal.id == goal_id)\
+            .first()
+
+    @staticmethod
+    def count_completed_by_type(db: Session, user_id: int) -> Dict[GoalType, int]:
+        """Count a user's completed goals per goal type in one grouped query."""
+        rows = db.query(Goal.goal_type, func.count(Goal.id))\
+            .filter(Goal.user_id == user_id, Goal.status == GoalStatus.COMPLETED)\
+            .group_by(Goal.goal_type)\
+            .all()
+        return dict(rows)
 
     @staticmethod
     def update(db: Session, goal: Goal, **kwargs) -> Goal:
         """Update a goal's attributes."""
         for key, value in kwargs.items():
-            if hasattr(goal, key) and value is not None:
+            if value is not None and key in _GOAL_COLUMNS:
                 setattr(goal, key, value)
         
         db.commit()
-        db.refresh(goal)
         return goal
 
     @staticmethod
     def delete(db: Session, goal_id: int) -> bool:
         """Delete a goal by ID."""
-        goal = db.query(Goal).filter(Goal.id == goal_id).first()
+        goal = db.get(Goal, goal_id)
         if goal:
             db.delete(goal)
             db.commit()
@@ -43,16 +73,12 @@ class GoalRepository:
         return False
 
     @staticmethod
-    def get_by_user_id(
-        db: Session, 
-        user_id: int, 
-        skip: int = 0, 
-        limit: int = 100,
-        filters: Optional[Dict[str, Any]] = None,
-        sort_by: str = "created_at",
-        sort_desc: bool = True
-    ) -> List[Goal]:
-        """Get goals by user ID with filtering and sorting."""
+    def _user_goals_query(
+        db: Session,
+        user_id: int,
+        filters: Optional[Dict[str, Any]] = None
+    ):
+        """Build the filtered query behind the user goal list and count."""
         query = db.query(Goal).filter(Goal.user_id == user_id)
         
         # Apply filters
@@ -73,19 +99,44 @@ class GoalRepository:
                 query = query.filter(Goal.deadline <= filters["deadline_before"])
                 
             if "search" in filters and filters["search"]:
-                search_term = f"%{filters['search']}%"
-                query = query.filter(Goal.title.ilike(search_term) | 
-                                     Goal.description.ilike(search_term))
+                query = query.filter(text_search(db, filters["search"], Goal.title, Goal.description))
         
-        # Apply sorting
+        return query
+
+    @staticmethod
+    def _sorted(query, sort_by: str, sort_desc: bool):
+        """Apply the requested ordering to a goal query."""
         if sort_desc:
-            query = query.order_by(desc(getattr(Goal, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Goal, sort_by)))
-            
-        # Apply pagination
+            return query.order_by(desc(_GOAL_SORT_COLUMNS.get(sort_by, Goal.created_at)))
+        return query.order_by(asc(_GOAL_SORT_COLUMNS.get(sort_by, Goal.created_at)))
+
+    @staticmethod
+    def get_by_user_id(
+        db: Session, 
+        user_id: int, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "created_at",
+        sort_desc: bool = True
+    ) -> List[Goal]:
+        """Get goals by user ID with filtering and sorting."""
+        query = GoalRepository._user_goals_query(db, user_id, filters)
+        query = GoalRepository._sorted(query, sort_by, sort_desc)
         return query.offset(skip).limit(limit).all()
 
+    @staticmethod
+    def list_after(
+        db: Session,
+        user_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Goal], Optional[Tuple[datetime, int]]]:
+        """Get a user's goals created before a (created_at, id) cursor, with the next cursor."""
+        query = GoalRepository._user_goals_query(db, user_id, filters)
+        return fetch_after(query, Goal.created_at, Goal.id, cursor, limit)
+
     @staticmethod
     def count_by_user_id(
         db: Session, 
@@ -93,31 +144,22 @@ class GoalRepository:
         filters: Optional[Dict[str, Any]] = None
     ) -> int:
         """Count goals by user ID with applied filters."""
-        query = db.query(Goal).filter(Goal.user_id == user_id)
-        
-        # Apply filters
-        if filters:
-            if "status" in filters and filters["status"]:
-                query = query.filter(Goal.status == filters["status"])
-                
-            if "goal_type" in filters and filters["goal_type"]:
-                query = query.filter(Goal.goal_type == filters["goal_type"])
-                
-            if "is_public" in filters:
-                query = query.filter(Goal.is_public == filters["is_public"])
-                
-            if "start_date_after" in filters and filters["start_date_after"]:
-                query = query.filter(Goal.start_date >= filters["start_date_after"])
-                
-            if "deadline_before" in filters and filters["deadline_before"]:
-                query = query.filter(Goal.deadline <= filters["deadline_before"])
-                
-            if "search" in filters and filters["search"]:
-                search_term = f"%{filters['search']}%"
-                query = query.filter(Goal.title.ilike(search_term) | 
-                                    Goal.description.ilike(search_term))
-                
-        return query.count()
+        return GoalRepository._user_goals_query(db, user_id, filters).count()
+
+    @staticmethod
+    def get_page_by_user_id(
+        db: Session, 
+        user_id: int, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "created_at",
+        sort_desc: bool = True
+    ) -> Tuple[List[Goal], int]:
+        """Get a page of a user's goals together with the total count."""
+        query = GoalRepository._user_goals_query(db, user_id, filters)
+        query = GoalRepository._sorted(query, sort_by, sort_desc)
+        return fetch_page(query, skip, limit)
 
     @staticmethod
     def get_public_goals(
@@ -143,52 +185,61 @@ class GoalRepository:
                 query = query.filter(Goal.goal_type == filters["goal_type"])
                 
             if "search" in filters and filters["search"]:
-                search_term = f"%{filters['search']}%"
-                query = query.filter(Goal.title.ilike(search_term) | 
-                                    Goal.description.ilike(search_term))
+                query = query.filter(text_search(db, filters["search"], Goal.title, Goal.description))
         
         # Apply sorting
         if sort_desc:
-            query = query.order_by(desc(getattr(Goal, sort_by)))
+            query = query.order_by(desc(_GOAL_SORT_COLUMNS.get(sort_by, Goal.created_at)))
         else:
-            query = query.order_by(asc(getattr(Goal, sort_by)))
+            query = query.order_by(asc(_GOAL_SORT_COLUMNS.get(sort_by, Goal.created_at)))
             
         # Apply pagination
         return query.offset(skip).limit(limit).all()
 
     @staticmethod
-    def get_goals_with_approaching_deadline(
+    def iter_goals_with_approaching_deadline(
         db: Session, 
-        days_threshold: int = 3
-    ) -> List[Goal]:
-        """Get goals with deadlines approaching within the specified days threshold."""
-        threshold_date = datetime.now() + timedelta(days=days_threshold)
+        days_threshold: int = 3,
+        chunk_size: int = 500
+    ) -> Iterator[List[Goal]]:
+        """Yield goals with deadlines approaching within the threshold in ID-ordered chunks."""
+        now = datetime.now()
+        threshold_date = now + timedelta(days=days_threshold)
         
-        return db.query(Goal).filter(
-            Goal.status == GoalStatus.IN_PROGRESS,
-            Goal.deadline <= threshold_date,
-            Goal.deadline > datetime.now()
-        ).all()
+        last_id = 0
+        while True:
+            # Seek past the previous chunk so callers may commit between chunks
+            chunk = db.query(Goal).filter(
+                Goal.status == GoalStatus.IN_PROGRESS,
+                Goal.deadline <= threshold_date,
+                Goal.deadline > now,
+                Goal.id > last_id
+            ).order_by(asc(Goal.id)).limit(chunk_size).all()
+            
+            if not chunk:
+                return
+            # Read the seek key before the caller commits and expires the chunk
+            last_id = chunk[-1].id
+            yield chunk
+            
+            if len(chunk) < chunk_size:
+                return
 
     @staticmethod
     def get_completion_percentage(db: Session, goal_id: int) -> float:
         """Calculate the completion percentage for a goal."""
-        goal = db.query(Goal).filter(Goal.id == goal_id).first()
-        if not goal or goal.target_value is None:
-            return 0.0
-        if not goal or goal.target_value is None or goal.target_value == 0:
-            return 0.0
-            
-        latest_progress = db.query(Progress)\
-            .filter(Progress.goal_id == goal_id)\
+        # Latest progress value over the target, capped at 100%, computed in one query
+        percentage = Progress.value * 100.0 / Goal.target_value
+        result = db.query(case((percentage > 100.0, 100.0), else_=percentage))\
+            .select_from(Goal)\
+            .join(Progress, Progress.goal_id == Goal.id)\
+            .filter(
+                Goal.id == goal_id,
+                Goal.target_value.isnot(None),
+                Goal.target_value != 0
+            )\
             .order_by(desc(Progress.date))\
-            .first()
-            
-        if not latest_progress:
-            return 0.0
-            
-        # Calculate percentage
-        percentage = (latest_progress.value / goal.target_value) * 100
+            .limit(1)\
+            .scalar()
         
-        # Cap at 100%
-        return min(percentage, 100.0)
\ No newline at end of file
+        return float(result) if result is not None else 0.0
\ No newline at end of file
@@ -1,7 +1,14 @@
 # File path: app/repositories/like_repository.py
-from typing import Optional, List
+from collections import Counter
+from typing import Optional, List, Dict, Any, Tuple
+from datetime import datetime
 from sqlalchemy.orm import Session
+from sqlalchemy import delete, func
 from app.models.like import Like, LikeTargetType
+from app.models.discussion import Discussion
+from app.models.comment import Comment
+from app.repositories.pagination import fetch_after
+from app.repositories.bulk import insert_many
 
 class LikeRepository:
     @staticmethod
@@ -9,10 +16,55 @@ class LikeRepository:
         """Create a new like in the database."""
         db_like = Like(**kwargs)
         db.add(db_like)
+        # Keep the target's like counter in the same transaction
+        if db_like.target_type == LikeTargetType.DISCUSSION:
+            db.query(Discussion)\
+                .filter(Discussion.id == db_like.discussion_id)\
+                .update({
+                    Discussion.like_count: Discussion.like_count + 1,
+                    Discussion.updated_at: Discussion.updated_at,
+                })
+        elif db_like.target_type == LikeTargetType.COMMENT:
+            db.query(Comment)\
+                .filter(Comment.id == db_like.comment_id)\
+                .update({
+                    Comment.like_count: Comment.like_count + 1,
+                    Comment.updated_at: Comment.updated_at,  # a counter bump is not an edit
+                })
         db.commit()
-        db.refresh(db_like)
         return db_like
 
+    @staticmethod
+    def create_many(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert many likes in one statement and commit once, returning their IDs in row order."""
+        if not rows:
+            return []
+        ids = insert_many(db, Like, rows)
+
+        # Keep the targets' like counters in the same transaction
+        discussion_likes = Counter(
+            row["discussion_id"] for row in rows if row["target_type"] == LikeTargetType.DISCUSSION
+        )
+        comment_likes = Counter(
+            row["comment_id"] for row in rows if row["target_type"] == LikeTargetType.COMMENT
+        )
+        for discussion_id, count in discussion_likes.items():
+            db.query(Discussion)\
+                .filter(Discussion.id == discussion_id)\
+                .update({
+                    Discussion.like_count: Discussion.like_count + count,
+                    Discussion.updated_at: Discussion.updated_at,
+                })
+        for comment_id, count in comment_likes.items():
+            db.query(Comment)\
+                .filter(Comment.id == comment_id)\
+                .update({
+                    Comment.like_count: Comment.like_count + count,
+                    Comment.updated_at: Comment.updated_at,
+                })
+        db.commit()
+        return ids
+
     @staticmethod
     def get_discussion_like(db: Session, discussion_id: int, user_id: int) -> Optional[Like]:
         """Get a like for a discussion by user."""
@@ -34,28 +86,47 @@ class LikeRepository:
     @staticmethod
     def delete(db: Session, like_id: int) -> bool:
         """Delete a like by ID."""
-        like = db.query(Like).filter(Like.id == like_id).first()
-        if like:
-            db.delete(like)
-            db.commit()
-            return True
-        return False
+        # RETURNING hands back the target so no SELECT is needed before the DELETE
+        like = db.execute(
+            delete(Like)
+            .where(Like.id == like_id)
+            .returning(Like.target_type, Like.discussion_id, Like.comment_id)
+        ).first()
+        if like is None:
+            return False
+
+        if like.target_type == LikeTargetType.DISCUSSION:
+            db.query(Discussion)\
+                .filter(Discussion.id == like.discussion_id)\
+                .update({
+                    Discussion.like_count: Discussion.like_count - 1,
+                    Discussion.updated_at: Discussion.updated_at,
+                })
+        elif like.target_type == LikeTargetType.COMMENT:
+            db.query(Comment)\
+                .filter(Comment.id == like.comment_id)\
+                .update({
+                    Comment.like_count: Comment.like_count - 1,
+                    Comment.updated_at: Comment.updated_at,
+                })
+        db.commit()
+        return True
 
     @staticmethod
     def count_discussion_likes(db: Session, discussion_id: int) -> int:
         """Count likes for a discussion."""
-        return db.query(Like).filter(
+        return db.query(func.count(Like.id)).filter(
             Like.discussion_id == discussion_id,
             Like.target_type == LikeTargetType.DISCUSSION
-        ).count()
+        ).scalar()
 
     @staticmethod
     def count_comment_likes(db: Session, comment_id: int) -> int:
         """Count likes for a comment."""
-        return db.query(Like).filter(
+        return db.query(func.count(Like.id)).filter(
             Like.comment_id == comment_id,
             Like.target_type == LikeTargetType.COMMENT
-        ).count()
+        ).scalar()
 
     @staticmethod
     def get_by_user_id(
@@ -69,4 +140,15 @@ class LikeRepository:
             .filter(Like.user_id == user_id)\
             .offset(skip)\
             .limit(limit)\
-            .all()
\ No newline at end of file
+            .all()
+
+    @staticmethod
+    def list_after(
+        db: Session,
+        user_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100
+    ) -> Tuple[List[Like], Optional[Tuple[datetime, int]]]:
+        """Get a user's likes created before a (created_at, id) cursor, with the next cursor."""
+        query = db.query(Like).filter(Like.user_id == user_id)
+        return fetch_after(query, Like.created_at, Like.id, cursor, limit)
\ No newline at end of file
@@ -1,8 +1,20 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc
-from datetime import datetime, timedelta
+from sqlalchemy import desc, asc, func, select
+from datetime import datetime, time, timedelta
 from app.models.meal_log import MealLog, MealType
+from app.repositories.pagination import fetch_after
+from app.repositories.updates import update_returning
+
+# Column names that update_by_id() may assign, computed once at import
+_MEAL_COLUMNS = frozenset(MealLog.__table__.columns.keys()) - {"id", "created_at"}
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_MEAL_SORT_COLUMNS = {
+    "consumed_at": MealLog.consumed_at,
+    "meal_type": MealLog.meal_type,
+    "calories": MealLog.calories,
+}
 
 class MealRepository:
     @staticmethod
@@ -11,34 +23,41 @@ class MealRepository:
         db_meal = MealLog(**kwargs)
         db.add(db_meal)
         db.commit()
-        db.refresh(db_meal)
         return db_meal
 
     @staticmethod
     def get_by_id(db: Session, meal_id: int) -> Optional[MealLog]:
         """Get a meal log by ID."""
-        return db.query(MealLog).filter(MealLog.id == meal_id).first()
+        return db.get(MealLog, meal_id)
 
     @staticmethod
     def update(db: Session, meal: MealLog, **kwargs) -> MealLog:
         """Update a meal log's attributes."""
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(meal, key) and value is not None:
+            if hasattr(meal, key) and value is not None and getattr(meal, key) != value:
                 setattr(meal, key, value)
+                changed = True
         
-        db.commit()
-        db.refresh(meal)
+        # Nothing differs, so skip the commit and refresh round trips
+        if changed:
+            db.commit()
+            db.refresh(meal)
         return meal
 
+    @staticmethod
+    def update_by_id(db: Session, meal_id: int, **kwargs) -> Optional[MealLog]:
+        """Update a meal log's attributes with a single UPDATE ... RETURNING."""
+        return update_returning(db, MealLog, _MEAL_COLUMNS, meal_id, **kwargs)
+
     @staticmethod
     def delete(db: Session, meal_id: int) -> bool:
         """Delete a meal log by ID."""
-        meal = db.query(MealLog).filter(MealLog.id == meal_id).first()
-        if meal:
-            db.delete(meal)
-            db.commit()
-            return True
-        return False
+        deleted = db.query(MealLog)\
+            .filter(MealLog.id == meal_id)\
+            .delete(synchronize_session=False)
+        db.commit()
+        return deleted > 0
 
     @staticmethod
     def get_by_user_id(
@@ -53,26 +72,38 @@ class MealRepository:
         sort_desc: bool = True
     ) -> List[MealLog]:
         """Get meal logs by user ID with filtering and sorting."""
-        query = db.query(MealLog).filter(MealLog.user_id == user_id)
+        stmt = select(MealLog).where(MealLog.user_id == user_id)
         
         # Apply filters
         if meal_type:
-            query = query.filter(MealLog.meal_type == meal_type)
+            stmt = stmt.where(MealLog.meal_type == meal_type)
             
         if start_date:
-            query = query.filter(MealLog.consumed_at >= start_date)
+            stmt = stmt.where(MealLog.consumed_at >= start_date)
             
         if end_date:
-            query = query.filter(MealLog.consumed_at <= end_date)
+            stmt = stmt.where(MealLog.consumed_at <= end_date)
         
         # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(MealLog, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(MealLog, sort_by)))
+        sort_column = _MEAL_SORT_COLUMNS.get(sort_by, MealLog.consumed_at)
+        stmt = stmt.order_by(desc(sort_column) if sort_desc else asc(sort_column))
             
         # Apply pagination
-        return query.offset(skip).limit(limit).all()
+        return db.scalars(stmt.offset(skip).limit(limit)).all()
+
+    @staticmethod
+    def list_after(
+        db: Session,
+        user_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+        meal_type: Optional[MealType] = None
+    ) -> Tuple[List[MealLog], Optional[Tuple[datetime, int]]]:
+        """Get a user's meal logs consumed before a (consumed_at, id) cursor, with the next cursor."""
+        query = db.query(MealLog).filter(MealLog.user_id == user_id)
+        if meal_type:
+            query = query.filter(MealLog.meal_type == meal_type)
+        return fetch_after(query, MealLog.consumed_at, MealLog.id, cursor, limit)
 
     @staticmethod
     def count_by_user_id(
@@ -83,7 +114,7 @@ class MealRepository:
         end_date: Optional[datetime] = None
     ) -> int:
         """Count meal logs by user ID with filtering."""
-        query = db.query(MealLog).filter(MealLog.user_id == user_id)
+        query = db.query(func.count(MealLog.id)).filter(MealLog.user_id == user_id)
         
         # Apply filters
         if meal_type:
@@ -95,7 +126,7 @@ class MealRepository:
         if end_date:
             query = query.filter(MealLog.consumed_at <= end_date)
             
-        return query.count()
+        return query.scalar()
 
     @staticmethod
     def get_recent_meals(db: Session, user_id: int, days: int = 7) -> List[MealLog]:
@@ -112,29 +143,38 @@ class MealRepository:
     @staticmethod
     def get_daily_nutrition(db: Session, user_id: int, date: datetime) -> Dict[str, Any]:
         """Get total nutrition for a specific day."""
-        start_of_day = datetime(date.year, date.month, date.day, 0, 0, 0)
-        end_of_day = datetime(date.year, date.month, date.day, 23, 59, 59)
+        # Half-open [start, next day) range so sub-second times late in the day are included
+        start_of_day = datetime.combine(date.date(), time.min)
+        start_of_next_day = start_of_day + timedelta(days=1)
         
-        meals = MealRepository.get_by_user_id(
-            db, 
-            user_id, 
-            start_date=start_of_day,
-            end_date=end_of_day,
-            limit=50  # Reasonable max for one day
+        day_filter = (
+            MealLog.user_id == user_id,
+            MealLog.consumed_at >= start_of_day,
+            MealLog.consumed_at < start_of_next_day,
         )
         
-        # Calculate totals
-        total_calories = sum(meal.calories or 0 for meal in meals)
-        total_protein = sum(meal.protein or 0 for meal in meals)
-        total_carbs = sum(meal.carbs or 0 for meal in meals)
-        total_fat = sum(meal.fat or 0 for meal in meals)
+        # Calculate totals in the database
+        totals = db.query(
+            func.coalesce(func.sum(MealLog.calories), 0).label("calories"),
+            func.coalesce(func.sum(MealLog.protein), 0).label("protein"),
+            func.coalesce(func.sum(MealLog.carbs), 0).label("carbs"),
+            func.coalesce(func.sum(MealLog.fat), 0).label("fat"),
+            func.count(MealLog.id).label("meal_count"),
+        ).filter(*day_filter).one()
+        
+        # Only the listed columns are needed for the meal summary
+        meals = db.query(MealLog.id, MealLog.name, MealLog.meal_type)\
+            .filter(*day_filter)\
+            .order_by(desc(MealLog.consumed_at))\
+            .limit(50)\
+            .all()  # Reasonable max for one day
         
         return {
             "date": date.date(),
-            "total_calories": total_calories,
-            "total_protein": total_protein,
-            "total_carbs": total_carbs,
-            "total_fat": total_fat,
-            "meal_count": len(meals),
+            "total_calories": totals.calories,
+            "total_protein": totals.protein,
+            "total_carbs": totals.carbs,
+            "total_fat": totals.fat,
+            "meal_count": totals.meal_count,
             "meals": [{"id": meal.id, "name": meal.name, "meal_type": meal.meal_type.value} for meal in meals]
         }
\ No newline at end of file
@@ -1,8 +1,28 @@
 # File path: app/repositories/membership_repository.py
-from typing import List, Optional
+from typing import List, Optional, Tuple, Dict
+from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc
+from sqlalchemy import desc, asc, func, exists, delete
+from app.models.forum import Forum
 from app.models.forum_membership import ForumMembership, MembershipStatus, MembershipRole
+from app.repositories.pagination import fetch_after
+
+def _adjust_member_count(db: Session, forum_id: int, delta: int) -> None:
+    """Shift a forum's active member counter without committing."""
+    db.query(Forum)\
+        .filter(Forum.id == forum_id)\
+        .update({
+            Forum.member_count: Forum.member_count + delta,
+            Forum.updated_at: Forum.updated_at,  # a counter bump is not an edit
+        })
+
+def _permission_cache(db: Session) -> dict:
+    """Membership checks already answered on this session, which lives for one request."""
+    return db.info.setdefault("membership_checks", {})
+
+def _forget_permissions(db: Session) -> None:
+    """Drop memoized membership checks after a membership or forum write."""
+    db.info.pop("membership_checks", None)
 
 class MembershipRepository:
     @staticmethod
@@ -10,14 +30,17 @@ class MembershipRepository:
         """Create a new forum membership in the database."""
         db_membership = ForumMembership(**kwargs)
         db.add(db_membership)
+        # Memberships are active unless created otherwise
+        if db_membership.status in (None, MembershipStatus.ACTIVE):
+            _adjust_member_count(db, db_membership.forum_id, 1)
         db.commit()
-        db.refresh(db_membership)
+        _forget_permissions(db)
         return db_membership
 
     @staticmethod
     def get_by_id(db: Session, membership_id: int) -> Optional[ForumMembership]:
         """Get a membership by ID."""
-        return db.query(ForumMembership).filter(ForumMembership.id == membership_id).first()
+        return db.get(ForumMembership, membership_id)
 
     @staticmethod
     def get_by_forum_and_user(db: Session, forum_id: int, user_id: int) -> Optional[ForumMembership]:
@@ -27,26 +50,56 @@ class MembershipRepository:
             ForumMembership.user_id == user_id
         ).first()
 
+    @staticmethod
+    def get_by_forum_and_users(db: Session, forum_id: int, user_ids: List[int]) -> Dict[int, ForumMembership]:
+        """Get the memberships of several users in a forum in one query, keyed by user ID."""
+        if not user_ids:
+            return {}
+        memberships = db.query(ForumMembership).filter(
+            ForumMembership.forum_id == forum_id,
+            ForumMembership.user_id.in_(user_ids)
+        ).all()
+        return {membership.user_id: membership for membership in memberships}
+
     @staticmethod
     def update(db: Session, membership: ForumMembership, **kwargs) -> ForumMembership:
         """Update a membership's attributes."""
+        was_active = membership.status == MembershipStatus.ACTIVE
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(membership, key) and value is not None:
+            if hasattr(membership, key) and value is not None and getattr(membership, key) != value:
                 setattr(membership, key, value)
+                changed = True
+        
+        # Nothing differs, so skip the commit and refresh round trips
+        if not changed:
+            return membership
         
+        is_active = membership.status == MembershipStatus.ACTIVE
+        if was_active != is_active:
+            _adjust_member_count(db, membership.forum_id, 1 if is_active else -1)
         db.commit()
+        _forget_permissions(db)
         db.refresh(membership)
         return membership
 
     @staticmethod
     def delete(db: Session, membership_id: int) -> bool:
         """Delete a membership by ID."""
-        membership = db.query(ForumMembership).filter(ForumMembership.id == membership_id).first()
-        if membership:
-            db.delete(membership)
-            db.commit()
-            return True
-        return False
+        # RETURNING hands back what the member counter needs, so no SELECT comes first
+        membership = db.execute(
+            delete(ForumMembership)
+            .where(ForumMembership.id == membership_id)
+            .returning(ForumMembership.forum_id, ForumMembership.status)
+        ).first()
+        if membership is None:
+            return False
+
+        if membership.status == MembershipStatus.ACTIVE:
+            _adjust_member_count(db, membership.forum_id, -1)
+        db.commit()
+        _forget_permissions(db)
+        return True
 
     @staticmethod
     def get_by_forum_id(
@@ -68,6 +121,20 @@ class MembershipRepository:
             
         return query.order_by(asc(ForumMembership.join_date)).offset(skip).limit(limit).all()
 
+    @staticmethod
+    def list_after(
+        db: Session,
+        forum_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+        status: Optional[MembershipStatus] = None
+    ) -> Tuple[List[ForumMembership], Optional[Tuple[datetime, int]]]:
+        """Get a forum's memberships joined before a (join_date, id) cursor, newest first, with the next cursor."""
+        query = db.query(ForumMembership).filter(ForumMembership.forum_id == forum_id)
+        if status:
+            query = query.filter(ForumMembership.status == status)
+        return fetch_after(query, ForumMembership.join_date, ForumMembership.id, cursor, limit)
+
     @staticmethod
     def count_by_forum_id(
         db: Session,
@@ -76,7 +143,7 @@ class MembershipRepository:
         role: Optional[MembershipRole] = None
     ) -> int:
         """Count memberships for a forum."""
-        query = db.query(ForumMembership).filter(ForumMembership.forum_id == forum_id)
+        query = db.query(func.count(ForumMembership.id)).filter(ForumMembership.forum_id == forum_id)
         
         if status:
             query = query.filter(ForumMembership.status == status)
@@ -84,7 +151,7 @@ class MembershipRepository:
         if role:
             query = query.filter(ForumMembership.role == role)
             
-        return query.count()
+        return query.scalar()
 
     @staticmethod
     def get_by_user_id(
@@ -104,22 +171,30 @@ class MembershipRepository:
     @staticmethod
     def is_moderator(db: Session, forum_id: int, user_id: int) -> bool:
         """Check if a user is a moderator of a forum."""
-        membership = db.query(ForumMembership).filter(
-            ForumMembership.forum_id == forum_id,
-            ForumMembership.user_id == user_id,
-            ForumMembership.status == MembershipStatus.ACTIVE,
-            ForumMembership.role == MembershipRole.MODERATOR
-        ).first()
-        
-        return membership is not None
+        cache = _permission_cache(db)
+        key = ("moderator", forum_id, user_id)
+        if key not in cache:
+            cache[key] = db.query(
+                exists().where(
+                    ForumMembership.forum_id == forum_id,
+                    ForumMembership.user_id == user_id,
+                    ForumMembership.status == MembershipStatus.ACTIVE,
+                    ForumMembership.role == MembershipRole.MODERATOR
+                )
+            ).scalar()
+        return cache[key]
 
     @staticmethod
     def is_member(db: Session, forum_id: int, user_id: int) -> bool:
         """Check if a user is a member of a forum."""
-        membership = db.query(ForumMembership).filter(
-            ForumMembership.forum_id == forum_id,
-            ForumMembership.user_id == user_id,
-            ForumMembership.status == MembershipStatus.ACTIVE
-        ).first()
-        
-        return membership is not None
\ No newline at end of file
+        cache = _permission_cache(db)
+        key = ("member", forum_id, user_id)
+        if key not in cache:
+            cache[key] = db.query(
+                exists().where(
+                    ForumMembership.forum_id == forum_id,
+                    ForumMembership.user_id == user_id,
+                    ForumMembership.status == MembershipStatus.ACTIVE
+                )
+            ).scalar()
+        return cache[key]
\ No newline at end of file
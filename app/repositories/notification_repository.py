@@ -1,10 +1,23 @@
 # app/repositories/notification_repository.py
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc
+from sqlalchemy import desc, asc, func, select, update
 from datetime import datetime
 from app.models.notification import Notification, NotificationType
+from app.repositories.pagination import fetch_after
+from app.repositories.updates import update_returning
+from app.repositories.bulk import insert_many
+
+# Column names that update_by_id() may assign, computed once at import
+_NOTIFICATION_COLUMNS = frozenset(Notification.__table__.columns.keys()) - {"id", "created_at"}
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_NOTIFICATION_SORT_COLUMNS = {
+    "created_at": Notification.created_at,
+    "type": Notification.type,
+    "is_read": Notification.is_read,
+}
 
 class NotificationRepository:
     @staticmethod
@@ -13,34 +26,48 @@ class NotificationRepository:
         db_notification = Notification(**kwargs)
         db.add(db_notification)
         db.commit()
-        db.refresh(db_notification)
         return db_notification
 
+    @staticmethod
+    def create_many(db: Session, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert many notifications in one statement and commit once, returning their IDs in row order."""
+        ids = insert_many(db, Notification, rows)
+        db.commit()
+        return ids
+
     @staticmethod
     def get_by_id(db: Session, notification_id: int) -> Optional[Notification]:
         """Get a notification by ID."""
-        return db.query(Notification).filter(Notification.id == notification_id).first()
+        return db.get(Notification, notification_id)
 
     @staticmethod
     def update(db: Session, notification: Notification, **kwargs) -> Notification:
         """Update a notification's attributes."""
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(notification, key) and value is not None:
+            if hasattr(notification, key) and value is not None and getattr(notification, key) != value:
                 setattr(notification, key, value)
+                changed = True
         
-        db.commit()
-        db.refresh(notification)
+        # Nothing differs, so skip the commit and refresh round trips
+        if changed:
+            db.commit()
+            db.refresh(notification)
         return notification
 
+    @staticmethod
+    def update_by_id(db: Session, notification_id: int, **kwargs) -> Optional[Notification]:
+        """Update a notification's attributes with a single UPDATE ... RETURNING."""
+        return update_returning(db, Notification, _NOTIFICATION_COLUMNS, notification_id, **kwargs)
+
     @staticmethod
     def delete(db: Session, notification_id: int) -> bool:
         """Delete a notification by ID."""
-        notification = db.query(Notification).filter(Notification.id == notification_id).first()
-        if notification:
-            db.delete(notification)
-            db.commit()
-            return True
-        return False
+        deleted = db.query(Notification)\
+            .filter(Notification.id == notification_id)\
+            .delete(synchronize_session=False)
+        db.commit()
+        return deleted > 0
 
     @staticmethod
     def get_by_user_id(
@@ -54,23 +81,35 @@ class NotificationRepository:
         sort_desc: bool = True
     ) -> List[Notification]:
         """Get notifications by user ID with filtering and sorting."""
-        query = db.query(Notification).filter(Notification.user_id == user_id)
+        stmt = select(Notification).where(Notification.user_id == user_id)
         
         # Apply filters
         if is_read is not None:
-            query = query.filter(Notification.is_read == is_read)
+            stmt = stmt.where(Notification.is_read == is_read)
             
         if notification_type:
-            query = query.filter(Notification.type == notification_type)
+            stmt = stmt.where(Notification.type == notification_type)
             
         # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Notification, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Notification, sort_by)))
+        sort_column = _NOTIFICATION_SORT_COLUMNS.get(sort_by, Notification.created_at)
+        stmt = stmt.order_by(desc(sort_column) if sort_desc else asc(sort_column))
             
         # Apply pagination
-        return query.offset(skip).limit(limit).all()
+        return db.scalars(stmt.offset(skip).limit(limit)).all()
+
+    @staticmethod
+    def list_after(
+        db: Session,
+        user_id: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        limit: int = 100,
+        is_read: Optional[bool] = None
+    ) -> Tuple[List[Notification], Optional[Tuple[datetime, int]]]:
+        """Get a user's notifications created before a (created_at, id) cursor, with the next cursor."""
+        query = db.query(Notification).filter(Notification.user_id == user_id)
+        if is_read is not None:
+            query = query.filter(Notification.is_read == is_read)
+        return fetch_after(query, Notification.created_at, Notification.id, cursor, limit)
 
     @staticmethod
     def count_by_user_id(
@@ -80,7 +119,7 @@ class NotificationRepository:
         notification_type: Optional[NotificationType] = None
     ) -> int:
         """Count notifications by user ID with filtering."""
-        query = db.query(Notification).filter(Notification.user_id == user_id)
+        query = db.query(func.count(Notification.id)).filter(Notification.user_id == user_id)
         
         # Apply filters
         if is_read is not None:
@@ -89,14 +128,17 @@ class NotificationRepository:
         if notification_type:
             query = query.filter(Notification.type == notification_type)
             
-        return query.count()
+        return query.scalar()
 
     @staticmethod
     def mark_all_as_read(db: Session, user_id: int) -> int:
         """Mark all notifications for a user as read and return count of updated records."""
-        result = db.query(Notification)\
-            .filter(Notification.user_id == user_id, Notification.is_read == False)\
-            .update({Notification.is_read: True})
+        result = db.execute(
+            update(Notification)
+            .where(Notification.user_id == user_id, Notification.is_read == False)
+            .values(is_read=True),
+            execution_options={"synchronize_session": False},
+        )
             
         db.commit()
-        return result
\ No newline at end of file
+        return result.rowcount
\ No newline at end of file
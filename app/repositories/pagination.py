@@ -0,0 +1,31 @@
+# File path: app/repositories/pagination.py
+from typing import Any, List, Optional, Tuple
+from sqlalchemy import func, tuple_
+from sqlalchemy.orm import Query
+
+def fetch_page(query: Query, skip: int, limit: int) -> Tuple[List[Any], int]:
+    """Fetch one page of a query and the total row count in a single round trip."""
+    rows = query.add_columns(func.count().over().label("total")).offset(skip).limit(limit).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+
+    # Past the last page there is no row to carry the window count
+    return [], query.order_by(None).count() if skip > 0 else 0
+
+def fetch_after(
+    query: Query,
+    sort_column: Any,
+    id_column: Any,
+    cursor: Optional[Tuple[Any, int]],
+    limit: int
+) -> Tuple[List[Any], Optional[Tuple[Any, int]]]:
+    """Fetch the rows after a (sort value, id) cursor, newest first, and the cursor for the next page."""
+    if cursor is not None:
+        # Seek past the previous page instead of scanning and discarding it with OFFSET
+        query = query.filter(tuple_(sort_column, id_column) < tuple_(*cursor))
+    items = query.order_by(sort_column.desc(), id_column.desc()).limit(limit).all()
+
+    if len(items) < limit:
+        return items, None
+    last = items[-1]
+    return items, (getattr(last, sort_column.key), getattr(last, id_column.key))
@@ -1,11 +1,39 @@
 # File path: app/repositories/program_repository.py
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, or_
+from typing import List, Optional, Dict, Any, Tuple
+from sqlalchemy.orm import Session, selectinload, contains_eager
+from sqlalchemy import desc, asc, or_, func, update, select, exists
 from app.models.program import Program
 from app.models.user import User
 from app.models.booking import Booking
 from app.models.session import Session
+from app.repositories.filters import apply_filters
+from app.repositories.pagination import fetch_page
+from app.repositories.search import text_search
+from app.repositories.updates import update_returning
+
+# Column names that update_by_id() may assign, computed once at import
+_PROGRAM_COLUMNS = frozenset(Program.__table__.columns.keys()) - {"id", "created_at"}
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_PROGRAM_SORT_COLUMNS = {
+    "name": Program.name,
+    "category": Program.category,
+    "difficulty": Program.difficulty,
+    "duration": Program.duration,
+    "created_at": Program.created_at,
+}
+
+# Filter keys accepted by the list, count and search queries
+_PROGRAM_FILTERS = {
+    "category": (Program.category, "eq"),
+    "difficulty": (Program.difficulty, "eq"),
+    "is_active": (Program.is_active, "flag"),
+    "created_by": (Program.created_by, "eq"),
+    "trainer_id": (Program.created_by, "eq"),
+    "min_duration": (Program.duration, "ge"),
+    "max_duration": (Program.duration, "le"),
+    "search": ((Program.name, Program.description), "ilike_any"),
+}
 
 class ProgramRepository:
     @staticmethod
@@ -14,29 +42,37 @@ class ProgramRepository:
         db_program = Program(**kwargs)
         db.add(db_program)
         db.commit()
-        db.refresh(db_program)
         return db_program
 
     @staticmethod
     def get_by_id(db: Session, program_id: int) -> Optional[Program]:
         """Get a program by ID."""
-        return db.query(Program).filter(Program.id == program_id).first()
+        return db.get(Program, program_id)
 
     @staticmethod
     def update(db: Session, program: Program, **kwargs) -> Program:
         """Update a program's attributes."""
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(program, key) and value is not None:
+            if hasattr(program, key) and value is not None and getattr(program, key) != value:
                 setattr(program, key, value)
+                changed = True
         
-        db.commit()
-        db.refresh(program)
+        # Nothing differs, so skip the commit and refresh round trips
+        if changed:
+            db.commit()
+            db.refresh(program)
         return program
 
+    @staticmethod
+    def update_by_id(db: Session, program_id: int, **kwargs) -> Optional[Program]:
+        """Update a program's attributes with a single UPDATE ... RETURNING."""
+        return update_returning(db, Program, _PROGRAM_COLUMNS, program_id, **kwargs)
+
     @staticmethod
     def delete(db: Session, program_id: int) -> bool:
         """Delete a program by ID."""
-        program = db.query(Program).filter(Program.id == program_id).first()
+        program = db.get(Program, program_id)
         if program:
             db.delete(program)
             db.commit()
@@ -46,13 +82,47 @@ class ProgramRepository:
     @staticmethod
     def deactivate(db: Session, program_id: int) -> Optional[Program]:
         """Deactivate a program by ID."""
-        program = db.query(Program).filter(Program.id == program_id).first()
-        if program:
-            program.is_active = False
-            db.commit()
-            db.refresh(program)
-            return program
-        return None
+        # One UPDATE ... RETURNING instead of loading the row before changing it
+        program = db.scalars(
+            update(Program)
+            .where(Program.id == program_id)
+            .values(is_active=False)
+            .returning(Program)
+        ).one_or_none()
+        db.commit()
+        return program
+
+    @staticmethod
+    def deactivate_many(db: Session, program_ids: List[int]) -> int:
+        """Deactivate many programs with one UPDATE, returning how many rows changed."""
+        if not program_ids:
+            return 0
+        result = db.execute(
+            update(Program)
+            .where(Program.id.in_(program_ids))
+            .values(is_active=False)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+
+    @staticmethod
+    def _list_query(db: Session, filters: Optional[Dict[str, Any]], eager: bool):
+        """Build the filtered program listing query."""
+        query = db.query(Program)
+        
+        # Load creators in one extra query when the caller serializes them
+        if eager:
+            query = query.options(selectinload(Program.creator))
+        
+        # Apply filters
+        return apply_filters(query, filters, _PROGRAM_FILTERS)
+
+    @staticmethod
+    def _sorted(query, sort_by: str, sort_desc: bool):
+        """Apply the requested ordering to a program query."""
+        sort_column = _PROGRAM_SORT_COLUMNS.get(sort_by, Program.created_at)
+        return query.order_by(desc(sort_column) if sort_desc else asc(sort_column))
 
     @staticmethod
     def get_all(
@@ -61,64 +131,38 @@ class ProgramRepository:
         limit: int = 100,
         filters: Optional[Dict[str, Any]] = None,
         sort_by: str = "created_at",
-        sort_desc: bool = True
+        sort_desc: bool = True,
+        eager: bool = False
     ) -> List[Program]:
         """Get all programs with filtering and sorting."""
-        query = db.query(Program)
-        
-        # Apply filters
-        if filters:
-            if "category" in filters and filters["category"]:
-                query = query.filter(Program.category == filters["category"])
-            
-            if "difficulty" in filters and filters["difficulty"]:
-                query = query.filter(Program.difficulty == filters["difficulty"])
-                
-            if "is_active" in filters:
-                query = query.filter(Program.is_active == filters["is_active"])
-                
-            if "created_by" in filters and filters["created_by"]:
-                query = query.filter(Program.created_by == filters["created_by"])
-                
-            if "search" in filters and filters["search"]:
-                search_term = f"%{filters['search']}%"
-                query = query.filter(Program.name.ilike(search_term) | 
-                                     Program.description.ilike(search_term))
-        
-        # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Program, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Program, sort_by)))
-            
-        # Apply pagination
+        query = ProgramRepository._list_query(db, filters, eager)
+        query = ProgramRepository._sorted(query, sort_by, sort_desc)
         return query.offset(skip).limit(limit).all()
 
+    @staticmethod
+    def get_page(
+        db: Session, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "created_at",
+        sort_desc: bool = True,
+        eager: bool = False
+    ) -> Tuple[List[Program], int]:
+        """Get a page of programs together with the total count."""
+        query = ProgramRepository._list_query(db, filters, eager)
+        query = ProgramRepository._sorted(query, sort_by, sort_desc)
+        return fetch_page(query, skip, limit)
+
     @staticmethod
     def count(db: Session, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count programs with applied filters."""
-        query = db.query(Program)
+        query = db.query(func.count(Program.id))
         
         # Apply filters
-        if filters:
-            if "category" in filters and filters["category"]:
-                query = query.filter(Program.category == filters["category"])
-            
-            if "difficulty" in filters and filters["difficulty"]:
-                query = query.filter(Program.difficulty == filters["difficulty"])
-                
-            if "is_active" in filters:
-                query = query.filter(Program.is_active == filters["is_active"])
-                
-            if "created_by" in filters and filters["created_by"]:
-                query = query.filter(Program.created_by == filters["created_by"])
-                
-            if "search" in filters and filters["search"]:
-                search_term = f"%{filters['search']}%"
-                query = query.filter(Program.name.ilike(search_term) | 
-                                     Program.description.ilike(search_term))
+        query = apply_filters(query, filters, _PROGRAM_FILTERS)
         
-        return query.count()
+        return query.scalar()
 
     @staticmethod
     def get_by_user_id(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[Program]:
@@ -129,6 +173,26 @@ class ProgramRepository:
             .limit(limit)\
             .all()
 
+    @staticmethod
+    def _search_query(db: Session, search_term: str, filters: Optional[Dict[str, Any]]):
+        """Build the program search query, joined to the creator for trainer name matches."""
+        # Reuse the joined row as program.creator instead of loading it separately
+        query = db.query(Program)\
+            .join(Program.creator)\
+            .options(contains_eager(Program.creator))
+        
+        # Apply search term
+        if search_term:
+            query = query.filter(
+                or_(
+                    text_search(db, search_term, Program.name, Program.description),
+                    text_search(db, search_term, User.username, User.first_name, User.last_name)
+                )
+            )
+        
+        # Apply filters
+        return apply_filters(query, filters, _PROGRAM_FILTERS)
+
     @staticmethod
     def search_programs(
         db: Session, 
@@ -140,51 +204,25 @@ class ProgramRepository:
         sort_desc: bool = True
     ) -> List[Program]:
         """Search programs by name, description, or trainer name."""
-        # Join with User to search by trainer name
-        query = db.query(Program).join(User, Program.created_by == User.id)
-        
-        # Apply search term
-        if search_term:
-            search_term = f"%{search_term}%"
-            query = query.filter(
-                or_(
-                    Program.name.ilike(search_term),
-                    Program.description.ilike(search_term),
-                    User.username.ilike(search_term),
-                    User.first_name.ilike(search_term),
-                    User.last_name.ilike(search_term)
-                )
-            )
-        
-        # Apply additional filters
-        if filters:
-            if "category" in filters and filters["category"]:
-                query = query.filter(Program.category == filters["category"])
-                
-            if "difficulty" in filters and filters["difficulty"]:
-                query = query.filter(Program.difficulty == filters["difficulty"])
-                
-            if "min_duration" in filters and filters["min_duration"]:
-                query = query.filter(Program.duration >= filters["min_duration"])
-                
-            if "max_duration" in filters and filters["max_duration"]:
-                query = query.filter(Program.duration <= filters["max_duration"])
-                
-            if "trainer_id" in filters and filters["trainer_id"]:
-                query = query.filter(Program.created_by == filters["trainer_id"])
-                
-            if "is_active" in filters:
-                query = query.filter(Program.is_active == filters["is_active"])
-        
-        # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Program, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Program, sort_by)))
-            
-        # Apply pagination
+        query = ProgramRepository._search_query(db, search_term, filters)
+        query = ProgramRepository._sorted(query, sort_by, sort_desc)
         return query.offset(skip).limit(limit).all()
 
+    @staticmethod
+    def search_page(
+        db: Session, 
+        search_term: str,
+        filters: Optional[Dict[str, Any]] = None,
+        skip: int = 0, 
+        limit: int = 10,
+        sort_by: str = "created_at",
+        sort_desc: bool = True
+    ) -> Tuple[List[Program], int]:
+        """Search programs and return one page together with the total match count."""
+        query = ProgramRepository._search_query(db, search_term, filters)
+        query = ProgramRepository._sorted(query, sort_by, sort_desc)
+        return fetch_page(query, skip, limit)
+
     @staticmethod
     def count_search_results(
         db: Session, 
@@ -193,42 +231,21 @@ class ProgramRepository:
     ) -> int:
         """Count the number of programs matching search and filter criteria."""
         # Join with User to search by trainer name
-        query = db.query(Program).join(User, Program.created_by == User.id)
+        query = db.query(func.count(Program.id)).join(User, Program.created_by == User.id)
         
         # Apply search term
         if search_term:
-            search_term = f"%{search_term}%"
             query = query.filter(
                 or_(
-                    Program.name.ilike(search_term),
-                    Program.description.ilike(search_term),
-                    User.username.ilike(search_term),
-                    User.first_name.ilike(search_term),
-                    User.last_name.ilike(search_term)
+                    text_search(db, search_term, Program.name, Program.description),
+                    text_search(db, search_term, User.username, User.first_name, User.last_name)
                 )
             )
         
-        # Apply additional filters
-        if filters:
-            if "category" in filters and filters["category"]:
-                query = query.filter(Program.category == filters["category"])
-                
-            if "difficulty" in filters and filters["difficulty"]:
-                query = query.filter(Program.difficulty == filters["difficulty"])
-                
-            if "min_duration" in filters and filters["min_duration"]:
-                query = query.filter(Program.duration >= filters["min_duration"])
-                
-            if "max_duration" in filters and filters["max_duration"]:
-                query = query.filter(Program.duration <= filters["max_duration"])
-                
-            if "trainer_id" in filters and filters["trainer_id"]:
-                query = query.filter(Program.created_by == filters["trainer_id"])
-                
-            if "is_active" in filters:
-                query = query.filter(Program.is_active == filters["is_active"])
+        # Apply filters
+        query = apply_filters(query, filters, _PROGRAM_FILTERS)
         
-        return query.count()
+        return query.scalar()
 
     @staticmethod
     def get_featured_programs(db: Session, limit: int = 5) -> List[Program]:
@@ -253,38 +270,27 @@ class ProgramRepository:
         This is a simple implementation that recommends programs 
         based on the user's booking history categories and difficulties.
         """
-        # Find categories and difficulties the user has booked before
-        user_bookings = db.query(Booking).filter(Booking.user_id == user_id).all()
-        
-        if not user_bookings:
-            # If no booking history, return featured programs
-            return ProgramRepository.get_featured_programs(db, limit)
-        
-        # Get session IDs from bookings
-        session_ids = [booking.session_id for booking in user_bookings]
-        
-        # Get sessions
-        sessions = db.query(Session).filter(Session.id.in_(session_ids)).all()
+        # Programs the user has booked before, kept in the database as a CTE
+        booked = db.query(Program.id, Program.category, Program.difficulty)\
+            .join(Session, Session.program_id == Program.id)\
+            .join(Booking, Booking.session_id == Session.id)\
+            .filter(Booking.user_id == user_id)\
+            .distinct()\
+            .cte("booked")
         
-        # Get program IDs from sessions
-        program_ids = [session.program_id for session in sessions]
-        
-        # Get programs
-        booked_programs = db.query(Program).filter(Program.id.in_(program_ids)).all()
-        
-        # Extract categories and difficulties
-        categories = set(program.category for program in booked_programs)
-        difficulties = set(program.difficulty for program in booked_programs)
-        
-        # Find similar programs the user hasn't booked yet
-        query = db.query(Program)\
+        # Find similar programs the user hasn't booked yet with an anti-join instead of an IN list
+        programs = db.query(Program)\
+            .outerjoin(booked, booked.c.id == Program.id)\
+            .filter(booked.c.id.is_(None))\
             .filter(Program.is_active == True)\
-            .filter(Program.id.notin_(program_ids))
-        
-        if categories:
-            query = query.filter(Program.category.in_(categories))
+            .filter(Program.category.in_(select(booked.c.category)))\
+            .filter(Program.difficulty.in_(select(booked.c.difficulty)))\
+            .order_by(desc(Program.created_at))\
+            .limit(limit)\
+            .all()
         
-        if difficulties:
-            query = query.filter(Program.difficulty.in_(difficulties))
+        if not programs and not db.query(exists().where(Booking.user_id == user_id)).scalar():
+            # If no booking history, return featured programs
+            return ProgramRepository.get_featured_programs(db, limit)
         
-        return query.order_by(desc(Program.created_at)).limit(limit).all()
\ No newline at end of file
+        return programs
\ No newline at end of file
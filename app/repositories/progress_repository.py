@@ -1,10 +1,24 @@
 # app/repositories/progress_repository.py
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, func
+from sqlalchemy import desc, asc, func, select, cast, case, Date
 from datetime import datetime, timedelta
 from app.models.progress import Progress
 
+# SQLite expressions equivalent to date_trunc for each supported bucket width
+_SQLITE_BUCKETS = {
+    "day": lambda column: func.date(column),
+    "week": lambda column: func.date(column, "weekday 0", "-6 days"),
+    "month": lambda column: func.strftime("%Y-%m-01", column),
+}
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_PROGRESS_SORT_COLUMNS = {
+    "date": Progress.date,
+    "value": Progress.value,
+    "created_at": Progress.created_at,
+}
+
 class ProgressRepository:
     @staticmethod
     def create(db: Session, **kwargs) -> Progress:
@@ -12,13 +26,12 @@ class ProgressRepository:
         db_progress = Progress(**kwargs)
         db.add(db_progress)
         db.commit()
-        db.refresh(db_progress)
         return db_progress
 
     @staticmethod
     def get_by_id(db: Session, progress_id: int) -> Optional[Progress]:
         """Get a progress entry by ID."""
-        return db.query(Progress).filter(Progress.id == progress_id).first()
+        return db.get(Progress, progress_id)
 
     @staticmethod
     def update(db: Session, progress: Progress, **kwargs) -> Progress:
@@ -34,12 +47,11 @@ class ProgressRepository:
     @staticmethod
     def delete(db: Session, progress_id: int) -> bool:
         """Delete a progress entry by ID."""
-        progress = db.query(Progress).filter(Progress.id == progress_id).first()
-        if progress:
-            db.delete(progress)
-            db.commit()
-            return True
-        return False
+        deleted = db.query(Progress)\
+            .filter(Progress.id == progress_id)\
+            .delete(synchronize_session=False)
+        db.commit()
+        return deleted > 0
 
     @staticmethod
     def get_by_goal_id(
@@ -54,10 +66,8 @@ class ProgressRepository:
         query = db.query(Progress).filter(Progress.goal_id == goal_id)
         
         # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Progress, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Progress, sort_by)))
+        sort_column = _PROGRESS_SORT_COLUMNS.get(sort_by, Progress.date)
+        query = query.order_by(desc(sort_column) if sort_desc else asc(sort_column))
             
         # Apply pagination
         return query.offset(skip).limit(limit).all()
@@ -76,11 +86,61 @@ class ProgressRepository:
             .first()
 
     @staticmethod
-    def get_progress_trend(db: Session, goal_id: int, days: int = 30) -> List[Progress]:
-        """Get progress trend for the last X days."""
+    def get_progress_trend(
+        db: Session, goal_id: int, days: int = 30, bucket: str = "day"
+    ) -> List[Any]:
+        """Get progress trend for the last X days, aggregated per day, week or month."""
         date_threshold = datetime.now() - timedelta(days=days)
+        if bucket not in _SQLITE_BUCKETS:
+            bucket = "day"
         
-        return db.query(Progress)\
-            .filter(Progress.goal_id == goal_id, Progress.date >= date_threshold)\
-            .order_by(asc(Progress.date))\
-            .all()
\ No newline at end of file
+        if db.get_bind().dialect.name == "postgresql":
+            bucket_start = func.date_trunc(bucket, Progress.date)
+        else:
+            bucket_start = _SQLITE_BUCKETS[bucket](Progress.date)
+        bucket_start = bucket_start.label("bucket")
+        
+        # One row per bucket instead of every sample in the window
+        return db.query(
+            bucket_start,
+            func.avg(Progress.value).label("average"),
+            func.max(Progress.value).label("maximum"),
+            func.count(Progress.id).label("count")
+        ).filter(Progress.goal_id == goal_id, Progress.date >= date_threshold)\
+            .group_by(bucket_start)\
+            .order_by(bucket_start)\
+            .all()
+
+    @staticmethod
+    def get_max_day_streak(db: Session, goal_id: int) -> int:
+        """Get the longest run of entries on consecutive days for a goal, computed in SQL.
+
+        As with the entry-by-entry walk this replaces, a second entry on the same day ends the run.
+        """
+        if db.get_bind().dialect.name == "postgresql":
+            day_number = cast(Progress.date, Date)
+        else:
+            day_number = func.julianday(func.date(Progress.date))
+        entry_order = (Progress.date, Progress.id)
+        
+        # An entry continues the run only when it falls exactly one day after the previous entry
+        steps = select(
+            case(
+                (day_number - func.lag(day_number).over(order_by=entry_order) == 1, 0),
+                else_=1,
+            ).label("starts_run"),
+            Progress.date,
+            Progress.id,
+        ).where(Progress.goal_id == goal_id).subquery()
+        # A running count of run starts numbers each run, without the collisions of day minus row number
+        runs = select(
+            func.sum(steps.c.starts_run).over(
+                order_by=(steps.c.date, steps.c.id), rows=(None, 0)
+            ).label("run_id")
+        ).subquery()
+        run_lengths = select(func.count().label("length"))\
+            .select_from(runs)\
+            .group_by(runs.c.run_id)\
+            .subquery()
+        
+        return db.scalar(select(func.max(run_lengths.c.length))) or 0
\ No newline at end of file
@@ -1,10 +1,17 @@
 # File path: app/repositories/review_repository.py
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, func
+from sqlalchemy import desc, asc, func, delete
 from app.models.review import Review
 from app.models.program import Program
 from app.models.user import User
+from app.repositories.pagination import fetch_page
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_REVIEW_SORT_COLUMNS = {
+    "rating": Review.rating,
+    "created_at": Review.created_at,
+}
 
 class ReviewRepository:
     @staticmethod
@@ -12,14 +19,21 @@ class ReviewRepository:
         """Create a new review in the database."""
         db_review = Review(**kwargs)
         db.add(db_review)
+        # Keep the program's rating rollup in the same transaction
+        db.query(Program)\
+            .filter(Program.id == db_review.program_id)\
+            .update({
+                Program.rating_sum: Program.rating_sum + db_review.rating,
+                Program.rating_count: Program.rating_count + 1,
+                Program.updated_at: Program.updated_at,  # a rating change is not a program edit
+            })
         db.commit()
-        db.refresh(db_review)
         return db_review
 
     @staticmethod
     def get_by_id(db: Session, review_id: int) -> Optional[Review]:
         """Get a review by ID."""
-        return db.query(Review).filter(Review.id == review_id).first()
+        return db.get(Review, review_id)
 
     @staticmethod
     def get_by_user_program(db: Session, user_id: int, program_id: int) -> Optional[Review]:
@@ -32,10 +46,18 @@ class ReviewRepository:
     @staticmethod
     def update(db: Session, review: Review, **kwargs) -> Review:
         """Update a review's attributes."""
+        previous_rating = review.rating
         for key, value in kwargs.items():
             if hasattr(review, key) and value is not None:
                 setattr(review, key, value)
         
+        if review.rating != previous_rating:
+            db.query(Program)\
+                .filter(Program.id == review.program_id)\
+                .update({
+                    Program.rating_sum: Program.rating_sum + (review.rating - previous_rating),
+                    Program.updated_at: Program.updated_at,
+                })
         db.commit()
         db.refresh(review)
         return review
@@ -43,12 +65,30 @@ class ReviewRepository:
     @staticmethod
     def delete(db: Session, review_id: int) -> bool:
         """Delete a review by ID."""
-        review = db.query(Review).filter(Review.id == review_id).first()
-        if review:
-            db.delete(review)
-            db.commit()
-            return True
-        return False
+        # RETURNING hands back what the rating rollup needs without a SELECT first
+        review = db.execute(
+            delete(Review)
+            .where(Review.id == review_id)
+            .returning(Review.program_id, Review.rating)
+        ).first()
+        if review is None:
+            return False
+
+        db.query(Program)\
+            .filter(Program.id == review.program_id)\
+            .update({
+                Program.rating_sum: Program.rating_sum - review.rating,
+                Program.rating_count: Program.rating_count - 1,
+                Program.updated_at: Program.updated_at,
+            })
+        db.commit()
+        return True
+
+    @staticmethod
+    def _sorted(query, sort_by: str, sort_desc: bool):
+        """Apply the requested ordering to a review query."""
+        sort_column = _REVIEW_SORT_COLUMNS.get(sort_by, Review.created_at)
+        return query.order_by(desc(sort_column) if sort_desc else asc(sort_column))
 
     @staticmethod
     def get_by_program_id(
@@ -61,16 +101,23 @@ class ReviewRepository:
     ) -> List[Review]:
         """Get all reviews for a program."""
         query = db.query(Review).filter(Review.program_id == program_id)
-        
-        # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Review, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Review, sort_by)))
-            
-        # Apply pagination
+        query = ReviewRepository._sorted(query, sort_by, sort_desc)
         return query.offset(skip).limit(limit).all()
 
+    @staticmethod
+    def get_page_by_program_id(
+        db: Session, 
+        program_id: int, 
+        skip: int = 0, 
+        limit: int = 10,
+        sort_by: str = "created_at",
+        sort_desc: bool = True
+    ) -> Tuple[List[Review], int]:
+        """Get a page of a program's reviews together with the total count."""
+        query = db.query(Review).filter(Review.program_id == program_id)
+        query = ReviewRepository._sorted(query, sort_by, sort_desc)
+        return fetch_page(query, skip, limit)
+
     @staticmethod
     def count_by_program_id(db: Session, program_id: int) -> int:
         """Count reviews for a program."""
@@ -80,28 +127,26 @@ class ReviewRepository:
     def get_program_rating(db: Session, program_id: int) -> Tuple[Optional[float], int]:
         """Get average rating and count of reviews for a program."""
         result = db.query(
-            func.avg(Review.rating).label("average"),
-            func.count(Review.id).label("count")
-        ).filter(Review.program_id == program_id).first()
+            (Program.rating_sum / func.nullif(Program.rating_count, 0)).label("average"),
+            Program.rating_count.label("count")
+        ).filter(Program.id == program_id).first()
         
+        if result is None:
+            return None, 0
         return result.average, result.count
 
     @staticmethod
     def get_trainer_rating(db: Session, trainer_id: int) -> Tuple[Optional[float], int, int]:
         """Get average rating, count of reviews, and count of programs for a trainer."""
-        # Get all programs by the trainer
-        program_subquery = db.query(Program.id).filter(Program.created_by == trainer_id).subquery()
-        
-        # Calculate average rating and count from reviews that match those programs
+        # One aggregate over the trainer's program rollups instead of a join to reviews
+        total_count = func.sum(Program.rating_count)
         result = db.query(
-            func.avg(Review.rating).label("average"),
-            func.count(Review.id).label("count")
-        ).filter(Review.program_id.in_(program_subquery)).first()
-        
-        # Count total programs by the trainer
-        program_count = db.query(Program).filter(Program.created_by == trainer_id).count()
+            (func.sum(Program.rating_sum) / func.nullif(total_count, 0)).label("average"),
+            func.coalesce(total_count, 0).label("count"),
+            func.count(Program.id).label("program_count")
+        ).filter(Program.created_by == trainer_id).one()
         
-        return result.average, result.count, program_count
+        return result.average, result.count, result.program_count
 
     @staticmethod
     def get_by_user_id(
@@ -121,4 +166,17 @@ class ReviewRepository:
     @staticmethod
     def count_by_user_id(db: Session, user_id: int) -> int:
         """Count reviews by a user."""
-        return db.query(Review).filter(Review.user_id == user_id).count()
\ No newline at end of file
+        return db.query(Review).filter(Review.user_id == user_id).count()
+
+    @staticmethod
+    def get_page_by_user_id(
+        db: Session, 
+        user_id: int, 
+        skip: int = 0, 
+        limit: int = 10
+    ) -> Tuple[List[Review], int]:
+        """Get a page of a user's reviews together with the total count."""
+        query = db.query(Review)\
+            .filter(Review.user_id == user_id)\
+            .order_by(desc(Review.created_at))
+        return fetch_page(query, skip, limit)
\ No newline at end of file
@@ -0,0 +1,19 @@
+# File path: app/repositories/search.py
+from sqlalchemy import String, func, literal_column, or_
+from sqlalchemy.orm import Session
+
+def text_search(db: Session, term: str, *columns):
+    """Build a search clause matching term against the given text columns."""
+    if db.get_bind().dialect.name == "postgresql":
+        # Rendered inline so it matches the expression behind the GIN indexes created in migrations
+        empty = literal_column("''", String)
+        space = literal_column("' '", String)
+        document = func.coalesce(columns[0], empty)
+        for column in columns[1:]:
+            document = document + space + func.coalesce(column, empty)
+        english = literal_column("'english'")
+        return func.to_tsvector(english, document).op("@@")(func.plainto_tsquery(english, term))
+
+    # Other backends fall back to substring matching
+    search_term = f"%{term}%"
+    return or_(*(column.ilike(search_term) for column in columns))
@@ -1,8 +1,30 @@
 # File path: app/repositories/session_repository.py
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session as DbSession
-from sqlalchemy import desc, asc
+from sqlalchemy import desc, asc, update
 from app.models.session import Session
+from app.repositories.filters import apply_filters
+from app.repositories.pagination import fetch_page
+
+# Columns list endpoints may sort by; anything else falls back to the default
+_SESSION_SORT_COLUMNS = {
+    "title": Session.title,
+    "start_time": Session.start_time,
+    "end_time": Session.end_time,
+    "price": Session.price,
+    "available_slots": Session.available_slots,
+}
+
+# Filter keys accepted by the program and trainer session listings
+_SESSION_FILTERS = {
+    "is_cancelled": (Session.is_cancelled, "flag"),
+    "program_id": (Session.program_id, "eq"),
+    "trainer_id": (Session.trainer_id, "eq"),
+    "start_date": (Session.start_time, "ge"),
+    "end_date": (Session.end_time, "le"),
+    "has_available_slots": (Session.available_slots, "positive"),
+    "search": ((Session.title, Session.description), "ilike_any"),
+}
 
 class SessionRepository:
     @staticmethod
@@ -15,13 +37,12 @@ class SessionRepository:
         db_session = Session(**kwargs)
         db.add(db_session)
         db.commit()
-        db.refresh(db_session)
         return db_session
 
     @staticmethod
     def get_by_id(db: DbSession, session_id: int) -> Optional[Session]:
         """Get a session by ID."""
-        return db.query(Session).filter(Session.id == session_id).first()
+        return db.get(Session, session_id)
 
     @staticmethod
     def update(db: DbSession, session: Session, **kwargs) -> Session:
@@ -50,7 +71,7 @@ class SessionRepository:
     @staticmethod
     def delete(db: DbSession, session_id: int) -> bool:
         """Delete a session by ID."""
-        session = db.query(Session).filter(Session.id == session_id).first()
+        session = db.get(Session, session_id)
         if session:
             db.delete(session)
             db.commit()
@@ -60,13 +81,64 @@ class SessionRepository:
     @staticmethod
     def cancel(db: DbSession, session_id: int) -> Optional[Session]:
         """Cancel a session by ID."""
-        session = db.query(Session).filter(Session.id == session_id).first()
-        if session:
-            session.is_cancelled = True
-            db.commit()
-            db.refresh(session)
-            return session
-        return None
+        # One UPDATE ... RETURNING instead of loading the row before changing it
+        session = db.scalars(
+            update(Session)
+            .where(Session.id == session_id)
+            .values(is_cancelled=True)
+            .returning(Session)
+        ).one_or_none()
+        db.commit()
+        return session
+
+    @staticmethod
+    def cancel_many(db: DbSession, session_ids: List[int]) -> int:
+        """Cancel many sessions with one UPDATE, returning how many rows changed."""
+        if not session_ids:
+            return 0
+        result = db.execute(
+            update(Session)
+            .where(Session.id.in_(session_ids))
+            .values(is_cancelled=True)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        return result.rowcount
+
+    @staticmethod
+    def reserve_slot(db: DbSession, session_id: int) -> bool:
+        """Take one slot of an open session in a single conditional UPDATE, without committing."""
+        result = db.execute(
+            update(Session)
+            .where(
+                Session.id == session_id,
+                Session.available_slots > 0,
+                Session.is_cancelled == False
+            )
+            .values(available_slots=Session.available_slots - 1)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    @staticmethod
+    def release_slot(db: DbSession, session_id: int) -> None:
+        """Give one slot back to an open session in a single UPDATE, without committing."""
+        db.execute(
+            update(Session)
+            .where(
+                Session.id == session_id,
+                Session.is_cancelled == False,
+                Session.available_slots < Session.total_slots
+            )
+            .values(available_slots=Session.available_slots + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _sorted(query, sort_by: str, sort_desc: bool):
+        """Apply the requested ordering to a session query."""
+        sort_column = _SESSION_SORT_COLUMNS.get(sort_by, Session.start_time)
+        return query.order_by(desc(sort_column) if sort_desc else asc(sort_column))
 
     @staticmethod
     def get_by_program_id(
@@ -82,36 +154,26 @@ class SessionRepository:
         query = db.query(Session).filter(Session.program_id == program_id)
         
         # Apply filters
-        if filters:
-            if "is_cancelled" in filters:
-                query = query.filter(Session.is_cancelled == filters["is_cancelled"])
-                
-            if "trainer_id" in filters and filters["trainer_id"]:
-                query = query.filter(Session.trainer_id == filters["trainer_id"])
-                
-            if "start_date" in filters and filters["start_date"]:
-                query = query.filter(Session.start_time >= filters["start_date"])
-                
-            if "end_date" in filters and filters["end_date"]:
-                query = query.filter(Session.end_time <= filters["end_date"])
-                
-            if "has_available_slots" in filters and filters["has_available_slots"]:
-                query = query.filter(Session.available_slots > 0)
-                
-            if "search" in filters and filters["search"]:
-                search_term = f"%{filters['search']}%"
-                query = query.filter(Session.title.ilike(search_term) | 
-                                     Session.description.ilike(search_term))
-        
-        # Apply sorting
-        if sort_desc:
-            query = query.order_by(desc(getattr(Session, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(Session, sort_by)))
-            
-        # Apply pagination
+        query = apply_filters(query, filters, _SESSION_FILTERS)
+        query = SessionRepository._sorted(query, sort_by, sort_desc)
         return query.offset(skip).limit(limit).all()
 
+    @staticmethod
+    def get_page_by_program_id(
+        db: DbSession, 
+        program_id: int, 
+        skip: int = 0, 
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        sort_by: str = "start_time",
+        sort_desc: bool = False
+    ) -> Tuple[List[Session], int]:
+        """Get a page of a program's sessions together with the total count."""
+        query = db.query(Session).filter(Session.program_id == program_id)
+        query = apply_filters(query, filters, _SESSION_FILTERS)
+        query = SessionRepository._sorted(query, sort_by, sort_desc)
+        return fetch_page(query, skip, limit)
+
     @staticmethod
     def count_by_program_id(
         db: DbSession, 
@@ -122,26 +184,7 @@ class SessionRepository:
         query = db.query(Session).filter(Session.program_id == program_id)
         
         # Apply filters
-        if filters:
-            if "is_cancelled" in filters:
-                query = query.filter(Session.is_cancelled == filters["is_cancelled"])
-                
-            if "trainer_id" in filters and filters["trainer_id"]:
-                query = query.filter(Session.trainer_id == filters["trainer_id"])
-                
-            if "start_date" in filters and filters["start_date"]:
-                query = query.filter(Session.start_time >= filters["start_date"])
-                
-            if "end_date" in filters and filters["end_date"]:
-                query = query.filter(Session.end_time <= filters["end_date"])
-                
-            if "has_available_slots" in filters and filters["has_available_slots"]:
-                query = query.filter(Session.available_slots > 0)
-                
-            if "search" in filters and filters["search"]:
-                search_term = f"%{filters['search']}%"
-                query = query.filter(Session.title.ilike(search_term) | 
-                                     Session.description.ilike(search_term))
+        query = apply_filters(query, filters, _SESSION_FILTERS)
                 
         return query.count()
 
@@ -156,21 +199,7 @@ class SessionRepository:
         """Get sessions by trainer ID with filtering."""
         query = db.query(Session).filter(Session.trainer_id == trainer_id)
         
-        # Apply filters (similar to get_by_program_id)
-        if filters:
-            if "is_cancelled" in filters:
-                query = query.filter(Session.is_cancelled == filters["is_cancelled"])
-                
-            if "program_id" in filters and filters["program_id"]:
-                query = query.filter(Session.program_id == filters["program_id"])
-                
-            if "start_date" in filters and filters["start_date"]:
-                query = query.filter(Session.start_time >= filters["start_date"])
-                
-            if "end_date" in filters and filters["end_date"]:
-                query = query.filter(Session.end_time <= filters["end_date"])
-                
-            if "has_available_slots" in filters and filters["has_available_slots"]:
-                query = query.filter(Session.available_slots > 0)
+        # Apply filters
+        query = apply_filters(query, filters, _SESSION_FILTERS)
                 
         return query.order_by(asc(Session.start_time)).offset(skip).limit(limit).all()
\ No newline at end of file
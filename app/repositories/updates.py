@@ -0,0 +1,33 @@
+# File path: app/repositories/updates.py
+from typing import Any, FrozenSet, Optional, Type
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+def update_returning(
+    db: Session,
+    model: Type[Any],
+    columns: FrozenSet[str],
+    row_id: int,
+    **kwargs
+) -> Optional[Any]:
+    """Update the changed, allowed columns of one row with a single UPDATE ... RETURNING and commit."""
+    # Callers load the row for permission checks, so this is an identity map hit
+    current = db.get(model, row_id)
+    if current is None:
+        return None
+
+    values = {
+        key: value for key, value in kwargs.items()
+        if value is not None and key in columns and getattr(current, key) != value
+    }
+    if not values:
+        return current
+
+    row = db.scalars(
+        update(model)
+        .where(model.id == row_id)
+        .values(**values)
+        .returning(model)
+    ).one_or_none()
+    db.commit()
+    return row
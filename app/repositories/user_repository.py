@@ -1,4 +1,5 @@
-from typing import Optional
+from typing import List, Optional, Tuple
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.models.user import User, UserRole
@@ -28,13 +29,12 @@ class UserRepository:
         )
         db.add(db_user)
         db.commit()
-        db.refresh(db_user)
         return db_user
 
     @staticmethod
     def get_by_id(db: Session, user_id: int) -> Optional[User]:
         """Get a user by ID."""
-        return db.query(User).filter(User.id == user_id).first()
+        return db.get(User, user_id)
 
     @staticmethod
     def get_by_username(db: Session, username: str) -> Optional[User]:
@@ -46,21 +46,35 @@ class UserRepository:
         """Get a user by email."""
         return db.query(User).filter(User.email == email).first()
 
+    @staticmethod
+    def get_taken_credentials(db: Session, username: str, email: str) -> List[Tuple[str, str]]:
+        """Get the (username, email) of any users already holding either value, in one query."""
+        return db.query(User.username, User.email)\
+            .filter(or_(User.username == username, User.email == email))\
+            .all()
+
     @staticmethod
     def update(db: Session, user: User, **kwargs) -> User:
         """Update a user's attributes."""
+        changed = False
         for key, value in kwargs.items():
-            if hasattr(user, key) and value is not None:
+            # Passwords go through change_password so they are always hashed, and only when they change
+            if key == "password":
+                continue
+            if hasattr(user, key) and value is not None and getattr(user, key) != value:
                 setattr(user, key, value)
+                changed = True
         
-        db.commit()
-        db.refresh(user)
+        # Nothing differs, so skip the commit and refresh round trips
+        if changed:
+            db.commit()
+            db.refresh(user)
         return user
 
     @staticmethod
     def delete(db: Session, user_id: int) -> bool:
         """Delete a user by ID."""
-        user = db.query(User).filter(User.id == user_id).first()
+        user = db.get(User, user_id)
         if user:
             db.delete(user)
             db.commit()
@@ -1,19 +1,26 @@
 # app/services/achievement_service.py
 
-from typing import List, Optional, Dict, Any
-from fastapi import HTTPException, status
+from typing import List, Optional, Dict, Any, Set
+from fastapi import BackgroundTasks, HTTPException, status
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
+from math import sqrt
+from statistics import fmean
 
+from app.core.cache import TTLCache
 from app.models.user import User
 from app.models.goal import Goal, GoalStatus, GoalType
 from app.models.achievement import Achievement
 from app.repositories.goal_repository import GoalRepository
 from app.repositories.achievement_repository import AchievementRepository
 from app.repositories.progress_repository import ProgressRepository
+from app.repositories.notification_repository import NotificationRepository
 from app.services.notification_service import NotificationService
 from app.models.notification import NotificationType
 
+# Titles each user holds; a cached title is trusted, a missing one is rechecked in the database
+_achievement_titles_cache = TTLCache(ttl=300, maxsize=1024)
+
 class AchievementService:
     # Define achievement types
     ACHIEVEMENT_FIRST_GOAL = "First Goal Completed"
@@ -23,6 +30,68 @@ class AchievementService:
     ACHIEVEMENT_MULTIPLE = "Multiple Goals Master"
     ACHIEVEMENT_CATEGORY = "Category Expert"
     
+    # Goal-completion awards as (predicate over the completion context, linked to the goal, award)
+    _GOAL_COMPLETION_RULES = [
+        (
+            lambda ctx: ctx["completed_count"] == 1,
+            True,
+            {
+                "title": ACHIEVEMENT_FIRST_GOAL,
+                "description": "Completed your first goal. The journey of a thousand miles begins with a single step!",
+                "badge_url": "/badges/first_goal.png",
+            },
+        ),
+        (
+            lambda ctx: ctx["completed_count"] == 5,
+            False,
+            {
+                "title": ACHIEVEMENT_MULTIPLE,
+                "description": "Completed 5 goals. You're on a roll!",
+                "badge_url": "/badges/multiple_goals.png",
+            },
+        ),
+        (
+            lambda ctx: ctx["completed_count"] == 10,
+            False,
+            {
+                "title": "Goal Master",
+                "description": "Completed 10 goals. You're a master of achievement!",
+                "badge_url": "/badges/goal_master.png",
+            },
+        ),
+    ] + [
+        (
+            lambda ctx, category=category: ctx["category_counts"].get(category) == 3,
+            False,
+            {
+                "title": f"{category.value} Expert",
+                "description": f"Completed 3 goals in the {category.value} category. You're becoming an expert!",
+                "badge_url": f"/badges/{category.value.lower()}_expert.png",
+            },
+        )
+        for category in GoalType
+    ] + [
+        (
+            # Completed at least 3 days ahead of schedule
+            lambda ctx: ctx["days_early"] is not None and ctx["days_early"] > 3,
+            True,
+            {
+                "title": ACHIEVEMENT_AHEAD,
+                "description": "Completed a goal well ahead of schedule. Great planning and execution!",
+                "badge_url": "/badges/ahead_of_schedule.png",
+            },
+        ),
+        (
+            lambda ctx: ctx["consistent"],
+            True,
+            {
+                "title": ACHIEVEMENT_CONSISTENCY,
+                "description": "Consistently tracked progress toward your goal. Consistency is key to success!",
+                "badge_url": "/badges/consistency.png",
+            },
+        ),
+    ]
+    
     @staticmethod
     def get_achievement(db: Session, achievement_id: int) -> Achievement:
         """Get an achievement by ID."""
@@ -38,19 +107,18 @@ class AchievementService:
     @staticmethod
     def get_achievement_with_details(db: Session, achievement_id: int) -> Dict[str, Any]:
         """Get an achievement by ID with additional details."""
-        achievement = AchievementService.get_achievement(db, achievement_id)
-        
-        # Get the goal if it exists
-        goal_title = None
-        if achievement.goal_id:
-            goal = GoalRepository.get_by_id(db, achievement.goal_id)
-            if goal:
-                goal_title = goal.title
+        # The goal is joined into the same SELECT as the achievement
+        achievement = AchievementRepository.get_by_id_with_goal(db, achievement_id)
+        if not achievement:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Achievement not found",
+            )
         
         # Build enhanced response
         result = {
             **achievement.__dict__,
-            "goal_title": goal_title
+            "goal_title": achievement.goal.title if achievement.goal else None
         }
         
         return result
@@ -65,12 +133,10 @@ class AchievementService:
         sort_desc: bool = True,
     ) -> Dict[str, Any]:
         """Get all achievements for a user with pagination and sorting."""
-        achievements = AchievementRepository.get_by_user_id(
+        achievements, total = AchievementRepository.get_page_by_user_id(
             db, user_id, skip=skip, limit=limit, sort_by=sort_by, sort_desc=sort_desc
         )
         
-        total = AchievementRepository.count_by_user_id(db, user_id)
-        
         return {
             "items": achievements,
             "total": total,
@@ -79,6 +145,18 @@ class AchievementService:
             "pages": (total + limit - 1) // limit if limit > 0 else 1,
         }
 
+    @staticmethod
+    def _has_achievement(db: Session, user_id: int, title: str) -> bool:
+        """Check whether a user holds an achievement, answering repeat positives from the title cache."""
+        titles = _achievement_titles_cache.get(user_id)
+        if titles is None:
+            titles = frozenset(AchievementRepository.get_titles_by_user_id(db, user_id))
+            _achievement_titles_cache.set(user_id, titles)
+            return title in titles
+        
+        # Another worker may have awarded it since the titles were cached
+        return title in titles or AchievementRepository.check_achievement_exists(db, user_id, title)
+
     @staticmethod
     def create_achievement(
         db: Session,
@@ -87,11 +165,12 @@ class AchievementService:
         description: str,
         goal_id: Optional[int] = None,
         badge_url: Optional[str] = None,
-        is_system: bool = True
+        is_system: bool = True,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> Achievement:
         """Create a new achievement for a user."""
         # Check if achievement already exists
-        if AchievementRepository.check_achievement_exists(db, user_id, title):
+        if AchievementService._has_achievement(db, user_id, title):
             return None  # User already has this achievement
         
         # Create the achievement
@@ -105,154 +184,129 @@ class AchievementService:
             is_system=is_system,
             achieved_date=datetime.now()
         )
+        _achievement_titles_cache.delete(user_id)
         
         # Create a notification for the achievement
-        NotificationService.create_notification(
-            db=db,
+        notification = dict(
             user_id=user_id,
             title="Achievement Unlocked!",
             content=f"Congratulations! You've earned the '{title}' achievement",
             type=NotificationType.ACHIEVEMENT_UNLOCKED,
             achievement_id=achievement.id
         )
+        if background_tasks is not None:
+            # Written after the response is sent, so the award doesn't wait on it
+            background_tasks.add_task(NotificationService.create_notification_detached, **notification)
+        else:
+            NotificationService.create_notification(db=db, **notification)
         
         return achievement
 
     @staticmethod
-    def check_goal_completion_achievements(db: Session, user_id: int, goal_id: int) -> None:
-        """Check and award achievements when a goal is completed."""
-        # Get the completed goal
-        goal = GoalRepository.get_by_id(db, goal_id)
-        if not goal or goal.status != GoalStatus.COMPLETED:
+    def _award_achievements(
+        db: Session,
+        user_id: int,
+        candidates: List[Dict[str, Any]],
+        existing_titles: Set[str],
+        background_tasks: Optional[BackgroundTasks] = None
+    ) -> None:
+        """Award the candidate achievements the user doesn't hold yet, with one insert for all of them."""
+        new_awards = [award for award in candidates if award["title"] not in existing_titles]
+        if not new_awards:
             return
         
-        # Get all user's completed goals
-        completed_goals = GoalRepository.get_by_user_id(
-            db, 
-            user_id, 
-            filters={"status": GoalStatus.COMPLETED}
-        )
+        achieved_date = datetime.now()
+        achievement_ids = AchievementRepository.create_many(db, [
+            {
+                "user_id": user_id,
+                "goal_id": award.get("goal_id"),
+                "title": award["title"],
+                "description": award["description"],
+                "badge_url": award["badge_url"],
+                "is_system": True,
+                "achieved_date": achieved_date,
+            }
+            for award in new_awards
+        ])
+        _achievement_titles_cache.delete(user_id)
         
-        # First goal achievement
-        if len(completed_goals) == 1:
-            AchievementService.create_achievement(
-                db=db,
-                user_id=user_id,
-                title=AchievementService.ACHIEVEMENT_FIRST_GOAL,
-                description="Completed your first goal. The journey of a thousand miles begins with a single step!",
-                goal_id=goal_id,
-                badge_url="/badges/first_goal.png"
-            )
+        # One notification per award, also written in a single insert
+        notifications = [
+            {
+                "user_id": user_id,
+                "title": "Achievement Unlocked!",
+                "content": f"Congratulations! You've earned the '{award['title']}' achievement",
+                "type": NotificationType.ACHIEVEMENT_UNLOCKED,
+                "achievement_id": achievement_id,
+                "is_read": False,
+            }
+            for award, achievement_id in zip(new_awards, achievement_ids)
+        ]
+        if background_tasks is not None:
+            background_tasks.add_task(NotificationService.create_notifications_detached, notifications)
+        else:
+            NotificationRepository.create_many(db, notifications)
+
+    @staticmethod
+    def _is_progress_consistent(progress_entries: List) -> bool:
+        """Check whether progress was recorded regularly, given entries in date order."""
+        if len(progress_entries) < 5:  # Need at least 5 entries to check consistency
+            return False
         
-        # Multiple goals achievement
-        if len(completed_goals) == 5:
-            AchievementService.create_achievement(
-                db=db,
-                user_id=user_id,
-                title=AchievementService.ACHIEVEMENT_MULTIPLE,
-                description="Completed 5 goals. You're on a roll!",
-                badge_url="/badges/multiple_goals.png"
-            )
-        elif len(completed_goals) == 10:
-            AchievementService.create_achievement(
-                db=db,
-                user_id=user_id,
-                title="Goal Master",
-                description="Completed 10 goals. You're a master of achievement!",
-                badge_url="/badges/goal_master.png"
-            )
+        # Days between consecutive updates
+        dates = [entry.date for entry in progress_entries]
+        intervals = [(later - earlier).days for earlier, later in zip(dates, dates[1:])]
         
-        # Category expert achievements
-        category_counts = {}
-        for completed_goal in completed_goals:
-            category = completed_goal.goal_type
-            if category in category_counts:
-                category_counts[category] += 1
-            else:
-                category_counts[category] = 1
+        # The spread is only computed when updates were frequent enough on average
+        avg_interval = fmean(intervals)
+        return avg_interval <= 3 and sqrt(fmean([(x - avg_interval) ** 2 for x in intervals])) <= 1
+
+    @staticmethod
+    def check_goal_completion_achievements(
+        db: Session, user_id: int, goal_id: int, background_tasks: Optional[BackgroundTasks] = None
+    ) -> None:
+        """Check and award achievements when a goal is completed."""
+        # Get the completed goal along with its progress entries
+        goal = GoalRepository.get_by_id_with_progress(db, goal_id)
+        if not goal or goal.status != GoalStatus.COMPLETED:
+            return
         
-        # Check if user has completed 3 goals in any category
-        for category, count in category_counts.items():
-            if count == 3:
-                AchievementService.create_achievement(
-                    db=db,
-                    user_id=user_id,
-                    title=f"{category.value} Expert",
-                    description=f"Completed 3 goals in the {category.value} category. You're becoming an expert!",
-                    badge_url=f"/badges/{category.value.lower()}_expert.png"
-                )
+        # Completed goal counts per category, and the titles already earned
+        category_counts = GoalRepository.count_completed_by_type(db, user_id)
+        existing_titles = AchievementRepository.get_titles_by_user_id(db, user_id)
         
-        # Ahead of schedule achievement
-        if goal.deadline:
-            days_early = (goal.deadline - datetime.now()).days
-            if days_early > 3:  # Completed at least 3 days ahead of schedule
-                AchievementService.create_achievement(
-                    db=db,
-                    user_id=user_id,
-                    title=AchievementService.ACHIEVEMENT_AHEAD,
-                    description="Completed a goal well ahead of schedule. Great planning and execution!",
-                    goal_id=goal_id,
-                    badge_url="/badges/ahead_of_schedule.png"
-                )
+        # Everything the award rules look at, computed once
+        context = {
+            "completed_count": sum(category_counts.values()),
+            "category_counts": category_counts,
+            "days_early": (goal.deadline - datetime.now()).days if goal.deadline else None,
+            "consistent": AchievementService._is_progress_consistent(goal.progress_entries),
+        }
+        candidates = [
+            {**award, "goal_id": goal_id if linked_to_goal else None}
+            for predicate, linked_to_goal, award in AchievementService._GOAL_COMPLETION_RULES
+            if predicate(context)
+        ]
         
-        # Consistency achievement - check if progress was added regularly
-        progress_entries = ProgressRepository.get_by_goal_id(db, goal_id)
-        if len(progress_entries) >= 5:  # Need at least 5 entries to check consistency
-            # Sort by date
-            progress_entries.sort(key=lambda x: x.date)
-            
-            # Check intervals between updates
-            intervals = []
-            for i in range(1, len(progress_entries)):
-                interval = (progress_entries[i].date - progress_entries[i-1].date).days
-                intervals.append(interval)
-            
-            # Calculate average and standard deviation
-            avg_interval = sum(intervals) / len(intervals)
-            std_dev = (sum((x - avg_interval) ** 2 for x in intervals) / len(intervals)) ** 0.5
-            
-            # If standard deviation is low, progress was consistent
-            if std_dev <= 1 and avg_interval <= 3:  # Consistent updates at least every 3 days
-                AchievementService.create_achievement(
-                    db=db,
-                    user_id=user_id,
-                    title=AchievementService.ACHIEVEMENT_CONSISTENCY,
-                    description="Consistently tracked progress toward your goal. Consistency is key to success!",
-                    goal_id=goal_id,
-                    badge_url="/badges/consistency.png"
-                )
+        AchievementService._award_achievements(db, user_id, candidates, existing_titles, background_tasks)
 
     @staticmethod
-    def check_progress_streak_achievements(db: Session, user_id: int, goal_id: int) -> None:
+    def check_progress_streak_achievements(
+        db: Session, user_id: int, goal_id: int, background_tasks: Optional[BackgroundTasks] = None
+    ) -> None:
         """Check and award achievements for consistent progress streaks."""
-        progress_entries = ProgressRepository.get_by_goal_id(db, goal_id, sort_by="date", sort_desc=False)
-        
-        # Need at least 7 entries to check for a streak
-        if len(progress_entries) < 7:
+        # Once earned there is nothing to compute
+        if AchievementService._has_achievement(db, user_id, AchievementService.ACHIEVEMENT_STREAK):
             return
         
-        # Check for a 7-day streak
-        current_streak = 1
-        max_streak = 1
-        
-        for i in range(1, len(progress_entries)):
-            current_entry_date = progress_entries[i].date.date()
-            prev_entry_date = progress_entries[i-1].date.date()
-            
-            # Check if entries are on consecutive days
-            if (current_entry_date - prev_entry_date).days == 1:
-                current_streak += 1
-                max_streak = max(max_streak, current_streak)
-            else:
-                current_streak = 1
-        
         # Award achievement for 7-day streak
-        if max_streak >= 7 and not AchievementRepository.check_achievement_exists(db, user_id, AchievementService.ACHIEVEMENT_STREAK):
+        if ProgressRepository.get_max_day_streak(db, goal_id) >= 7:
             AchievementService.create_achievement(
                 db=db,
                 user_id=user_id,
                 title=AchievementService.ACHIEVEMENT_STREAK,
                 description="Recorded progress for 7 consecutive days. What fantastic dedication!",
                 goal_id=goal_id,
-                badge_url="/badges/progress_streak.png"
+                badge_url="/badges/progress_streak.png",
+                background_tasks=background_tasks
             )
\ No newline at end of file
@@ -1,14 +1,22 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from functools import lru_cache
 from langchain_groq import ChatGroq
+import asyncio
 import json
-import re
+import logging
 
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Most meal analyses a single batch keeps in flight at once
+_MEAL_ANALYSIS_CONCURRENCY = 8
+
 class AIService:
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_chat_model():
-        """Create and return a Groq chat model."""
+        """Create the Groq chat model once and reuse it, along with its HTTP connection pool."""
         if not settings.GROQ_API_KEY:
             raise ValueError("GROQ_API_KEY is not set in environment variables")
             
@@ -18,104 +26,122 @@ class AIService:
             temperature=0.2
         )
 
+    @staticmethod
+    def _fallback_nutrition(analysis_details: str) -> Dict[str, Any]:
+        """Return the basic estimate used whenever the LLM can't analyze a meal."""
+        return {
+            "calories": 300,
+            "protein": 10.0,
+            "carbs": 30.0,
+            "fat": 10.0,
+            "analysis_details": analysis_details
+        }
+
+    @staticmethod
+    def _check_meal_analysis(meal_name: str, meal_description: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return a fallback estimate when a meal can't be sent for analysis, or None if it can."""
+        # Check if we have valid input
+        if not meal_name and not meal_description:
+            logger.warning("Meal analysis requested with empty name and description")
+            return AIService._fallback_nutrition("No meal information provided.")
+        
+        # Check API key
+        if not settings.GROQ_API_KEY:
+            logger.error("GROQ_API_KEY is not set")
+            return AIService._fallback_nutrition("API key not configured properly.")
+        
+        return None
+
+    @staticmethod
+    def _meal_analysis_messages(meal_name: str, meal_description: Optional[str]) -> List[Dict[str, str]]:
+        """Build the prompt for a meal nutrition analysis."""
+        return [
+            {"role": "system", "content": """
+            You are a nutrition expert that analyzes meals and estimates their nutrition content.
+            Provide your response as a JSON object with the following keys:
+            - calories: total calories (integer)
+            - protein: protein in grams (float)
+            - carbs: carbohydrates in grams (float) 
+            - fat: fat in grams (float)
+            - analysis_details: brief description of main nutrients/ingredients
+            
+            Make sure to format your response as valid JSON.
+            """},
+            {"role": "user", "content": f"""
+            Meal name: {meal_name}
+            Description: {meal_description or ""}
+            
+            Please provide a nutritional analysis.
+            """}
+        ]
+
+    @staticmethod
+    def _parse_nutrition(content: str) -> Dict[str, Any]:
+        """Parse the model's JSON-mode reply into the nutrition fields."""
+        # %.100s truncates only when the record is actually emitted
+        logger.debug("Received response: %.100s...", content)
+        
+        parsed_data = json.loads(content)
+        logger.debug("Parsed nutrition fields: %s", parsed_data.keys())
+        return parsed_data
+
     @staticmethod
     def analyze_meal_nutrition(meal_name: str, meal_description: Optional[str] = None) -> Dict[str, Any]:
         """Analyze nutrition content of a meal using LLM."""
+        fallback = AIService._check_meal_analysis(meal_name, meal_description)
+        if fallback:
+            return fallback
+        
         try:
-            # Check if we have valid input
-            if not meal_name and not meal_description:
-                print("Warning: Both meal name and description are empty")
-                return {
-                    "calories": 300,
-                    "protein": 10.0,
-                    "carbs": 30.0,
-                    "fat": 10.0,
-                    "analysis_details": "No meal information provided."
-                }
-                
-            # Check API key
-            if not settings.GROQ_API_KEY:
-                print("Error: GROQ_API_KEY is not set")
-                return {
-                    "calories": 300,
-                    "protein": 10.0,
-                    "carbs": 30.0,
-                    "fat": 10.0,
-                    "analysis_details": "API key not configured properly."
-                }
-            
-            chat = AIService._get_chat_model()
-            
-            print(f"Analyzing meal: {meal_name}, Description: {meal_description or 'None'}")
+            # JSON mode makes Groq return a bare JSON object, so no extraction is needed
+            chat = AIService._get_chat_model().bind(response_format={"type": "json_object"})
             
-            # Format messages directly for the model
-            messages = [
-                {"role": "system", "content": """
-                You are a nutrition expert that analyzes meals and estimates their nutrition content.
-                Provide your response as a JSON object with the following keys:
-                - calories: total calories (integer)
-                - protein: protein in grams (float)
-                - carbs: carbohydrates in grams (float) 
-                - fat: fat in grams (float)
-                - analysis_details: brief description of main nutrients/ingredients
-                
-                Make sure to format your response as valid JSON.
-                """},
-                {"role": "user", "content": f"""
-                Meal name: {meal_name}
-                Description: {meal_description or ""}
-                
-                Please provide a nutritional analysis.
-                """}
-            ]
-            
-            # Generate response directly
-            print("Sending request to Groq API")
-            result = chat.invoke(messages)
-            print(f"Received response: {result.content[:100]}...")
+            logger.debug("Analyzing meal: %s, Description: %s", meal_name, meal_description)
+            result = chat.invoke(AIService._meal_analysis_messages(meal_name, meal_description))
+            return AIService._parse_nutrition(result.content)
+        except Exception as e:
+            logger.exception("Error analyzing meal")
             
-            # Extract JSON from the response
-            content = result.content
-            # Look for JSON in the response
-            json_match = re.search(r'```json\n(.*?)\n```', content, re.DOTALL) or re.search(r'\{.*\}', content, re.DOTALL)
+            # Fallback to a basic estimation if any error occurs
+            return AIService._fallback_nutrition(f"Error during analysis: {str(e)[:100]}")
+
+    @staticmethod
+    async def analyze_meal_nutrition_async(
+        meal_name: str, meal_description: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Analyze nutrition content of a meal using LLM without blocking the event loop."""
+        fallback = AIService._check_meal_analysis(meal_name, meal_description)
+        if fallback:
+            return fallback
+        
+        try:
+            chat = AIService._get_chat_model().bind(response_format={"type": "json_object"})
             
-            if json_match:
-                extracted_json = json_match.group(1) if '```json' in content else json_match.group(0)
-                print(f"Extracted JSON: {extracted_json[:100]}...")
-                
-                parsed_data = json.loads(extracted_json)
-                print(f"Successfully parsed JSON: {list(parsed_data.keys())}")
-                return parsed_data
-            else:
-                print(f"No JSON found in response. Response starts with: {content[:100]}")
-                return {
-                    "calories": 300,
-                    "protein": 10.0,
-                    "carbs": 30.0,
-                    "fat": 10.0,
-                    "analysis_details": "Could not extract structured data from response."
-                }
+            logger.debug("Analyzing meal: %s, Description: %s", meal_name, meal_description)
+            result = await chat.ainvoke(AIService._meal_analysis_messages(meal_name, meal_description))
+            return AIService._parse_nutrition(result.content)
         except Exception as e:
-            print(f"Error analyzing meal: {str(e)}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error analyzing meal")
             
             # Fallback to a basic estimation if any error occurs
-            return {
-                "calories": 300,
-                "protein": 10.0,
-                "carbs": 30.0,
-                "fat": 10.0,
-                "analysis_details": f"Error during analysis: {str(e)[:100]}"
-            }
+            return AIService._fallback_nutrition(f"Error during analysis: {str(e)[:100]}")
 
     @staticmethod
-    def generate_diet_plan(user_input: str) -> Dict[str, Any]:
-        """Generate a diet plan based on user's natural language input."""
-        chat = AIService._get_chat_model()
+    async def analyze_meals(meals: List[Tuple[str, Optional[str]]]) -> List[Dict[str, Any]]:
+        """Analyze several meals concurrently, in input order, with a cap on in-flight LLM calls."""
+        # Bounded so a large batch stays within Groq's rate limits
+        semaphore = asyncio.Semaphore(_MEAL_ANALYSIS_CONCURRENCY)
         
-        # Format messages directly for the model
-        messages = [
+        async def analyze(meal_name: str, meal_description: Optional[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await AIService.analyze_meal_nutrition_async(meal_name, meal_description)
+        
+        return await asyncio.gather(*(analyze(name, description) for name, description in meals))
+
+    @staticmethod
+    def _diet_plan_messages(user_input: str) -> List[Dict[str, str]]:
+        """Build the prompt for a diet plan request."""
+        return [
             {"role": "system", "content": """
             You are a nutrition expert that creates personalized meal plans.
             The user will describe their goals and preferences, and you will generate a 7-day meal plan.
@@ -133,22 +159,11 @@ class AIService:
             {user_input}
             """}
         ]
-        
-        # Generate response directly
-        result = chat.invoke(messages)
-        
-        return {
-            "diet_plan": result.content,
-            "request": user_input
-        }
 
     @staticmethod
-    def get_workout_recommendation(user_input: str) -> Dict[str, Any]:
-        """Generate a workout recommendation based on user's natural language input."""
-        chat = AIService._get_chat_model()
-        
-        # Format messages directly for the model
-        messages = [
+    def _workout_plan_messages(user_input: str) -> List[Dict[str, str]]:
+        """Build the prompt for a workout plan request."""
+        return [
             {"role": "system", "content": """
             You are a fitness expert that creates personalized workout plans.
             The user will describe their goals, fitness level, and preferences, and you will generate a workout plan.
@@ -167,6 +182,28 @@ class AIService:
             {user_input}
             """}
         ]
+
+    @staticmethod
+    def generate_diet_plan(user_input: str) -> Dict[str, Any]:
+        """Generate a diet plan based on user's natural language input."""
+        chat = AIService._get_chat_model()
+        
+        messages = AIService._diet_plan_messages(user_input)
+        
+        # Generate response directly
+        result = chat.invoke(messages)
+        
+        return {
+            "diet_plan": result.content,
+            "request": user_input
+        }
+
+    @staticmethod
+    def get_workout_recommendation(user_input: str) -> Dict[str, Any]:
+        """Generate a workout recommendation based on user's natural language input."""
+        chat = AIService._get_chat_model()
+        
+        messages = AIService._workout_plan_messages(user_input)
         
         # Generate response directly
         result = chat.invoke(messages)
@@ -174,4 +211,37 @@ class AIService:
         return {
             "workout_plan": result.content,
             "request": user_input
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def _start_stream(messages: List[Dict[str, str]]) -> Iterator[str]:
+        """Open an LLM stream, raising setup and connection errors before any chunk is handed out."""
+        chat = AIService._get_chat_model()
+        chunks = chat.stream(messages)
+        # Pull the first chunk now so a missing key or failed request fails the call, not the response body
+        first = next(chunks, None)
+        return AIService._relay_stream(first, chunks)
+
+    @staticmethod
+    def _relay_stream(first: Any, chunks: Iterator[Any]) -> Iterator[str]:
+        """Yield the text of an opened LLM stream, ending it with a notice if the model fails midway."""
+        if first is None:
+            return
+        yield first.content
+        try:
+            for chunk in chunks:
+                yield chunk.content
+        except Exception:
+            # The status line is already sent, so all that's left is to say the text is incomplete
+            logger.exception("LLM stream failed after it started")
+            yield "\n\n[The response was interrupted. Please try again.]"
+
+    @staticmethod
+    def stream_diet_plan(user_input: str) -> Iterator[str]:
+        """Stream a diet plan as the model generates it."""
+        return AIService._start_stream(AIService._diet_plan_messages(user_input))
+
+    @staticmethod
+    def stream_workout_recommendation(user_input: str) -> Iterator[str]:
+        """Stream a workout plan as the model generates it."""
+        return AIService._start_stream(AIService._workout_plan_messages(user_input))
\ No newline at end of file
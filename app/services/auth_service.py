@@ -1,6 +1,7 @@
 from datetime import datetime, timedelta
 from typing import Optional, Tuple, Dict, Any
 from fastapi import HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.user import User, UserRole
@@ -12,31 +13,44 @@ from app.core.config import settings
 
 class AuthService:
     @staticmethod
-    def register_user(db: Session, user_data: UserRegisterRequest) -> User:
-        """Register a new user."""
+    def _check_credentials_available(db: Session, user_data: UserRegisterRequest) -> None:
+        """Raise if the username or email is already registered."""
+        taken = UserRepository.get_taken_credentials(db, user_data.username, user_data.email)
+        
         # Check if username already exists
-        if UserRepository.get_by_username(db, user_data.username):
+        if any(username == user_data.username for username, _ in taken):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already registered",
             )
         
         # Check if email already exists
-        if UserRepository.get_by_email(db, user_data.email):
+        if taken:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
+
+    @staticmethod
+    def register_user(db: Session, user_data: UserRegisterRequest) -> User:
+        """Register a new user."""
+        # One lookup for both fields, so duplicates are refused before paying for the hash
+        AuthService._check_credentials_available(db, user_data)
         
-        # Create the user
-        return UserRepository.create(
-            db=db,
-            username=user_data.username,
-            email=user_data.email,
-            password=user_data.password,
-            first_name=user_data.first_name,
-            last_name=user_data.last_name,
-        )
+        # Create the user; the unique constraints catch a registration that raced the check
+        try:
+            return UserRepository.create(
+                db=db,
+                username=user_data.username,
+                email=user_data.email,
+                password=user_data.password,
+                first_name=user_data.first_name,
+                last_name=user_data.last_name,
+            )
+        except IntegrityError:
+            db.rollback()
+            AuthService._check_credentials_available(db, user_data)
+            raise
 
     @staticmethod
     def authenticate_user(db: Session, username: str, password: str) -> Optional[User]:
@@ -67,7 +81,19 @@ class AuthService:
             "access_token": access_token,
             "token_type": "bearer",
             "expires_in": int(access_token_expires.total_seconds()),
-            "user": user,
+            # Plain column values, so serializing the response can't touch the session
+            "user": {
+                "id": user.id,
+                "username": user.username,
+                "email": user.email,
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "role": user.role,
+                "bio": user.bio,
+                "is_active": user.is_active,
+                "created_at": user.created_at,
+                "updated_at": user.updated_at,
+            },
         }
         
         return access_token, expires_at, token_data
@@ -82,6 +108,10 @@ class AuthService:
                 detail="Incorrect password",
             )
         
+        # The stored hash already matches, so skip hashing the same password again
+        if new_password == current_password:
+            return user
+        
         # Change the password
         return UserRepository.change_password(db, user, new_password)
 
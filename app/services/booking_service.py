@@ -15,43 +15,28 @@ class BookingService:
     @staticmethod
     def create_booking(db: DbSession, booking_data: BookingCreateRequest, user: User) -> Booking:
         """Book a session for the user."""
-        # Check if session exists
-        session = SessionRepository.get_by_id(db, booking_data.session_id)
-        if not session:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Session with ID {booking_data.session_id} not found",
-            )
-        
-        # Check if session is not cancelled
-        if session.is_cancelled:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot book a cancelled session",
-            )
-        
-        # Check if session has available slots
-        if session.available_slots <= 0:
+        # Take a slot atomically; only look the session up to explain a refusal
+        if not SessionRepository.reserve_slot(db, booking_data.session_id):
+            session = SessionRepository.get_by_id(db, booking_data.session_id)
+            if not session:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Session with ID {booking_data.session_id} not found",
+                )
+            
+            if session.is_cancelled:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Cannot book a cancelled session",
+                )
+            
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Session is fully booked",
             )
         
-        # Check if user already has a booking for this session
-        existing_booking = db.query(Booking).filter(
-            Booking.user_id == user.id,
-            Booking.session_id == booking_data.session_id,
-            Booking.status != BookingStatus.CANCELLED
-        ).first()
-        
-        if existing_booking:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="You already have a booking for this session",
-            )
-        
-        # Create the booking
-        booking = BookingRepository.create(
+        # Create the booking; the unique index rejects a second live booking for the session
+        booking = BookingRepository.create_unless_booked(
             db=db,
             user_id=user.id,
             session_id=booking_data.session_id,
@@ -59,16 +44,21 @@ class BookingService:
             attended=False,
         )
         
-        # Update available slots in session
-        session.available_slots -= 1
-        db.commit()
+        if not booking:
+            # Give the reserved slot back
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You already have a booking for this session",
+            )
         
         return booking
 
     @staticmethod
     def get_booking(db: DbSession, booking_id: int) -> Booking:
         """Get a booking by ID."""
-        booking = BookingRepository.get_by_id(db, booking_id)
+        # Every caller checks booking.session.trainer_id, so the session is joined in
+        booking = BookingRepository.get_by_id_with_session(db, booking_id)
         if not booking:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -93,26 +83,17 @@ class BookingService:
                 detail="You don't have permission to cancel this booking",
             )
         
-        # Check if booking is already cancelled
-        if booking.status == BookingStatus.CANCELLED:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Booking is already cancelled",
-            )
-        
-        # Cancel the booking
+        # Cancel the booking; the UPDATE only matches a live booking, so a concurrent cancel can't win twice
         cancelled_booking = BookingRepository.cancel(db, booking_id)
         if not cancelled_booking:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Booking not found",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Booking is already cancelled",
             )
         
-        # Increment available slots in session
-        session = SessionRepository.get_by_id(db, booking.session_id)
-        if session and not session.is_cancelled:
-            session.available_slots += 1
-            db.commit()
+        # Increment available slots in session and commit both changes together
+        SessionRepository.release_slot(db, booking.session_id)
+        db.commit()
         
         return cancelled_booking
 
@@ -152,12 +133,10 @@ class BookingService:
         sort_desc: bool = True,
     ) -> Dict[str, Any]:
         """Get all bookings for a user with pagination, filtering, and sorting."""
-        bookings = BookingRepository.get_by_user_id(
+        bookings, total = BookingRepository.get_page_by_user_id(
             db, user_id, skip=skip, limit=limit, filters=filters, sort_by=sort_by, sort_desc=sort_desc
         )
         
-        total = BookingRepository.count_by_user_id(db, user_id, filters=filters)
-        
         return {
             "items": bookings,
             "total": total,
@@ -183,12 +162,10 @@ class BookingService:
                 detail=f"Session with ID {session_id} not found",
             )
         
-        bookings = BookingRepository.get_by_session_id(
+        bookings, total = BookingRepository.get_page_by_session_id(
             db, session_id, skip=skip, limit=limit, filters=filters
         )
         
-        total = BookingRepository.count_by_session_id(db, session_id, filters=filters)
-        
         return {
             "items": bookings,
             "total": total,
@@ -1,4 +1,6 @@
 from typing import List, Dict, Any
+from functools import lru_cache
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from langchain_groq import ChatGroq
 
@@ -8,8 +10,9 @@ from app.core.config import settings
 
 class ChatbotService:
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_chat_model():
-        """Create and return a Groq chat model."""
+        """Create the Groq chat model once and reuse it, along with its HTTP connection pool."""
         if not settings.GROQ_API_KEY:
             raise ValueError("GROQ_API_KEY is not set in environment variables")
             
@@ -20,10 +23,11 @@ class ChatbotService:
         )
 
     @staticmethod
-    def send_message(db: Session, user_message: str, user_id: int) -> Dict[str, Any]:
+    async def send_message(db: Session, user_message: str, user_id: int) -> Dict[str, Any]:
         """Process a user message and generate a response."""
+        # Database calls go to the threadpool one at a time, since they share one Session
         # Get recent conversation for context
-        recent_messages = ChatRepository.get_by_user_id(db, user_id, limit=5)
+        recent_messages = await run_in_threadpool(ChatRepository.get_by_user_id, db, user_id, limit=5)
         
         # Create chat history context
         conversation_history = ""
@@ -32,7 +36,8 @@ class ChatbotService:
             conversation_history += f"{prefix}{msg.content}\n\n"
         
         # Save user message
-        user_msg = ChatRepository.create(
+        user_msg = await run_in_threadpool(
+            ChatRepository.create,
             db=db,
             user_id=user_id,
             is_user_message=True,
@@ -68,10 +73,11 @@ class ChatbotService:
         ]
         
         # Generate response directly
-        result = chat.invoke(messages)
+        result = await chat.ainvoke(messages)
         
         # Save AI response
-        ai_msg = ChatRepository.create(
+        ai_msg = await run_in_threadpool(
+            ChatRepository.create,
             db=db,
             user_id=user_id,
             is_user_message=False,
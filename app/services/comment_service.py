@@ -76,9 +76,6 @@ class CommentService:
                 detail="Comment not found",
             )
         
-        # Add like count
-        comment.like_count = CommentRepository.get_like_count(db, comment_id)
-        
         # Add is_liked_by_user flag if user_id is provided
         if user_id:
             comment.is_liked_by_user = CommentRepository.is_liked_by_user(db, comment_id, user_id)
@@ -114,8 +111,7 @@ class CommentService:
             content=comment_data.content,
         )
         
-        # Add like count and is_liked_by_user flag
-        updated_comment.like_count = CommentRepository.get_like_count(db, comment_id)
+        # Add is_liked_by_user flag
         updated_comment.is_liked_by_user = CommentRepository.is_liked_by_user(db, comment_id, user.id)
         
         return updated_comment
@@ -164,33 +160,23 @@ class CommentService:
             )
         
         # Get comments
-        comments = CommentRepository.get_by_discussion_id(
+        comments, total = CommentRepository.get_page_by_discussion_id(
             db, discussion_id, parent_id, skip=skip, limit=limit, sort_by=sort_by, sort_desc=sort_desc
         )
         
-        # Get total count
-        total = CommentRepository.count_by_discussion_id(db, discussion_id, parent_id)
+        # Load the page's reply trees at once so replies are not fetched node by node
+        CommentRepository.get_subtrees(db, [comment.id for comment in comments])
         
-        # Enrich comments with additional information
-        for comment in comments:
-            # Add like count
-            comment.like_count = CommentRepository.get_like_count(db, comment.id)
-            
-            # Add is_liked_by_user flag if user_id is provided
-            if user_id:
-                comment.is_liked_by_user = CommentRepository.is_liked_by_user(db, comment.id, user_id)
-            
-            # Get replies for top-level comments
-            if parent_id is None:
-                replies = CommentRepository.get_replies(db, comment.id)
-                
-                # Enrich replies with like information
-                for reply in replies:
-                    reply.like_count = CommentRepository.get_like_count(db, reply.id)
-                    if user_id:
-                        reply.is_liked_by_user = CommentRepository.is_liked_by_user(db, reply.id, user_id)
-                
-                comment.replies = replies
+        # Flag the page and its direct replies the user has liked in one query
+        enriched = list(comments)
+        if parent_id is None:
+            for comment in comments:
+                enriched.extend(comment.replies)
+        
+        if user_id:
+            liked_ids = CommentRepository.get_liked_by_user(db, [comment.id for comment in enriched], user_id)
+            for comment in enriched:
+                comment.is_liked_by_user = comment.id in liked_ids
         
         return {
             "items": comments,
@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session as DbSession
 from app.models.program import Program
 from app.models.user import User
 from app.repositories.program_repository import ProgramRepository
+from app.services.program_service import ProgramService
 
 class DiscoveryService:
     @staticmethod
@@ -18,7 +19,7 @@ class DiscoveryService:
         sort_desc: bool = True,
     ) -> Dict[str, Any]:
         """Search for programs with advanced filtering and sorting."""
-        programs = ProgramRepository.search_programs(
+        programs, total = ProgramRepository.search_page(
             db, 
             search_term or "", 
             filters=filters, 
@@ -28,8 +29,6 @@ class DiscoveryService:
             sort_desc=sort_desc
         )
         
-        total = ProgramRepository.count_search_results(db, search_term or "", filters=filters)
-        
         return {
             "items": programs,
             "total": total,
@@ -41,7 +40,7 @@ class DiscoveryService:
     @staticmethod
     def get_featured_programs(db: DbSession, limit: int = 5) -> List[Program]:
         """Get featured or recommended programs."""
-        return ProgramRepository.get_featured_programs(db, limit)
+        return ProgramService.get_featured_programs(db, limit)
 
     @staticmethod
     def get_recommended_programs(db: DbSession, user_id: int, limit: int = 5) -> List[Program]:
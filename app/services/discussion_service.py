@@ -6,10 +6,10 @@ from sqlalchemy.orm import Session as DbSession
 from app.models.discussion import Discussion
 from app.models.user import User, UserRole
 from app.dto.request.discussion_dto import DiscussionCreateRequest, DiscussionUpdateRequest
-from app.repositories.comment_repository import CommentRepository
 from app.repositories.forum_repository import ForumRepository
 from app.repositories.membership_repository import MembershipRepository
 from app.repositories.discussion_repository import DiscussionRepository
+from app.services.forum_service import ForumService
 
 class DiscussionService:
     @staticmethod
@@ -39,7 +39,7 @@ class DiscussionService:
             )
         
         # Create the discussion
-        return DiscussionRepository.create(
+        discussion = DiscussionRepository.create(
             db=db,
             forum_id=discussion_data.forum_id,
             user_id=user.id,
@@ -48,6 +48,9 @@ class DiscussionService:
             is_pinned=False,
             is_locked=False,
         )
+        
+        ForumService.invalidate_forum_list()
+        return discussion
 
     @staticmethod
     def get_discussion(db: DbSession, discussion_id: int) -> Discussion:
@@ -59,9 +62,6 @@ class DiscussionService:
                 detail="Discussion not found",
             )
         
-        # Add comment count later when Comment model is implemented
-        # discussion.comment_count = CommentRepository.count_by_discussion_id(db, discussion_id)
-        
         return discussion
 
     @staticmethod
@@ -121,7 +121,10 @@ class DiscussionService:
                 )
         
         # Delete the discussion
-        return DiscussionRepository.delete(db, discussion_id)
+        deleted = DiscussionRepository.delete(db, discussion_id)
+        
+        ForumService.invalidate_forum_list()
+        return deleted
 
     @staticmethod
     def pin_discussion(db: DbSession, discussion_id: int, pin: bool, user: User) -> Discussion:
@@ -195,15 +198,11 @@ class DiscussionService:
                 detail=f"Forum with ID {forum_id} not found",
             )
         
-        discussions = DiscussionRepository.get_by_forum_id(
+        discussions, total = DiscussionRepository.get_page_by_forum_id(
             db, forum_id, skip=skip, limit=limit, search=search, 
             is_pinned=is_pinned, sort_by=sort_by, sort_desc=sort_desc
         )
         
-        total = DiscussionRepository.count_by_forum_id(db, forum_id, search=search, is_pinned=is_pinned)
-        
-        # Add comment count to each discussion when Comment model is implemented
-        
         return {
             "items": discussions,
             "total": total,
@@ -229,11 +228,7 @@ class DiscussionService:
                 detail="Discussion not found",
             )
         
-        # Add comment count
-        discussion.comment_count = CommentRepository.count_all_by_discussion_id(db, discussion_id)
-        
-        # Add like count
-        discussion.like_count = DiscussionRepository.get_like_count(db, discussion_id)
+        # comment_count and like_count are maintained on the row itself
         
         # Add is_liked_by_user flag if user_id is provided
         if user_id:
@@ -3,13 +3,22 @@ from typing import List, Optional, Dict, Any
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session as DbSession
 
+from app.core.cache import TTLCache
 from app.models.forum import Forum
 from app.models.user import User, UserRole
 from app.dto.request.forum_dto import ForumCreateRequest, ForumUpdateRequest
 from app.repositories.forum_repository import ForumRepository
 from app.repositories.membership_repository import MembershipRepository
 
+# Forum browse pages keyed by their query arguments; cleared on writes that change them
+_forum_list_cache = TTLCache(ttl=60)
+
 class ForumService:
+    @staticmethod
+    def invalidate_forum_list() -> None:
+        """Drop cached forum browse pages after a forum or its counters change."""
+        _forum_list_cache.clear()
+
     @staticmethod
     def create_forum(db: DbSession, forum_data: ForumCreateRequest, user: User) -> Forum:
         """Create a new forum."""
@@ -36,6 +45,7 @@ class ForumService:
             role="MODERATOR"
         )
         
+        ForumService.invalidate_forum_list()
         return forum
 
     @staticmethod
@@ -48,10 +58,6 @@ class ForumService:
                 detail="Forum not found",
             )
         
-        # Add member and discussion counts
-        forum.member_count = ForumRepository.get_member_count(db, forum_id)
-        forum.discussion_count = ForumRepository.get_discussion_count(db, forum_id)
-        
         return forum
 
     @staticmethod
@@ -73,13 +79,16 @@ class ForumService:
                 )
         
         # Update the forum
-        return ForumRepository.update(
+        updated_forum = ForumRepository.update(
             db=db,
             forum=forum,
             name=forum_data.name,
             description=forum_data.description,
             is_active=forum_data.is_active,
         )
+        
+        ForumService.invalidate_forum_list()
+        return updated_forum
 
     @staticmethod
     def delete_forum(db: DbSession, forum_id: int, user: User) -> bool:
@@ -95,7 +104,10 @@ class ForumService:
             )
         
         # Delete the forum
-        return ForumRepository.delete(db, forum_id)
+        deleted = ForumRepository.delete(db, forum_id)
+        
+        ForumService.invalidate_forum_list()
+        return deleted
 
     @staticmethod
     def get_forums(
@@ -107,24 +119,29 @@ class ForumService:
         sort_desc: bool = True,
     ) -> Dict[str, Any]:
         """Get all forums with search, sorting, and pagination."""
-        forums = ForumRepository.get_all(
+        cache_key = (skip, limit, search, sort_by, sort_desc)
+        cached = _forum_list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        forums, total = ForumRepository.get_page(
             db, skip=skip, limit=limit, search=search, sort_by=sort_by, sort_desc=sort_desc
         )
         
-        total = ForumRepository.count(db, search=search)
-        
-        # Add member and discussion counts to each forum
+        # Detach the fully loaded rows so they can be shared across requests
         for forum in forums:
-            forum.member_count = ForumRepository.get_member_count(db, forum.id)
-            forum.discussion_count = ForumRepository.get_discussion_count(db, forum.id)
+            db.expunge(forum)
         
-        return {
+        result = {
             "items": forums,
             "total": total,
             "page": skip // limit + 1 if limit > 0 else 1,
             "size": limit,
             "pages": (total + limit - 1) // limit if limit > 0 else 1,
         }
+        _forum_list_cache.set(cache_key, result)
+        
+        return result
 
     @staticmethod
     def get_user_forums(
@@ -1,5 +1,5 @@
 from typing import List, Optional, Dict, Any
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
@@ -8,6 +8,7 @@ from app.models.goal import Goal, GoalStatus
 from app.dto.request.goal_dto import GoalCreateRequest, GoalUpdateRequest
 from app.repositories.goal_repository import GoalRepository
 from app.repositories.progress_repository import ProgressRepository
+from app.repositories.notification_repository import NotificationRepository
 from app.services.notification_service import NotificationService
 from app.models.notification import NotificationType
 
@@ -99,7 +100,11 @@ class GoalService:
 
     @staticmethod
     def update_goal(
-        db: Session, goal_id: int, goal_data: GoalUpdateRequest, user: User
+        db: Session,
+        goal_id: int,
+        goal_data: GoalUpdateRequest,
+        user: User,
+        background_tasks: Optional[BackgroundTasks] = None
     ) -> Goal:
         """Update a goal."""
         # Get the goal
@@ -129,17 +134,20 @@ class GoalService:
         if goal_data.status == GoalStatus.COMPLETED and goal.status != GoalStatus.COMPLETED:
             # Trigger achievement check in achievement service
             from app.services.achievement_service import AchievementService
-            AchievementService.check_goal_completion_achievements(db, user.id, goal_id)
+            AchievementService.check_goal_completion_achievements(db, user.id, goal_id, background_tasks)
             
             # Create a notification for goal completion
-            NotificationService.create_notification(
-                db=db,
+            notification = dict(
                 user_id=user.id,
                 title="Goal Completed!",
                 content=f"Congratulations! You've completed your goal: {goal.title}",
                 type=NotificationType.GOAL_COMPLETED,
                 goal_id=goal.id
             )
+            if background_tasks is not None:
+                background_tasks.add_task(NotificationService.create_notification_detached, **notification)
+            else:
+                NotificationService.create_notification(db=db, **notification)
         
         return updated_goal
 
@@ -170,7 +178,7 @@ class GoalService:
         sort_desc: bool = True,
     ) -> Dict[str, Any]:
         """Get all goals for a user with pagination, filtering, and sorting."""
-        goals = GoalRepository.get_by_user_id(
+        goals, total = GoalRepository.get_page_by_user_id(
             db, user_id, skip=skip, limit=limit, filters=filters, sort_by=sort_by, sort_desc=sort_desc
         )
         
@@ -178,8 +186,6 @@ class GoalService:
         for goal in goals:
             goal.completion_percentage = GoalRepository.get_completion_percentage(db, goal.id)
         
-        total = GoalRepository.count_by_user_id(db, user_id, filters=filters)
-        
         return {
             "items": goals,
             "total": total,
@@ -220,17 +226,20 @@ class GoalService:
     @staticmethod
     def check_approaching_deadlines(db: Session):
         """Check for goals with approaching deadlines and send notifications."""
-        approaching_goals = GoalRepository.get_goals_with_approaching_deadline(db)
-        
-        for goal in approaching_goals:
-            days_remaining = (goal.deadline - datetime.now()).days
+        for approaching_goals in GoalRepository.iter_goals_with_approaching_deadline(db):
+            # One INSERT and commit per chunk; committing per goal would expire the rest of the chunk
+            NotificationRepository.create_many(db, [
+                {
+                    "user_id": goal.user_id,
+                    "title": "Goal Deadline Approaching",
+                    "content": f"Your goal '{goal.title}' is due in {(goal.deadline - datetime.now()).days} days!",
+                    "type": NotificationType.GOAL_DEADLINE,
+                    "goal_id": goal.id,
+                    "achievement_id": None,
+                    "is_read": False,
+                }
+                for goal in approaching_goals
+            ])
             
-            # Create a notification for approaching deadline
-            NotificationService.create_notification(
-                db=db,
-                user_id=goal.user_id,
-                title="Goal Deadline Approaching",
-                content=f"Your goal '{goal.title}' is due in {days_remaining} days!",
-                type=NotificationType.GOAL_DEADLINE,
-                goal_id=goal.id
-            )
\ No newline at end of file
+            # Keep the identity map bounded to one chunk
+            db.expunge_all()
\ No newline at end of file
@@ -59,9 +59,9 @@ class MealService:
         meal = MealService.get_meal_log(db, meal_id, user.id)
         
         # Update meal log
-        updated_meal = MealRepository.update(
+        updated_meal = MealRepository.update_by_id(
             db=db,
-            meal=meal,
+            meal_id=meal.id,
             meal_type=meal_data.meal_type,
             name=meal_data.name,
             description=meal_data.description,
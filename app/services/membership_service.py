@@ -8,6 +8,7 @@ from app.models.user import User, UserRole
 from app.dto.request.membership_dto import MembershipUpdateRequest
 from app.repositories.forum_repository import ForumRepository
 from app.repositories.membership_repository import MembershipRepository
+from app.services.forum_service import ForumService
 
 class MembershipService:
     @staticmethod
@@ -38,20 +39,23 @@ class MembershipService:
                 )
             
             # Reactivate membership
-            return MembershipRepository.update(
+            membership = MembershipRepository.update(
                 db=db,
                 membership=existing_membership,
                 status=MembershipStatus.ACTIVE,
             )
+        else:
+            # Create new membership
+            membership = MembershipRepository.create(
+                db=db,
+                forum_id=forum_id,
+                user_id=user.id,
+                status=MembershipStatus.ACTIVE,
+                role=MembershipRole.MEMBER,
+            )
         
-        # Create new membership
-        return MembershipRepository.create(
-            db=db,
-            forum_id=forum_id,
-            user_id=user.id,
-            status=MembershipStatus.ACTIVE,
-            role=MembershipRole.MEMBER,
-        )
+        ForumService.invalidate_forum_list()
+        return membership
 
     @staticmethod
     def leave_forum(db: DbSession, forum_id: int, user: User) -> bool:
@@ -80,7 +84,10 @@ class MembershipService:
             )
         
         # Delete membership
-        return MembershipRepository.delete(db, membership.id)
+        deleted = MembershipRepository.delete(db, membership.id)
+        
+        ForumService.invalidate_forum_list()
+        return deleted
 
     @staticmethod
     def update_membership(
@@ -133,12 +140,15 @@ class MembershipService:
             )
         
         # Update the membership
-        return MembershipRepository.update(
+        updated_membership = MembershipRepository.update(
             db=db,
             membership=membership,
             status=membership_data.status,
             role=membership_data.role,
         )
+        
+        ForumService.invalidate_forum_list()
+        return updated_membership
 
     @staticmethod
     def get_forum_members(
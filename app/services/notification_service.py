@@ -3,6 +3,8 @@ from typing import List, Optional, Dict, Any
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core.database import SessionLocal
+
 from app.models.user import User
 from app.models.notification import Notification, NotificationType
 from app.dto.request.notification_dto import NotificationUpdateRequest
@@ -31,6 +33,24 @@ class NotificationService:
             is_read=False
         )
 
+    @staticmethod
+    def create_notification_detached(**kwargs) -> None:
+        """Create a notification in its own session, for use as a background task."""
+        db = SessionLocal()
+        try:
+            NotificationService.create_notification(db=db, **kwargs)
+        finally:
+            db.close()
+
+    @staticmethod
+    def create_notifications_detached(rows: List[Dict[str, Any]]) -> None:
+        """Insert several notifications in their own session, for use as a background task."""
+        db = SessionLocal()
+        try:
+            NotificationRepository.create_many(db, rows)
+        finally:
+            db.close()
+
     @staticmethod
     def get_notification(db: Session, notification_id: int) -> Notification:
         """Get a notification by ID."""
@@ -59,9 +79,9 @@ class NotificationService:
             )
         
         # Update the notification
-        return NotificationRepository.update(
+        return NotificationRepository.update_by_id(
             db=db,
-            notification=notification,
+            notification_id=notification.id,
             is_read=True
         )
 
@@ -3,12 +3,21 @@ from typing import List, Optional, Dict, Any
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
 from app.models.program import Program
 from app.dto.request.program_dto import ProgramCreateRequest, ProgramUpdateRequest
 from app.repositories.program_repository import ProgramRepository
 from app.models.user import User, UserRole
 
+# Featured program lists keyed by limit; cleared on writes to programs or their reviews
+_featured_programs_cache = TTLCache(ttl=300)
+
 class ProgramService:
+    @staticmethod
+    def invalidate_featured_programs() -> None:
+        """Drop cached featured program lists after a program or its ratings change."""
+        _featured_programs_cache.clear()
+
     @staticmethod
     def create_program(db: Session, program_data: ProgramCreateRequest, user: User) -> Program:
         """Create a new program."""
@@ -20,7 +29,7 @@ class ProgramService:
             )
         
         # Create the program
-        return ProgramRepository.create(
+        program = ProgramRepository.create(
             db=db,
             name=program_data.name,
             description=program_data.description,
@@ -30,6 +39,8 @@ class ProgramService:
             created_by=user.id,
             image_url=program_data.image_url,
         )
+        ProgramService.invalidate_featured_programs()
+        return program
 
     @staticmethod
     def get_program(db: Session, program_id: int) -> Program:
@@ -41,14 +52,6 @@ class ProgramService:
             detail="Program not found",
             )
     
-    # Get program rating
-        from app.repositories.review_repository import ReviewRepository
-        avg_rating, review_count = ReviewRepository.get_program_rating(db, program_id)
-    
-    # Attach rating information to the program
-        program.average_rating = avg_rating
-        program.total_reviews = review_count
-    
         return program
 
     @staticmethod
@@ -67,9 +70,9 @@ class ProgramService:
             )
         
         # Update the program
-        return ProgramRepository.update(
+        updated_program = ProgramRepository.update_by_id(
             db=db,
-            program=program,
+            program_id=program.id,
             name=program_data.name,
             description=program_data.description,
             category=program_data.category,
@@ -78,6 +81,8 @@ class ProgramService:
             is_active=program_data.is_active,
             image_url=program_data.image_url,
         )
+        ProgramService.invalidate_featured_programs()
+        return updated_program
 
     @staticmethod
     def delete_program(db: Session, program_id: int, user: User) -> bool:
@@ -94,10 +99,11 @@ class ProgramService:
         
         # Admin can fully delete, others just deactivate
         if user.role == UserRole.ADMIN:
-            return ProgramRepository.delete(db, program_id)
+            deleted = ProgramRepository.delete(db, program_id)
         else:
-            program = ProgramRepository.deactivate(db, program_id)
-            return program is not None
+            deleted = ProgramRepository.deactivate(db, program_id) is not None
+        ProgramService.invalidate_featured_programs()
+        return deleted
 
     @staticmethod
     def get_programs(
@@ -109,12 +115,10 @@ class ProgramService:
         sort_desc: bool = True,
     ) -> Dict[str, Any]:
         """Get all programs with pagination, filtering, and sorting."""
-        programs = ProgramRepository.get_all(
+        programs, total = ProgramRepository.get_page(
             db, skip=skip, limit=limit, filters=filters, sort_by=sort_by, sort_desc=sort_desc
         )
         
-        total = ProgramRepository.count(db, filters=filters)
-        
         return {
             "items": programs,
             "total": total,
@@ -123,6 +127,22 @@ class ProgramService:
             "pages": (total + limit - 1) // limit if limit > 0 else 1,
         }
 
+    @staticmethod
+    def get_featured_programs(db: Session, limit: int = 5) -> List[Program]:
+        """Get the featured programs with ratings, served from cache while fresh."""
+        cached = _featured_programs_cache.get(limit)
+        if cached is not None:
+            return cached
+        
+        programs = ProgramRepository.get_featured_programs(db, limit)
+        
+        # Detach the fully loaded rows so they can be shared across requests
+        for program in programs:
+            db.expunge(program)
+        
+        _featured_programs_cache.set(limit, programs)
+        return programs
+
     @staticmethod
     def get_trainer_programs(
         db: Session, user_id: int, skip: int = 0, limit: int = 10
@@ -9,6 +9,8 @@ from app.dto.request.review_dto import ReviewCreateRequest, ReviewUpdateRequest
 from app.repositories.review_repository import ReviewRepository
 from app.repositories.program_repository import ProgramRepository
 from app.repositories.booking_repository import BookingRepository
+from app.repositories.user_repository import UserRepository
+from app.services.program_service import ProgramService
 
 class ReviewService:
     @staticmethod
@@ -45,13 +47,15 @@ class ReviewService:
             )
         
         # Create the review
-        return ReviewRepository.create(
+        review = ReviewRepository.create(
             db=db,
             user_id=user.id,
             program_id=review_data.program_id,
             rating=review_data.rating,
             comment=review_data.comment,
         )
+        ProgramService.invalidate_featured_programs()
+        return review
 
     @staticmethod
     def update_review(
@@ -74,12 +78,14 @@ class ReviewService:
             )
         
         # Update the review
-        return ReviewRepository.update(
+        updated_review = ReviewRepository.update(
             db=db,
             review=review,
             rating=review_data.rating,
             comment=review_data.comment,
         )
+        ProgramService.invalidate_featured_programs()
+        return updated_review
 
     @staticmethod
     def delete_review(db: DbSession, review_id: int, user: User) -> bool:
@@ -100,7 +106,9 @@ class ReviewService:
             )
         
         # Delete the review
-        return ReviewRepository.delete(db, review_id)
+        deleted = ReviewRepository.delete(db, review_id)
+        ProgramService.invalidate_featured_programs()
+        return deleted
 
     @staticmethod
     def get_program_reviews(
@@ -120,12 +128,10 @@ class ReviewService:
                 detail=f"Program with ID {program_id} not found",
             )
         
-        reviews = ReviewRepository.get_by_program_id(
+        reviews, total = ReviewRepository.get_page_by_program_id(
             db, program_id, skip=skip, limit=limit, sort_by=sort_by, sort_desc=sort_desc
         )
         
-        total = ReviewRepository.count_by_program_id(db, program_id)
-        
         return {
             "items": reviews,
             "total": total,
@@ -151,7 +157,7 @@ class ReviewService:
     def get_trainer_rating(db: DbSession, trainer_id: int) -> Tuple[Optional[float], int, int]:
         """Get average rating, count of reviews, and count of programs for a trainer."""
         # Check if trainer exists
-        user = db.query(User).filter(User.id == trainer_id).first()
+        user = UserRepository.get_by_id(db, trainer_id)
         if not user or user.role != "TRAINER":
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -165,9 +171,7 @@ class ReviewService:
         db: DbSession, user_id: int, skip: int = 0, limit: int = 10
     ) -> Dict[str, Any]:
         """Get all reviews by a user with pagination."""
-        reviews = ReviewRepository.get_by_user_id(db, user_id, skip, limit)
-        
-        total = ReviewRepository.count_by_user_id(db, user_id)
+        reviews, total = ReviewRepository.get_page_by_user_id(db, user_id, skip, limit)
         
         return {
             "items": reviews,
@@ -135,12 +135,10 @@ class SessionService:
                 detail=f"Program with ID {program_id} not found",
             )
         
-        sessions = SessionRepository.get_by_program_id(
+        sessions, total = SessionRepository.get_page_by_program_id(
             db, program_id, skip=skip, limit=limit, filters=filters, sort_by=sort_by, sort_desc=sort_desc
         )
         
-        total = SessionRepository.count_by_program_id(db, program_id, filters=filters)
-        
         return {
             "items": sessions,
             "total": total,
@@ -0,0 +1,81 @@
+# File path: tests/base.py
+import unittest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models.base import Base
+# Import every model so relationships resolve and create_all builds the whole schema
+from app.models import (  # noqa: F401
+    achievement, booking, chatbot, comment, discussion, forum, forum_membership,
+    goal, like, meal_log, notification, program, progress, review, session, user,
+)
+from app.models.enums import DifficultyLevel
+from app.models.goal import Goal, GoalStatus, GoalType
+from app.models.program import Program
+from app.models.session import Session
+from app.models.user import User
+
+class RepositoryTestCase(unittest.TestCase):
+    """Runs each test against a fresh in-memory SQLite database."""
+
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)()
+
+    def tearDown(self):
+        self.db.close()
+        self.engine.dispose()
+
+    def make_user(self, username: str = "member") -> User:
+        user = User(username=username, email=f"{username}@example.com", password="x")
+        self.db.add(user)
+        self.db.commit()
+        return user
+
+    def make_program(self, trainer: User) -> Program:
+        program = Program(
+            name="Strength basics",
+            category="strength",
+            difficulty=DifficultyLevel.BEGINNER,
+            duration=4,
+            created_by=trainer.id,
+        )
+        self.db.add(program)
+        self.db.commit()
+        return program
+
+    def make_session(self, program: Program, slots: int) -> Session:
+        start = datetime.now() + timedelta(days=1)
+        session = Session(
+            program_id=program.id,
+            trainer_id=program.created_by,
+            title="Morning class",
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            total_slots=slots,
+            available_slots=slots,
+        )
+        self.db.add(session)
+        self.db.commit()
+        return session
+
+    def make_goal(self, user: User) -> Goal:
+        goal = Goal(
+            user_id=user.id,
+            title="Run more",
+            goal_type=GoalType.CARDIO,
+            target_value=10,
+            start_date=datetime.now(),
+            deadline=datetime.now() + timedelta(days=30),
+            status=GoalStatus.IN_PROGRESS,
+        )
+        self.db.add(goal)
+        self.db.commit()
+        return goal
@@ -0,0 +1,80 @@
+# File path: tests/test_booking_repository.py
+import unittest
+from unittest import mock
+from fastapi import HTTPException
+
+from app.models.booking import Booking, BookingStatus
+from app.repositories import booking_repository
+from app.repositories.booking_repository import BookingRepository
+from app.repositories.session_repository import SessionRepository
+from app.services.booking_service import BookingService
+from tests.base import RepositoryTestCase
+
+class BookingRepositoryTest(RepositoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.trainer = self.make_user("trainer")
+        self.member = self.make_user("member")
+        self.session = self.make_session(self.make_program(self.trainer), slots=2)
+
+    def book(self):
+        return BookingRepository.create_unless_booked(
+            self.db,
+            user_id=self.member.id,
+            session_id=self.session.id,
+            status=BookingStatus.CONFIRMED,
+            attended=False,
+        )
+
+    def available_slots(self) -> int:
+        self.db.expire_all()
+        return SessionRepository.get_by_id(self.db, self.session.id).available_slots
+
+    def test_second_live_booking_is_refused(self):
+        self.assertIsNotNone(self.book())
+        self.assertIsNone(self.book())
+        self.db.rollback()
+        self.assertEqual(self.db.query(Booking).count(), 1)
+
+    def test_second_live_booking_is_refused_without_on_conflict(self):
+        # Backends outside _UPSERT_INSERTS fall back to the unique index raising IntegrityError
+        with mock.patch.dict(booking_repository._UPSERT_INSERTS, clear=True):
+            self.assertIsNotNone(self.book())
+            self.assertIsNone(self.book())
+        self.db.rollback()
+        self.assertEqual(self.db.query(Booking).count(), 1)
+
+    def test_rebooking_after_cancel_is_allowed(self):
+        booking = self.book()
+        BookingRepository.cancel(self.db, booking.id)
+        self.db.commit()
+        self.assertIsNotNone(self.book())
+
+    def test_reserve_slot_refuses_a_full_session(self):
+        self.assertTrue(SessionRepository.reserve_slot(self.db, self.session.id))
+        self.assertTrue(SessionRepository.reserve_slot(self.db, self.session.id))
+        self.assertFalse(SessionRepository.reserve_slot(self.db, self.session.id))
+        self.db.commit()
+        self.assertEqual(self.available_slots(), 0)
+
+    def test_cancel_releases_the_slot_once(self):
+        SessionRepository.reserve_slot(self.db, self.session.id)
+        booking = self.book()
+        self.assertEqual(self.available_slots(), 1)
+
+        cancelled = BookingService.cancel_booking(self.db, booking.id, self.member)
+        self.assertEqual(cancelled.status, BookingStatus.CANCELLED)
+        self.assertEqual(self.available_slots(), 2)
+
+        with self.assertRaises(HTTPException) as raised:
+            BookingService.cancel_booking(self.db, booking.id, self.member)
+        self.assertEqual(raised.exception.status_code, 400)
+        self.assertEqual(self.available_slots(), 2)
+
+    def test_cancel_of_cancelled_booking_matches_nothing(self):
+        booking = self.book()
+        self.assertIsNotNone(BookingRepository.cancel(self.db, booking.id))
+        self.assertIsNone(BookingRepository.cancel(self.db, booking.id))
+
+if __name__ == "__main__":
+    unittest.main()
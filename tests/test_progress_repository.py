@@ -0,0 +1,54 @@
+# File path: tests/test_progress_repository.py
+import unittest
+from datetime import datetime, timedelta
+
+from app.models.progress import Progress
+from app.repositories.progress_repository import ProgressRepository
+from tests.base import RepositoryTestCase
+
+class MaxDayStreakTest(RepositoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.goal = self.make_goal(self.make_user())
+        self.start = datetime(2026, 3, 1, 8, 0)
+
+    def record(self, *day_offsets, hour: int = 8):
+        for offset in day_offsets:
+            self.db.add(Progress(
+                goal_id=self.goal.id,
+                value=1,
+                date=self.start + timedelta(days=offset, hours=hour - 8),
+            ))
+        self.db.commit()
+
+    def streak(self) -> int:
+        return ProgressRepository.get_max_day_streak(self.db, self.goal.id)
+
+    def test_no_entries(self):
+        self.assertEqual(self.streak(), 0)
+
+    def test_single_entry(self):
+        self.record(0)
+        self.assertEqual(self.streak(), 1)
+
+    def test_consecutive_days(self):
+        self.record(*range(7))
+        self.assertEqual(self.streak(), 7)
+
+    def test_longest_run_wins_across_gaps(self):
+        self.record(0, 1, 2, 5, 6, 7, 8, 10)
+        self.assertEqual(self.streak(), 4)
+
+    def test_second_entry_on_a_day_ends_the_run(self):
+        self.record(*range(7))
+        self.record(3, hour=18)
+        self.assertEqual(self.streak(), 4)
+
+    def test_separate_runs_are_not_merged_after_a_repeated_day(self):
+        # Day minus row number would give entries on days 0 and 2 the same group here
+        self.record(0)
+        self.record(0, 2, hour=18)
+        self.assertEqual(self.streak(), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# File path: tests/test_review_repository.py
+import unittest
+from datetime import datetime
+
+from app.repositories.program_repository import ProgramRepository
+from app.repositories.review_repository import ReviewRepository
+from tests.base import RepositoryTestCase
+
+class ReviewRatingRollupTest(RepositoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.trainer = self.make_user("trainer")
+        self.program = self.make_program(self.trainer)
+
+    def rollup(self):
+        self.db.expire_all()
+        program = ProgramRepository.get_by_id(self.db, self.program.id)
+        return program.rating_sum, program.rating_count
+
+    def review(self, username: str, rating: float):
+        return ReviewRepository.create(
+            self.db, user_id=self.make_user(username).id, program_id=self.program.id, rating=rating
+        )
+
+    def test_create_adds_to_the_rollup(self):
+        self.review("first", 4.0)
+        self.review("second", 2.0)
+        self.assertEqual(self.rollup(), (6.0, 2))
+
+    def test_update_shifts_the_sum_by_the_rating_change(self):
+        review = self.review("first", 4.0)
+        self.review("second", 2.0)
+        ReviewRepository.update(self.db, review, rating=5.0)
+        self.assertEqual(self.rollup(), (7.0, 2))
+
+    def test_update_without_rating_change_leaves_the_rollup(self):
+        review = self.review("first", 4.0)
+        ReviewRepository.update(self.db, review, comment="Still good")
+        self.assertEqual(self.rollup(), (4.0, 1))
+
+    def test_delete_removes_from_the_rollup(self):
+        review = self.review("first", 4.0)
+        self.review("second", 2.0)
+        self.assertTrue(ReviewRepository.delete(self.db, review.id))
+        self.assertEqual(self.rollup(), (2.0, 1))
+        self.assertFalse(ReviewRepository.delete(self.db, review.id))
+        self.assertEqual(self.rollup(), (2.0, 1))
+
+    def test_rollup_leaves_program_updated_at_alone(self):
+        self.program.updated_at = datetime(2020, 1, 1)
+        self.db.commit()
+        review = self.review("first", 4.0)
+        ReviewRepository.update(self.db, review, rating=5.0)
+        self.db.expire_all()
+        self.assertEqual(ProgramRepository.get_by_id(self.db, self.program.id).updated_at, datetime(2020, 1, 1))
+
+if __name__ == "__main__":
+    unittest.main()